@@ -0,0 +1,342 @@
+"""
+Declarative response caching for GET endpoints.
+
+Endpoints opt in with ``@cache_response(ttl=..., tags=[...])`` on routers built
+with ``APIRouter(route_class=CachedRoute)``. Responses are cached in Redis keyed
+on the request path plus its normalized query string and registered under their
+tags. Tags may reference path parameters (``"worlds:{world_id}"``); ``"<table>:*"``
+marks a dependency on every row of a table. Endpoints accepting ``?include=``
+name their model with ``includes=`` so responses also depend on the tables
+they side-load.
+
+Repository writes invalidate ``"<table>:<id>"`` and ``"<table>:*"`` before the
+response of the writing request is returned.
+
+Cacheable responses carry a strong ETag and Last-Modified derived from the last
+write to the tables they depend on; matching ``If-None-Match`` or
+``If-Modified-Since`` requests are answered with 304 before any body is fetched.
+
+404s and empty results are cached as compact sentinels for CACHE_NEGATIVE_TTL
+under the route's tags, so creating the missing entity invalidates them.
+
+Requests are counted per URL so the cache warmer can pre-populate the hottest
+responses.
+
+For the CDN in front of the API, responses also carry ``Cache-Control`` built
+from the route's policy and a ``Surrogate-Key`` header naming the entity types
+and ids they contain; writes hand the matching keys to the CDN purge hook.
+"""
+import asyncio
+import json
+from contextlib import AsyncExitStack
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Callable, List, Mapping, Optional, Set, Tuple
+from urllib.parse import urlencode
+
+from fastapi import HTTPException, Request, Response
+from fastapi.routing import APIRoute
+import orjson
+import structlog
+
+from app.core.cdn import get_purge_hook
+from app.core.config import settings
+from app.core.database import get_db
+from app.repositories.base import add_write_listener
+from app.services.cache_codec import NegativeResult
+from app.services.cache_service import cache_service
+from app.services.cache_warmer import WARM_REQUEST_HEADER
+from app.services.include_service import include_types
+
+logger = structlog.get_logger(__name__)
+
+# Responses naming more entities than this only carry their type keys
+MAX_SURROGATE_KEYS = 256
+
+# Bodies larger than this are never inspected for emptiness
+MAX_EMPTY_BODY = 512
+
+# (table, id) pairs written by repositories during the current request
+_pending_invalidations: ContextVar[Optional[List[Tuple[str, str]]]] = ContextVar("pending_invalidations", default=None)
+
+
+@dataclass
+class CachePolicy:
+    """Caching policy attached to an endpoint."""
+    ttl: Optional[int] = None
+    tags: List[str] = field(default_factory=list)
+    stale_ttl: Optional[int] = None
+    max_age: Optional[int] = None
+    s_maxage: Optional[int] = None
+    stale_while_revalidate: Optional[int] = None
+    includes: Optional[type] = None
+
+    def resolve_tags(self, path_params: dict, query_params: Optional[Mapping[str, str]] = None) -> List[str]:
+        """Tags with path parameter placeholders filled in, plus the tables an include side-loads."""
+        tags = [tag.format(**path_params) for tag in self.tags]
+        include = (query_params or {}).get("include")
+        if self.includes is not None and include:
+            tags += [f"{entity_type}:*" for entity_type in include_types(self.includes, include)]
+        return tags
+
+    def cache_control(self) -> str:
+        """Cache-Control header for browsers and shared caches."""
+        max_age = self.max_age if self.max_age is not None else settings.HTTP_CACHE_MAX_AGE
+        # Shared caches are purged on writes, so they may keep responses as long as we do
+        s_maxage = self.s_maxage if self.s_maxage is not None else self.ttl or settings.CACHE_TTL
+        directives = ["public", f"max-age={max_age}", f"s-maxage={s_maxage}"]
+        stale = self.stale_while_revalidate if self.stale_while_revalidate is not None else self.stale_ttl
+        if stale:
+            directives.append(f"stale-while-revalidate={stale}")
+        return ", ".join(directives)
+
+
+def cache_response(
+    ttl: Optional[int] = None,
+    tags: Optional[List[str]] = None,
+    stale_ttl: Optional[int] = None,
+    max_age: Optional[int] = None,
+    s_maxage: Optional[int] = None,
+    stale_while_revalidate: Optional[int] = None,
+    includes: Optional[type] = None,
+) -> Callable:
+    """
+    Mark a GET endpoint as cacheable.
+
+    Args:
+        ttl: Time to live in seconds, defaults to CACHE_TTL
+        tags: Entity tags the response depends on, e.g. ``["worlds:{world_id}", "characters:*"]``
+        stale_ttl: Seconds past ``ttl`` during which the stale response is served
+            while it is re-rendered in the background
+        max_age: Cache-Control max-age, defaults to HTTP_CACHE_MAX_AGE
+        s_maxage: Cache-Control s-maxage for the CDN, defaults to ``ttl``
+        stale_while_revalidate: Cache-Control stale-while-revalidate, defaults to ``stale_ttl``
+        includes: Model whose relations the endpoint side-loads with ``?include=``
+    """
+    def decorator(endpoint: Callable) -> Callable:
+        endpoint.__cache_policy__ = CachePolicy(
+            ttl=ttl,
+            tags=list(tags or []),
+            stale_ttl=stale_ttl,
+            max_age=max_age,
+            s_maxage=s_maxage,
+            stale_while_revalidate=stale_while_revalidate,
+            includes=includes,
+        )
+        return endpoint
+    return decorator
+
+
+def normalize_query(request: Request) -> str:
+    """Query string with parameters sorted so equivalent requests share a key."""
+    return urlencode(sorted(request.query_params.multi_items()))
+
+
+def not_modified(request: Request, etag: str, last_modified: datetime, exists: bool = True) -> bool:
+    """
+    Whether the client's validators show it already has the current representation.
+
+    Before the resource is known to ``exist`` only the ETag is compared: it is
+    only ever sent with a 200 for this URL and table state, whereas
+    ``If-None-Match: *`` and ``If-Modified-Since`` would also match a URL
+    that answers 404.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        # Weak comparison, as RFC 7232 requires for If-None-Match
+        candidates = {value.strip().removeprefix("W/") for value in if_none_match.split(",")}
+        return (exists and "*" in candidates) or etag in candidates
+    if not exists:
+        return False
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is not None:
+        try:
+            return last_modified <= parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+def _family(path: str) -> str:
+    """Resource family of an API path, e.g. ``"characters"`` for ``/api/v1/characters/kaladin``."""
+    return path[len(settings.API_V1_STR):].strip("/").split("/", 1)[0]
+
+
+def _collect_ids(value: Any, ids: Set[str]) -> None:
+    if isinstance(value, dict):
+        if isinstance(value.get("id"), str):
+            ids.add(value["id"])
+        for item in value.values():
+            _collect_ids(item, ids)
+    elif isinstance(value, list):
+        for item in value:
+            _collect_ids(item, ids)
+
+
+def surrogate_keys(tags: List[str], body: bytes) -> List[str]:
+    """
+    Surrogate keys of a response: its entity types and every entity id it contains.
+
+    A write to entity ``id`` of ``table`` purges the keys ``table`` and ``id``,
+    matching how tags are invalidated.
+    """
+    type_keys = {tag.split(":", 1)[0] for tag in tags if tag.endswith(":*")}
+    ids = {tag.split(":", 1)[1] for tag in tags if not tag.endswith(":*")}
+    try:
+        _collect_ids(json.loads(body), ids)
+    except ValueError:
+        pass
+    if len(type_keys) + len(ids) > MAX_SURROGATE_KEYS:
+        # Over-purging is safe; the type keys alone still cover every entity
+        type_keys |= {tag.split(":", 1)[0] for tag in tags}
+        ids = set()
+    return sorted(type_keys | ids)
+
+
+def is_empty_result(body: bytes) -> bool:
+    """Whether a response body is an empty list, page or search result."""
+    if body == b"[]":
+        return True
+    if len(body) > MAX_EMPTY_BODY:
+        return False
+    try:
+        value = json.loads(body)
+    except ValueError:
+        return False
+    return isinstance(value, dict) and (
+        value.get("total") == 0 or value.get("total_results") == 0 or value.get("suggestions") == []
+    )
+
+
+async def invalidate_writes(writes: List[Tuple[str, str]]) -> None:
+    """Invalidate the cache and purge the CDN for written entities."""
+    await cache_service.invalidate_writes(writes)
+    keys = sorted({key for write in writes for key in write})
+    try:
+        await get_purge_hook().purge(keys)
+    except Exception as e:
+        logger.error("CDN purge failed", surrogate_keys=keys, error=str(e))
+
+
+def _queue_invalidation(entity_type: str, entity_id: str) -> None:
+    """Repository write listener scheduling invalidation of the written entity."""
+    pending = _pending_invalidations.get()
+    if pending is not None:
+        pending.append((entity_type, entity_id))
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        logger.debug("No event loop for cache invalidation", entity_type=entity_type, entity_id=entity_id)
+        return
+    loop.create_task(invalidate_writes([(entity_type, entity_id)]))
+
+
+add_write_listener(_queue_invalidation)
+
+
+class CachedRoute(APIRoute):
+    """Route class serving cacheable GET endpoints from the response cache."""
+
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+        policy: Optional[CachePolicy] = getattr(self.endpoint, "__cache_policy__", None)
+
+        async def cached_route_handler(request: Request) -> Response:
+            pending: List[Tuple[str, str]] = []
+            token = _pending_invalidations.set(pending)
+            try:
+                if policy is None or request.method != "GET" or not settings.CACHE_ENABLED:
+                    response = await handler(request)
+                else:
+                    response = await self._serve_cached(request, handler, policy)
+            finally:
+                _pending_invalidations.reset(token)
+            if pending:
+                await invalidate_writes(pending)
+            return response
+
+        return cached_route_handler
+
+    async def _serve_cached(self, request: Request, handler: Callable, policy: CachePolicy) -> Response:
+        path, query = request.url.path, normalize_query(request)
+        tags = policy.resolve_tags(request.path_params, request.query_params)
+        if WARM_REQUEST_HEADER not in request.headers:
+            cache_service.record_request(_family(path), path, query)
+        # Table states are read through the app's get_db, honouring its overrides
+        get_session = request.app.dependency_overrides.get(get_db, get_db)
+        validators = await cache_service.response_validators(path, query, tags, get_session)
+        headers = {"Cache-Control": policy.cache_control()}
+        if validators is not None:
+            etag, last_modified = validators
+            headers.update({"ETag": etag, "Last-Modified": format_datetime(last_modified, usegmt=True)})
+            if not_modified(request, etag, last_modified, exists=False):
+                return Response(status_code=304, headers=headers)
+
+        response = await self._serve_body(request, handler, policy, path, query, tags, get_session)
+        if response.status_code == 200:
+            if validators is not None and not_modified(request, etag, last_modified):
+                # Only now is the resource known to exist for If-None-Match: *
+                return Response(status_code=304, headers=headers)
+            response.headers.update(headers)
+        return response
+
+    async def _serve_body(self, request: Request, handler: Callable, policy: CachePolicy,
+                          path: str, query: str, tags: List[str], get_session: Callable) -> Response:
+        rendered: Optional[Response] = None
+        missed = False
+
+        async def render() -> Optional[Any]:
+            nonlocal rendered, missed
+            missed = True
+            # Dependencies get their own exit stack so a background re-render
+            # still closes its session after this request has completed
+            try:
+                async with AsyncExitStack() as stack:
+                    scope = dict(request.scope)
+                    scope["fastapi_astack"] = stack
+                    response = await handler(Request(scope, request.receive))
+            except HTTPException as e:
+                if e.status_code != 404 or e.headers:
+                    raise
+                # Encoded as the live 404 is, so cached and live bodies match byte for byte
+                return NegativeResult(404, orjson.dumps({"detail": e.detail}))
+            rendered = response
+            body = getattr(response, "body", None)
+            if response.status_code != 200 or body is None:
+                return None
+            if is_empty_result(body):
+                return NegativeResult(200, body)
+            return {
+                "body": body.decode("utf-8"),
+                "status_code": response.status_code,
+                "media_type": response.media_type,
+                "surrogate_keys": surrogate_keys(tags, body),
+            }
+
+        cached = await cache_service.get_or_set_response(
+            path, query, render, ttl=policy.ttl, tags=tags, stale_ttl=policy.stale_ttl, family=self.name,
+            get_session=get_session
+        )
+        if cached is None:
+            # Uncacheable, either rendered here or by the request we waited on
+            return rendered if rendered is not None else await handler(request)
+        if isinstance(cached, NegativeResult):
+            content, status_code, media_type = cached.body, cached.status_code, "application/json"
+            keys = surrogate_keys(tags, b"")
+        else:
+            content, status_code, media_type = cached["body"], cached["status_code"], cached["media_type"]
+            keys = cached.get("surrogate_keys", [])
+        headers = {"Surrogate-Key": " ".join(keys)}
+        if rendered is not None:
+            rendered.headers.update(headers)
+            rendered.headers["X-Cache"] = "MISS"
+            return rendered
+        return Response(
+            content=content,
+            status_code=status_code,
+            media_type=media_type,
+            headers={**headers, "X-Cache": "MISS" if missed else "HIT"},
+        )
@@ -1,11 +1,16 @@
 """
 Dependency injection for API endpoints.
 """
-from typing import Generator
+import secrets
+from typing import Generator, List, Optional, Type
+from pydantic import BaseModel
 from sqlalchemy.orm import Session
-from fastapi import Depends
+from fastapi import Depends, Header, HTTPException, Query, Request
 
+from app.core.config import settings
 from app.core.database import get_db
+from app.models import Book, Character, MagicSystem, Series, Shard, World
+from app.models.base import BaseModel as Model
 from app.repositories import (
     WorldRepository, SeriesRepository, BookRepository, CharacterRepository,
     MagicSystemRepository, ShardRepository
@@ -14,7 +19,13 @@ from app.services import (
     WorldService, BookService, CharacterService, SeriesService,
     MagicSystemService, ShardService, SearchService
 )
+from app.repositories.base import select_columns, summarize
+from app.schemas import (
+    BookListItem, BookResponse, CharacterListItem, CharacterResponse, MagicSystemListItem, MagicSystemResponse,
+    SeriesListItem, SeriesResponse, ShardResponse, WorldListItem, WorldResponse
+)
 from app.services.cache_service import cache_service
+from app.services.include_service import IncludeResolver, parse_includes
 
 
 # Repository dependencies
@@ -99,3 +110,137 @@ def get_search_service(db: Session = Depends(get_db)) -> SearchService:
 def get_cache_service():
     """Get cache service."""
     return cache_service
+
+
+def require_admin(x_admin_key: Optional[str] = Header(None)) -> None:
+    """
+    Allow a request to the admin endpoints.
+    
+    Requires the ``X-Admin-Key`` header to match ADMIN_API_KEY. Without a
+    configured key the endpoints are only available in DEBUG.
+    """
+    if settings.ADMIN_API_KEY is None:
+        if not settings.DEBUG:
+            raise HTTPException(status_code=404, detail="Not Found")
+        return
+    if x_admin_key is None or not secrets.compare_digest(x_admin_key, settings.ADMIN_API_KEY):
+        raise HTTPException(status_code=401, detail="Invalid or missing X-Admin-Key header")
+
+
+class FieldSelector:
+    """
+    Sparse fieldset dependency for ``?fields=id,name``.
+    
+    Validates the requested fields against the response schema and restricts
+    the request's session to loading only their columns of ``model``. Returns
+    the selected fields, always including ``id``, or None when not given.
+    """
+    
+    def __init__(self, schema: Type[BaseModel], model: Type[Model]):
+        self.allowed = list(schema.model_fields)
+        self.model = model
+    
+    def __call__(
+        self,
+        fields: Optional[str] = Query(
+            None, description="Comma-separated fields to return, e.g. id,name; id is always included"
+        ),
+        db: Session = Depends(get_db)
+    ) -> Optional[List[str]]:
+        if not fields:
+            return None
+        selected = [field.strip() for field in fields.split(",") if field.strip()]
+        unknown = [field for field in selected if field not in self.allowed]
+        if unknown:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unknown fields: {', '.join(unknown)}. Must be among: {', '.join(self.allowed)}"
+            )
+        selected = list(dict.fromkeys(["id"] + selected))
+        select_columns(db, self.model, selected)
+        return selected
+
+
+# Sparse fieldset dependencies
+get_world_fields = FieldSelector(WorldResponse, World)
+get_series_fields = FieldSelector(SeriesResponse, Series)
+get_book_fields = FieldSelector(BookResponse, Book)
+get_character_fields = FieldSelector(CharacterResponse, Character)
+get_magic_system_fields = FieldSelector(MagicSystemResponse, MagicSystem)
+get_shard_fields = FieldSelector(ShardResponse, Shard)
+
+
+class DetailSelector:
+    """
+    List detail dependency for ``?detail=summary|full``.
+    
+    Summary lists (the default) leave the model's long text columns unloaded
+    and return ``summary_schema`` items; ``detail=full`` returns whole
+    ``full_schema`` items. A sparse fieldset picks its own columns, so it
+    always uses the full schema. Returns the item schema to serialize with.
+    """
+    
+    def __init__(self, model: Type[Model], summary_schema: Type[BaseModel], full_schema: Type[BaseModel]):
+        self.model = model
+        self.summary_schema = summary_schema
+        self.full_schema = full_schema
+    
+    def __call__(
+        self,
+        request: Request,
+        detail: str = Query(
+            "summary", pattern="^(summary|full)$", description="summary leaves out long text fields; full includes them"
+        ),
+        db: Session = Depends(get_db)
+    ) -> Type[BaseModel]:
+        if detail == "full" or "fields" in request.query_params:
+            return self.full_schema
+        summarize(db, self.model)
+        return self.summary_schema
+
+
+# List detail dependencies
+get_world_list_schema = DetailSelector(World, WorldListItem, WorldResponse)
+get_series_list_schema = DetailSelector(Series, SeriesListItem, SeriesResponse)
+get_book_list_schema = DetailSelector(Book, BookListItem, BookResponse)
+get_character_list_schema = DetailSelector(Character, CharacterListItem, CharacterResponse)
+get_magic_system_list_schema = DetailSelector(MagicSystem, MagicSystemListItem, MagicSystemResponse)
+
+
+class IncludeSelector:
+    """
+    Expandable relations dependency for ``?include=series,characters.magic_systems``.
+    
+    Validates the include paths against the relations of ``model`` and returns
+    a resolver side-loading them, or None when not given.
+    """
+    
+    def __init__(self, model: Type[Model]):
+        self.model = model
+    
+    def __call__(
+        self,
+        include: Optional[str] = Query(
+            None,
+            description="Comma-separated relations to side-load, e.g. series,characters.magic_systems; "
+                        "the response then holds the resource under data next to included and relationships. "
+                        f"To-many relations side-load at most {settings.INCLUDE_MAX_RELATED} entities per resource"
+        ),
+        db: Session = Depends(get_db)
+    ) -> Optional[IncludeResolver]:
+        if not include:
+            return None
+        try:
+            tree = parse_includes(self.model, include)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        return IncludeResolver(db, self.model, tree)
+
+
+# Expandable relation dependencies
+get_world_includes = IncludeSelector(World)
+get_series_includes = IncludeSelector(Series)
+get_book_includes = IncludeSelector(Book)
+get_character_includes = IncludeSelector(Character)
+get_magic_system_includes = IncludeSelector(MagicSystem)
+get_shard_includes = IncludeSelector(Shard)
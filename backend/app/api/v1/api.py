@@ -3,7 +3,9 @@ Main API router for v1 endpoints.
 """
 from fastapi import APIRouter
 
-from app.api.v1.endpoints import books, characters, worlds, series, magic_systems, shards, search, health
+from app.api.v1.endpoints import (
+    books, characters, worlds, series, magic_systems, shard, search, health, admin, export, batch
+)
 
 api_router = APIRouter()
 
@@ -13,6 +15,9 @@ api_router.include_router(characters.router, prefix="/characters", tags=["charac
 api_router.include_router(worlds.router, prefix="/worlds", tags=["worlds"])
 api_router.include_router(series.router, prefix="/series", tags=["series"])
 api_router.include_router(magic_systems.router, prefix="/magic-systems", tags=["magic-systems"])
-api_router.include_router(shards.router, prefix="/shards", tags=["shards"])
+api_router.include_router(shard.router, prefix="/shards", tags=["shards"])
 api_router.include_router(search.router, prefix="/search", tags=["search"])
 api_router.include_router(health.router, prefix="/health", tags=["health"])
+api_router.include_router(admin.router, prefix="/admin", tags=["admin"])
+api_router.include_router(export.router, prefix="/export", tags=["export"])
+api_router.include_router(batch.router, prefix="/batch", tags=["batch"])
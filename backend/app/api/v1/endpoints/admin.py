@@ -0,0 +1,32 @@
+"""
+Admin API endpoints.
+"""
+from fastapi import APIRouter, Depends
+
+from app.api.dependencies import require_admin
+from app.services.cache_service import cache_service
+
+router = APIRouter(dependencies=[Depends(require_admin)])
+
+
+@router.get(
+    "/cache",
+    response_model=dict,
+    summary="Cache metrics",
+    description="Get cache hit, miss, stale and error counts, latencies and payload sizes per key family, "
+                "ranked by the database time their hits saved."
+)
+async def get_cache_metrics():
+    """Get cache effectiveness metrics."""
+    return await cache_service.metrics_summary()
+
+
+@router.post(
+    "/cache/reset",
+    status_code=204,
+    summary="Reset cache metrics",
+    description="Clear the in-process cache metrics summary. Prometheus counters are not reset."
+)
+async def reset_cache_metrics():
+    """Reset cache metrics."""
+    cache_service.metrics.reset()
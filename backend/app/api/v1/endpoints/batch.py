@@ -0,0 +1,30 @@
+"""
+Batch request API endpoints.
+"""
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import ORJSONResponse
+
+from app.core.config import settings
+from app.schemas.base import ErrorResponse
+from app.schemas.batch import BatchRequest, BatchResponse
+from app.services.batch_service import run_batch
+
+router = APIRouter()
+
+
+@router.post(
+    "",
+    response_model=BatchResponse,
+    summary="Run several GET requests",
+    description=f"Run up to {settings.BATCH_MAX_REQUESTS} GET requests, given as paths relative to the API root, concurrently "
+                "in one round trip. Responses come back in request order, each with its own status, headers "
+                "and body; one failing request does not fail the batch. Exports cannot be batched.",
+    responses={400: {"model": ErrorResponse, "description": "Batch too large or a path cannot be batched"}}
+)
+async def batch(batch_request: BatchRequest, request: Request):
+    """Run a batch of GET requests."""
+    try:
+        responses = await run_batch(request.app, batch_request.requests)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return ORJSONResponse({"responses": responses})
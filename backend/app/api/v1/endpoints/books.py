@@ -1,29 +1,36 @@
 """
 Book API endpoints.
 """
-from typing import List, Optional
+from typing import List, Optional, Type, Union
 from datetime import date
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 
-from app.api.dependencies import get_book_service, get_db
+from app.api.dependencies import (
+    get_book_service, get_book_fields, get_book_includes, get_book_list_schema, get_db
+)
+from app.api.cache import CachedRoute, cache_response
+from app.models import Book
 from app.services import BookService
+from app.services.include_service import IncludeResolver
 from app.schemas.book import (
-    BookCreate, BookUpdate, BookResponse, BookSummary, BookWithCharacters, 
+    BookCreate, BookUpdate, BookResponse, BookListItem, BookSummary, BookWithCharacters, 
     BookOverview, ReadingOrder
 )
-from app.schemas.base import PaginatedResponse, ErrorResponse
+from app.schemas.base import BaseSchema, PaginatedResponse, ErrorResponse
+from app.schemas.serializers import compound_response, sparse_response, trusted_response
 from app.core.config import settings
 
-router = APIRouter()
+router = APIRouter(route_class=CachedRoute)
 
 
 @router.get(
     "/",
-    response_model=PaginatedResponse[BookResponse],
+    response_model=Union[PaginatedResponse[BookListItem], PaginatedResponse[BookResponse]],
     summary="Get all books",
     description="Retrieve a paginated list of all books with optional filtering."
 )
+@cache_response(tags=["books:*"], includes=Book)
 async def get_books(
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(settings.DEFAULT_PAGE_SIZE, ge=1, le=settings.MAX_PAGE_SIZE, description="Number of records to return"),
@@ -31,6 +38,9 @@ async def get_books(
     series_id: Optional[str] = Query(None, description="Filter by series ID"),
     world_id: Optional[str] = Query(None, description="Filter by world ID"),
     is_standalone: Optional[bool] = Query(None, description="Filter by standalone status"),
+    fields: Optional[List[str]] = Depends(get_book_fields),
+    item_schema: Type[BaseSchema] = Depends(get_book_list_schema),
+    include: Optional[IncludeResolver] = Depends(get_book_includes),
     service: BookService = Depends(get_book_service)
 ):
     """Get all books with pagination and filtering."""
@@ -44,23 +54,31 @@ async def get_books(
     if is_standalone is not None:
         filters["is_standalone"] = is_standalone
     
-    books = service.get_multi(skip=skip, limit=limit, filters=filters, order_by="title")
+    books = await service.get_multi_cached(skip=skip, limit=limit, filters=filters, order_by="title")
     total = service.count(filters)
     
-    return service.get_paginated_response(books, total, skip, limit)
+    page = service.get_paginated_response(books, total, skip, limit)
+    if include:
+        return compound_response(PaginatedResponse[item_schema], page, include, fields)
+    return trusted_response(PaginatedResponse[item_schema], page, fields)
 
 
 @router.get(
     "/overview",
     response_model=BookOverview,
     summary="Get books overview",
-    description="Get an overview of all books with statistics."
+    description="Get statistics over all books, refreshed every few minutes rather than on each write. "
+                "Set limit to also embed a page of books."
 )
 async def get_books_overview(
+    skip: int = Query(0, ge=0, description="Number of books to skip in the embedded page"),
+    limit: int = Query(
+        0, ge=0, le=settings.MAX_PAGE_SIZE, description="Number of books to embed, 0 for statistics only"
+    ),
     service: BookService = Depends(get_book_service)
 ):
-    """Get books overview with statistics."""
-    return service.get_books_overview()
+    """Get books overview statistics, optionally with a page of books."""
+    return await service.get_overview_cached(service.get_books_overview, skip=skip, limit=limit)
 
 
 @router.get(
@@ -69,11 +87,13 @@ async def get_books_overview(
     summary="Get standalone books",
     description="Get all standalone books."
 )
+@cache_response(tags=["books:*"])
 async def get_standalone_books(
+    fields: Optional[List[str]] = Depends(get_book_fields),
     service: BookService = Depends(get_book_service)
 ):
     """Get standalone books."""
-    return service.get_standalone_books()
+    return sparse_response(List[BookResponse], service.get_standalone_books(), fields)
 
 
 @router.get(
@@ -82,12 +102,14 @@ async def get_standalone_books(
     summary="Get books by series",
     description="Get all books in a specific series."
 )
+@cache_response(tags=["books:*"])
 async def get_books_by_series(
     series_id: str,
+    fields: Optional[List[str]] = Depends(get_book_fields),
     service: BookService = Depends(get_book_service)
 ):
     """Get books by series."""
-    return service.get_books_by_series(series_id)
+    return sparse_response(List[BookResponse], await service.get_books_by_series_cached(series_id), fields)
 
 
 @router.get(
@@ -96,12 +118,14 @@ async def get_books_by_series(
     summary="Get books by world",
     description="Get all books set in a specific world."
 )
+@cache_response(tags=["books:*"])
 async def get_books_by_world(
     world_id: str,
+    fields: Optional[List[str]] = Depends(get_book_fields),
     service: BookService = Depends(get_book_service)
 ):
     """Get books by world."""
-    return service.get_books_by_world(world_id)
+    return sparse_response(List[BookResponse], service.get_books_by_world(world_id), fields)
 
 
 @router.get(
@@ -110,6 +134,7 @@ async def get_books_by_world(
     summary="Get reading order",
     description="Get the recommended reading order for a series."
 )
+@cache_response(tags=["books:*", "series:{series_id}"])
 async def get_reading_order(
     series_id: str,
     service: BookService = Depends(get_book_service)
@@ -124,12 +149,14 @@ async def get_reading_order(
     summary="Search books",
     description="Search books by title and summary."
 )
+@cache_response(ttl=300, tags=["books:*"])
 async def search_books(
     q: str = Query(..., min_length=1, description="Search term"),
+    fields: Optional[List[str]] = Depends(get_book_fields),
     service: BookService = Depends(get_book_service)
 ):
     """Search books by title and summary."""
-    return service.search_books(q)
+    return sparse_response(List[BookResponse], service.search_books(q), fields)
 
 
 @router.get(
@@ -141,15 +168,20 @@ async def search_books(
         404: {"model": ErrorResponse, "description": "Book not found"}
     }
 )
+@cache_response(tags=["books:{book_id}"], includes=Book)
 async def get_book(
     book_id: str,
+    fields: Optional[List[str]] = Depends(get_book_fields),
+    include: Optional[IncludeResolver] = Depends(get_book_includes),
     service: BookService = Depends(get_book_service)
 ):
     """Get a book by ID."""
     book = service.get(book_id)
     if not book:
         raise HTTPException(status_code=404, detail="Book not found")
-    return book
+    if include:
+        return compound_response(BookResponse, book, include, fields)
+    return sparse_response(BookResponse, book, fields)
 
 
 @router.get(
@@ -161,6 +193,7 @@ async def get_book(
         404: {"model": ErrorResponse, "description": "Book not found"}
     }
 )
+@cache_response(tags=["books:{book_id}", "characters:*"])
 async def get_book_with_characters(
     book_id: str,
     service: BookService = Depends(get_book_service)
@@ -181,6 +214,7 @@ async def get_book_with_characters(
         404: {"model": ErrorResponse, "description": "Book not found"}
     }
 )
+@cache_response(tags=["books:{book_id}", "characters:*", "series:*"])
 async def get_book_summary(
     book_id: str,
     service: BookService = Depends(get_book_service)
@@ -204,15 +238,17 @@ async def get_book_summary(
         404: {"model": ErrorResponse, "description": "Book not found"}
     }
 )
+@cache_response(tags=["books:*"])
 async def get_book_by_title(
     title: str,
+    fields: Optional[List[str]] = Depends(get_book_fields),
     service: BookService = Depends(get_book_service)
 ):
     """Get a book by title."""
     book = service.get_book_by_title(title)
     if not book:
         raise HTTPException(status_code=404, detail="Book not found")
-    return book
+    return sparse_response(BookResponse, book, fields)
 
 
 @router.post(
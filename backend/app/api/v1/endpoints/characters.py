@@ -1,28 +1,35 @@
 """
 Character API endpoints.
 """
-from typing import List, Optional
+from typing import List, Optional, Type, Union
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 
-from app.api.dependencies import get_character_service, get_db
+from app.api.dependencies import (
+    get_character_service, get_character_fields, get_character_includes, get_character_list_schema, get_db
+)
+from app.api.cache import CachedRoute, cache_response
+from app.models import Character
 from app.services import CharacterService
+from app.services.include_service import IncludeResolver
 from app.schemas.character import (
-    CharacterCreate, CharacterUpdate, CharacterResponse, CharacterSummary, 
+    CharacterCreate, CharacterUpdate, CharacterResponse, CharacterListItem, CharacterSummary, 
     CharacterNetwork, CharacterOverview
 )
-from app.schemas.base import PaginatedResponse, ErrorResponse
+from app.schemas.base import BaseSchema, PaginatedResponse, ErrorResponse
+from app.schemas.serializers import compound_response, sparse_response, trusted_response
 from app.core.config import settings
 
-router = APIRouter()
+router = APIRouter(route_class=CachedRoute)
 
 
 @router.get(
     "/",
-    response_model=PaginatedResponse[CharacterResponse],
+    response_model=Union[PaginatedResponse[CharacterListItem], PaginatedResponse[CharacterResponse]],
     summary="Get all characters",
     description="Retrieve a paginated list of all characters with optional filtering."
 )
+@cache_response(tags=["characters:*"], includes=Character)
 async def get_characters(
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(settings.DEFAULT_PAGE_SIZE, ge=1, le=settings.MAX_PAGE_SIZE, description="Number of records to return"),
@@ -30,6 +37,9 @@ async def get_characters(
     species: Optional[str] = Query(None, description="Filter by species"),
     status: Optional[str] = Query(None, description="Filter by character status"),
     world_id: Optional[str] = Query(None, description="Filter by world of origin"),
+    fields: Optional[List[str]] = Depends(get_character_fields),
+    item_schema: Type[BaseSchema] = Depends(get_character_list_schema),
+    include: Optional[IncludeResolver] = Depends(get_character_includes),
     service: CharacterService = Depends(get_character_service)
 ):
     """Get all characters with pagination and filtering."""
@@ -43,23 +53,31 @@ async def get_characters(
     if world_id:
         filters["world_of_origin_id"] = world_id
     
-    characters = service.get_multi(skip=skip, limit=limit, filters=filters, order_by="name")
+    characters = await service.get_multi_cached(skip=skip, limit=limit, filters=filters, order_by="name")
     total = service.count(filters)
     
-    return service.get_paginated_response(characters, total, skip, limit)
+    page = service.get_paginated_response(characters, total, skip, limit)
+    if include:
+        return compound_response(PaginatedResponse[item_schema], page, include, fields)
+    return trusted_response(PaginatedResponse[item_schema], page, fields)
 
 
 @router.get(
     "/overview",
     response_model=CharacterOverview,
     summary="Get characters overview",
-    description="Get an overview of all characters with statistics."
+    description="Get statistics over all characters, refreshed every few minutes rather than on each write. "
+                "Set limit to also embed a page of characters."
 )
 async def get_characters_overview(
+    skip: int = Query(0, ge=0, description="Number of characters to skip in the embedded page"),
+    limit: int = Query(
+        0, ge=0, le=settings.MAX_PAGE_SIZE, description="Number of characters to embed, 0 for statistics only"
+    ),
     service: CharacterService = Depends(get_character_service)
 ):
-    """Get characters overview with statistics."""
-    return service.get_character_overview()
+    """Get characters overview statistics, optionally with a page of characters."""
+    return await service.get_overview_cached(service.get_character_overview, skip=skip, limit=limit)
 
 
 @router.get(
@@ -68,12 +86,14 @@ async def get_characters_overview(
     summary="Get characters by world",
     description="Get all characters from a specific world."
 )
+@cache_response(tags=["characters:*"])
 async def get_characters_by_world(
     world_id: str,
+    fields: Optional[List[str]] = Depends(get_character_fields),
     service: CharacterService = Depends(get_character_service)
 ):
     """Get characters by world of origin."""
-    return service.get_characters_by_world(world_id)
+    return sparse_response(List[CharacterResponse], service.get_characters_by_world(world_id), fields)
 
 
 @router.get(
@@ -82,12 +102,14 @@ async def get_characters_by_world(
     summary="Get characters by species",
     description="Get all characters of a specific species."
 )
+@cache_response(tags=["characters:*"])
 async def get_characters_by_species(
     species: str,
+    fields: Optional[List[str]] = Depends(get_character_fields),
     service: CharacterService = Depends(get_character_service)
 ):
     """Get characters by species."""
-    return service.get_characters_by_species(species)
+    return sparse_response(List[CharacterResponse], service.get_characters_by_species(species), fields)
 
 
 @router.get(
@@ -96,12 +118,14 @@ async def get_characters_by_species(
     summary="Get characters by status",
     description="Get all characters with a specific status."
 )
+@cache_response(tags=["characters:*"])
 async def get_characters_by_status(
     status: str,
+    fields: Optional[List[str]] = Depends(get_character_fields),
     service: CharacterService = Depends(get_character_service)
 ):
     """Get characters by status."""
-    return service.get_characters_by_status(status)
+    return sparse_response(List[CharacterResponse], service.get_characters_by_status(status), fields)
 
 
 @router.get(
@@ -110,12 +134,14 @@ async def get_characters_by_status(
     summary="Get characters by magic system",
     description="Get all characters who use a specific magic system."
 )
+@cache_response(tags=["characters:*"])
 async def get_characters_by_magic_system(
     magic_system_id: str,
+    fields: Optional[List[str]] = Depends(get_character_fields),
     service: CharacterService = Depends(get_character_service)
 ):
     """Get characters by magic system."""
-    return service.get_characters_by_magic_system(magic_system_id)
+    return sparse_response(List[CharacterResponse], service.get_characters_by_magic_system(magic_system_id), fields)
 
 
 @router.get(
@@ -124,12 +150,14 @@ async def get_characters_by_magic_system(
     summary="Get characters in book",
     description="Get all characters that appear in a specific book."
 )
+@cache_response(tags=["characters:*"])
 async def get_characters_in_book(
     book_id: str,
+    fields: Optional[List[str]] = Depends(get_character_fields),
     service: CharacterService = Depends(get_character_service)
 ):
     """Get characters in a book."""
-    return service.get_characters_in_book(book_id)
+    return sparse_response(List[CharacterResponse], service.get_characters_in_book(book_id), fields)
 
 
 @router.get(
@@ -138,11 +166,13 @@ async def get_characters_in_book(
     summary="Get POV characters",
     description="Get all characters who have POV chapters."
 )
+@cache_response(tags=["characters:*"])
 async def get_pov_characters(
+    fields: Optional[List[str]] = Depends(get_character_fields),
     service: CharacterService = Depends(get_character_service)
 ):
     """Get POV characters."""
-    return service.get_pov_characters()
+    return sparse_response(List[CharacterResponse], service.get_pov_characters(), fields)
 
 
 @router.get(
@@ -151,12 +181,14 @@ async def get_pov_characters(
     summary="Search characters",
     description="Search characters by name, aliases, and biography."
 )
+@cache_response(ttl=300, tags=["characters:*"])
 async def search_characters(
     q: str = Query(..., min_length=1, description="Search term"),
+    fields: Optional[List[str]] = Depends(get_character_fields),
     service: CharacterService = Depends(get_character_service)
 ):
     """Search characters by name, aliases, and biography."""
-    return service.search_characters(q)
+    return sparse_response(List[CharacterResponse], service.search_characters(q), fields)
 
 
 @router.get(
@@ -168,15 +200,20 @@ async def search_characters(
         404: {"model": ErrorResponse, "description": "Character not found"}
     }
 )
+@cache_response(tags=["characters:{character_id}"], includes=Character)
 async def get_character(
     character_id: str,
+    fields: Optional[List[str]] = Depends(get_character_fields),
+    include: Optional[IncludeResolver] = Depends(get_character_includes),
     service: CharacterService = Depends(get_character_service)
 ):
     """Get a character by ID."""
     character = service.get(character_id)
     if not character:
         raise HTTPException(status_code=404, detail="Character not found")
-    return character
+    if include:
+        return compound_response(CharacterResponse, character, include, fields)
+    return sparse_response(CharacterResponse, character, fields)
 
 
 @router.get(
@@ -188,6 +225,7 @@ async def get_character(
         404: {"model": ErrorResponse, "description": "Character not found"}
     }
 )
+@cache_response(tags=["characters:*"])
 async def get_character_with_relationships(
     character_id: str,
     service: CharacterService = Depends(get_character_service)
@@ -208,6 +246,7 @@ async def get_character_with_relationships(
         404: {"model": ErrorResponse, "description": "Character not found"}
     }
 )
+@cache_response(tags=["characters:*"])
 async def get_character_network(
     character_id: str,
     service: CharacterService = Depends(get_character_service)
@@ -228,15 +267,17 @@ async def get_character_network(
         404: {"model": ErrorResponse, "description": "Character not found"}
     }
 )
+@cache_response(tags=["characters:*"])
 async def get_character_by_name(
     name: str,
+    fields: Optional[List[str]] = Depends(get_character_fields),
     service: CharacterService = Depends(get_character_service)
 ):
     """Get a character by name."""
     character = service.get_character_by_name(name)
     if not character:
         raise HTTPException(status_code=404, detail="Character not found")
-    return character
+    return sparse_response(CharacterResponse, character, fields)
 
 
 @router.get(
@@ -245,12 +286,30 @@ async def get_character_by_name(
     summary="Get characters by alias",
     description="Get characters by one of their aliases."
 )
+@cache_response(tags=["characters:*"])
 async def get_characters_by_alias(
     alias: str,
+    fields: Optional[List[str]] = Depends(get_character_fields),
     service: CharacterService = Depends(get_character_service)
 ):
     """Get characters by alias."""
-    return service.get_characters_by_alias(alias)
+    return sparse_response(List[CharacterResponse], service.get_characters_by_alias(alias), fields)
+
+
+@router.get(
+    "/affiliation/{affiliation}",
+    response_model=List[CharacterResponse],
+    summary="Get characters by affiliation",
+    description="Get characters by one of their affiliations."
+)
+@cache_response(tags=["characters:*"])
+async def get_characters_by_affiliation(
+    affiliation: str,
+    fields: Optional[List[str]] = Depends(get_character_fields),
+    service: CharacterService = Depends(get_character_service)
+):
+    """Get characters by affiliation."""
+    return sparse_response(List[CharacterResponse], service.get_characters_by_affiliation(affiliation), fields)
 
 
 @router.post(
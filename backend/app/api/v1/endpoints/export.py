@@ -0,0 +1,147 @@
+"""
+Bulk export API endpoints.
+"""
+from typing import Iterator, Optional, Tuple
+import os
+
+from fastapi import APIRouter, HTTPException, Request, Response
+from fastapi.responses import FileResponse, StreamingResponse
+
+from app.services.export_service import EXPORT_FORMATS, EXPORT_MODELS, export_file, ndjson_lines
+
+router = APIRouter()
+
+# Bytes read from disk per chunk of a ranged response
+RANGE_CHUNK_SIZE = 64 * 1024
+
+
+def _check_entity_type(entity_type: str) -> None:
+    if entity_type not in EXPORT_MODELS:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Unknown entity type '{entity_type}'. Must be one of: {', '.join(EXPORT_MODELS)}"
+        )
+
+
+def parse_byte_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parse a single ``bytes=`` Range header into inclusive offsets.
+
+    Returns None when the header should be ignored (malformed or multiple
+    ranges, which are answered with the whole file).
+
+    Raises:
+        ValueError: If the range cannot be satisfied for a file of ``size`` bytes
+    """
+    unit, _, spec = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in spec:
+        return None
+    start_text, _, end_text = (part.strip() for part in spec.partition("-"))
+    if not start_text:
+        # Suffix range: the last N bytes
+        if not end_text.isdigit():
+            return None
+        length = int(end_text)
+        if length == 0 or size == 0:
+            raise ValueError(f"Range {header} not satisfiable for {size} bytes")
+        return max(size - length, 0), size - 1
+    if not start_text.isdigit() or (end_text and not end_text.isdigit()):
+        return None
+    start = int(start_text)
+    end = int(end_text) if end_text else size - 1
+    if start >= size:
+        raise ValueError(f"Range {header} not satisfiable for {size} bytes")
+    if end < start:
+        return None
+    return start, min(end, size - 1)
+
+
+def _read_range(path: str, start: int, end: int) -> Iterator[bytes]:
+    with open(path, "rb") as handle:
+        handle.seek(start)
+        remaining = end - start + 1
+        while remaining > 0:
+            chunk = handle.read(min(RANGE_CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+def _file_response(request: Request, path: str, media_type: str, etag: str, filename: str) -> Response:
+    """Serve an export file, honouring If-None-Match, Range and If-Range."""
+    size = os.path.getsize(path)
+    headers = {
+        "Accept-Ranges": "bytes",
+        "ETag": etag,
+        "Content-Disposition": f'attachment; filename="{filename}"',
+    }
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    # A stale If-Range validator means the client's partial copy is outdated
+    if range_header and (if_range is None or if_range == etag):
+        try:
+            byte_range = parse_byte_range(range_header, size)
+        except ValueError:
+            return Response(status_code=416, headers={**headers, "Content-Range": f"bytes */{size}"})
+        if byte_range is not None:
+            start, end = byte_range
+            headers.update({"Content-Range": f"bytes {start}-{end}/{size}", "Content-Length": str(end - start + 1)})
+            return StreamingResponse(
+                _read_range(path, start, end), status_code=206, media_type=media_type, headers=headers
+            )
+    return FileResponse(path, media_type=media_type, headers=headers)
+
+
+@router.get(
+    "/{entity_type}.ndjson",
+    response_class=StreamingResponse,
+    summary="Export a table as NDJSON",
+    description="Stream every row of an entity or junction table as newline-delimited JSON in one chunked "
+                f"response. Tables: {', '.join(EXPORT_MODELS)}.",
+    responses={
+        200: {"content": {"application/x-ndjson": {}}, "description": "One JSON object per line"},
+        404: {"description": "Unknown entity type"}
+    }
+)
+async def export_ndjson(entity_type: str):
+    """Stream a table as NDJSON."""
+    _check_entity_type(entity_type)
+    return StreamingResponse(
+        ndjson_lines(entity_type),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": f'attachment; filename="{entity_type}.ndjson"'}
+    )
+
+
+@router.get(
+    "/{entity_type}.{export_format}",
+    response_class=FileResponse,
+    summary="Export a table as CSV, Parquet or Arrow",
+    description="Download an entity or junction table as csv, parquet or arrow (Arrow IPC file). Files are "
+                "built once per dataset version and cached on disk; Range requests resume partial downloads. "
+                f"Tables: {', '.join(EXPORT_MODELS)}.",
+    responses={
+        200: {"content": {media_type: {} for media_type in EXPORT_FORMATS.values()}, "description": "Export file"},
+        206: {"description": "Requested byte range of the export file"},
+        404: {"description": "Unknown entity type or format"},
+        416: {"description": "Requested range not satisfiable"},
+        503: {"description": "The format needs pyarrow, which is not installed"}
+    }
+)
+def export_table(entity_type: str, export_format: str, request: Request):
+    """Download a table export; built in the threadpool since it reads the whole table."""
+    _check_entity_type(entity_type)
+    if export_format not in EXPORT_FORMATS:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Unknown export format '{export_format}'. Must be one of: ndjson, {', '.join(EXPORT_FORMATS)}"
+        )
+    try:
+        path, version = export_file(entity_type, export_format)
+    except RuntimeError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    filename = f"{entity_type}.{export_format}"
+    return _file_response(request, path, EXPORT_FORMATS[export_format], f'"{entity_type}-{version}"', filename)
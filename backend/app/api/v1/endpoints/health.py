@@ -3,12 +3,14 @@ Health check API endpoints.
 """
 from datetime import datetime
 from fastapi import APIRouter, Depends
+from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 
 from app.api.dependencies import get_db
 from app.core.database import get_db
 from app.schemas.base import HealthResponse
 from app.core.config import settings
+from app.services.cache_warmer import cache_warmer
 
 router = APIRouter()
 
@@ -28,6 +30,31 @@ async def health_check():
     )
 
 
+@router.get(
+    "/ready",
+    response_model=HealthResponse,
+    summary="Readiness check",
+    description="Check whether the API is ready for traffic. With CACHE_WARM_READINESS_GATE set, "
+                "reports not ready until the cache has been warmed."
+)
+async def readiness_check():
+    """Readiness check endpoint."""
+    if settings.CACHE_WARM_READINESS_GATE and not cache_warmer.ready.is_set():
+        return JSONResponse(
+            status_code=503,
+            content=HealthResponse(
+                status="warming",
+                service="cosmere-api",
+                version=settings.APP_VERSION
+            ).model_dump(mode="json")
+        )
+    return HealthResponse(
+        status="ready",
+        service="cosmere-api",
+        version=settings.APP_VERSION
+    )
+
+
 @router.get(
     "/db",
     response_model=HealthResponse,
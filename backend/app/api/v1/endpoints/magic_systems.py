@@ -1,34 +1,44 @@
 """
 Magic System API endpoints.
 """
-from typing import List, Optional
+from typing import List, Optional, Type, Union
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 
-from app.api.dependencies import get_magic_system_service, get_db
+from app.api.dependencies import (
+    get_magic_system_service, get_magic_system_fields, get_magic_system_includes, get_magic_system_list_schema, get_db
+)
+from app.api.cache import CachedRoute, cache_response
+from app.models import MagicSystem
 from app.services import MagicSystemService
+from app.services.include_service import IncludeResolver
 from app.schemas.magic_system import (
-    MagicSystemCreate, MagicSystemUpdate, MagicSystemResponse, 
+    MagicSystemCreate, MagicSystemUpdate, MagicSystemResponse, MagicSystemListItem, 
     MagicSystemSummary, MagicSystemOverview
 )
-from app.schemas.base import PaginatedResponse, ErrorResponse
+from app.schemas.base import BaseSchema, PaginatedResponse, ErrorResponse
+from app.schemas.serializers import compound_response, sparse_response, trusted_response
 from app.core.config import settings
 
-router = APIRouter()
+router = APIRouter(route_class=CachedRoute)
 
 
 @router.get(
     "/",
-    response_model=PaginatedResponse[MagicSystemResponse],
+    response_model=Union[PaginatedResponse[MagicSystemListItem], PaginatedResponse[MagicSystemResponse]],
     summary="Get all magic systems",
     description="Retrieve a paginated list of all magic systems with optional filtering."
 )
+@cache_response(tags=["magic_systems:*"], stale_ttl=settings.CACHE_STALE_TTL, includes=MagicSystem)
 async def get_magic_systems(
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(settings.DEFAULT_PAGE_SIZE, ge=1, le=settings.MAX_PAGE_SIZE, description="Number of records to return"),
     name: Optional[str] = Query(None, description="Filter by magic system name"),
     world_id: Optional[str] = Query(None, description="Filter by world ID"),
     is_investiture_based: Optional[bool] = Query(None, description="Filter by investiture-based status"),
+    fields: Optional[List[str]] = Depends(get_magic_system_fields),
+    item_schema: Type[BaseSchema] = Depends(get_magic_system_list_schema),
+    include: Optional[IncludeResolver] = Depends(get_magic_system_includes),
     service: MagicSystemService = Depends(get_magic_system_service)
 ):
     """Get all magic systems with pagination and filtering."""
@@ -40,23 +50,31 @@ async def get_magic_systems(
     if is_investiture_based is not None:
         filters["is_investiture_based"] = is_investiture_based
     
-    magic_systems = service.get_multi(skip=skip, limit=limit, filters=filters, order_by="name")
+    magic_systems = await service.get_multi_cached(skip=skip, limit=limit, filters=filters, order_by="name")
     total = service.count(filters)
     
-    return service.get_paginated_response(magic_systems, total, skip, limit)
+    page = service.get_paginated_response(magic_systems, total, skip, limit)
+    if include:
+        return compound_response(PaginatedResponse[item_schema], page, include, fields)
+    return trusted_response(PaginatedResponse[item_schema], page, fields)
 
 
 @router.get(
     "/overview",
     response_model=MagicSystemOverview,
     summary="Get magic systems overview",
-    description="Get an overview of all magic systems with statistics."
+    description="Get statistics over all magic systems, refreshed every few minutes rather than on each write. "
+                "Set limit to also embed a page of magic systems."
 )
 async def get_magic_systems_overview(
+    skip: int = Query(0, ge=0, description="Number of magic systems to skip in the embedded page"),
+    limit: int = Query(
+        0, ge=0, le=settings.MAX_PAGE_SIZE, description="Number of magic systems to embed, 0 for statistics only"
+    ),
     service: MagicSystemService = Depends(get_magic_system_service)
 ):
-    """Get magic systems overview with statistics."""
-    return service.get_magic_systems_overview()
+    """Get magic systems overview statistics, optionally with a page of magic systems."""
+    return await service.get_overview_cached(service.get_magic_systems_overview, skip=skip, limit=limit)
 
 
 @router.get(
@@ -65,11 +83,13 @@ async def get_magic_systems_overview(
     summary="Get investiture-based magic systems",
     description="Get all investiture-based magic systems."
 )
+@cache_response(tags=["magic_systems:*"], stale_ttl=settings.CACHE_STALE_TTL)
 async def get_investiture_based_magic_systems(
+    fields: Optional[List[str]] = Depends(get_magic_system_fields),
     service: MagicSystemService = Depends(get_magic_system_service)
 ):
     """Get investiture-based magic systems."""
-    return service.get_investiture_based()
+    return sparse_response(List[MagicSystemResponse], service.get_investiture_based(), fields)
 
 
 @router.get(
@@ -78,12 +98,14 @@ async def get_investiture_based_magic_systems(
     summary="Get magic systems by world",
     description="Get all magic systems from a specific world."
 )
+@cache_response(tags=["magic_systems:*"], stale_ttl=settings.CACHE_STALE_TTL)
 async def get_magic_systems_by_world(
     world_id: str,
+    fields: Optional[List[str]] = Depends(get_magic_system_fields),
     service: MagicSystemService = Depends(get_magic_system_service)
 ):
     """Get magic systems by world."""
-    return service.get_magic_systems_by_world(world_id)
+    return sparse_response(List[MagicSystemResponse], service.get_magic_systems_by_world(world_id), fields)
 
 
 @router.get(
@@ -92,6 +114,7 @@ async def get_magic_systems_by_world(
     summary="Get magic systems by world with statistics",
     description="Get magic systems from a specific world with user statistics."
 )
+@cache_response(tags=["magic_systems:*", "characters:*"], stale_ttl=settings.CACHE_STALE_TTL)
 async def get_magic_systems_by_world_with_stats(
     world_id: str,
     service: MagicSystemService = Depends(get_magic_system_service)
@@ -106,12 +129,14 @@ async def get_magic_systems_by_world_with_stats(
     summary="Search magic systems",
     description="Search magic systems by name and description."
 )
+@cache_response(ttl=300, tags=["magic_systems:*"])
 async def search_magic_systems(
     q: str = Query(..., min_length=1, description="Search term"),
+    fields: Optional[List[str]] = Depends(get_magic_system_fields),
     service: MagicSystemService = Depends(get_magic_system_service)
 ):
     """Search magic systems by name and description."""
-    return service.search_magic_systems(q)
+    return sparse_response(List[MagicSystemResponse], service.search_magic_systems(q), fields)
 
 
 @router.get(
@@ -123,15 +148,20 @@ async def search_magic_systems(
         404: {"model": ErrorResponse, "description": "Magic system not found"}
     }
 )
+@cache_response(tags=["magic_systems:{magic_system_id}"], stale_ttl=settings.CACHE_STALE_TTL, includes=MagicSystem)
 async def get_magic_system(
     magic_system_id: str,
+    fields: Optional[List[str]] = Depends(get_magic_system_fields),
+    include: Optional[IncludeResolver] = Depends(get_magic_system_includes),
     service: MagicSystemService = Depends(get_magic_system_service)
 ):
     """Get a magic system by ID."""
     magic_system = service.get(magic_system_id)
     if not magic_system:
         raise HTTPException(status_code=404, detail="Magic system not found")
-    return magic_system
+    if include:
+        return compound_response(MagicSystemResponse, magic_system, include, fields)
+    return sparse_response(MagicSystemResponse, magic_system, fields)
 
 
 @router.get(
@@ -143,6 +173,7 @@ async def get_magic_system(
         404: {"model": ErrorResponse, "description": "Magic system not found"}
     }
 )
+@cache_response(tags=["magic_systems:{magic_system_id}", "characters:*"], stale_ttl=settings.CACHE_STALE_TTL)
 async def get_magic_system_with_users(
     magic_system_id: str,
     service: MagicSystemService = Depends(get_magic_system_service)
@@ -163,15 +194,17 @@ async def get_magic_system_with_users(
         404: {"model": ErrorResponse, "description": "Magic system not found"}
     }
 )
+@cache_response(tags=["magic_systems:*"], stale_ttl=settings.CACHE_STALE_TTL)
 async def get_magic_system_by_name(
     name: str,
+    fields: Optional[List[str]] = Depends(get_magic_system_fields),
     service: MagicSystemService = Depends(get_magic_system_service)
 ):
     """Get a magic system by name."""
     magic_system = service.get_magic_system_by_name(name)
     if not magic_system:
         raise HTTPException(status_code=404, detail="Magic system not found")
-    return magic_system
+    return sparse_response(MagicSystemResponse, magic_system, fields)
 
 
 @router.post(
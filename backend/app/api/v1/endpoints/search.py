@@ -6,13 +6,14 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 
 from app.api.dependencies import get_search_service, get_db
+from app.api.cache import CachedRoute, cache_response
 from app.services import SearchService
 from app.schemas.search import (
     SearchRequest, SearchResponse, SearchSuggestion, AdvancedSearchRequest, SearchFilters
 )
 from app.schemas.base import ErrorResponse
 
-router = APIRouter()
+router = APIRouter(route_class=CachedRoute)
 
 
 @router.get(
@@ -21,6 +22,7 @@ router = APIRouter()
     summary="Search all entities",
     description="Search across all entity types with a single query."
 )
+@cache_response(ttl=300, tags=["worlds:*", "series:*", "books:*", "characters:*", "magic_systems:*", "shards:*"])
 async def search_all(
     q: str = Query(..., min_length=1, description="Search term"),
     limit_per_type: int = Query(10, ge=1, le=50, description="Maximum results per entity type"),
@@ -36,6 +38,7 @@ async def search_all(
     summary="Get search suggestions",
     description="Get search suggestions based on partial input."
 )
+@cache_response(ttl=300, tags=["worlds:*", "series:*", "books:*", "characters:*", "magic_systems:*", "shards:*"])
 async def get_search_suggestions(
     q: str = Query(..., min_length=1, description="Partial search term"),
     limit: int = Query(10, ge=1, le=20, description="Maximum number of suggestions"),
@@ -52,6 +55,7 @@ async def get_search_suggestions(
     summary="Search by entity type",
     description="Search within a specific entity type."
 )
+@cache_response(ttl=300, tags=["worlds:*", "series:*", "books:*", "characters:*", "magic_systems:*", "shards:*"])
 async def search_by_type(
     entity_type: str,
     q: str = Query(..., min_length=1, description="Search term"),
@@ -91,6 +95,7 @@ async def advanced_search(
     summary="Search worlds",
     description="Search worlds with filters."
 )
+@cache_response(ttl=300, tags=["worlds:*"])
 async def search_worlds(
     q: str = Query(..., min_length=1, description="Search term"),
     is_habitable: Optional[bool] = Query(None, description="Filter by habitable status"),
@@ -119,6 +124,7 @@ async def search_worlds(
     summary="Search books",
     description="Search books with filters."
 )
+@cache_response(ttl=300, tags=["books:*"])
 async def search_books(
     q: str = Query(..., min_length=1, description="Search term"),
     is_standalone: Optional[bool] = Query(None, description="Filter by standalone status"),
@@ -150,6 +156,7 @@ async def search_books(
     summary="Search characters",
     description="Search characters with filters."
 )
+@cache_response(ttl=300, tags=["characters:*"])
 async def search_characters(
     q: str = Query(..., min_length=1, description="Search term"),
     species: Optional[str] = Query(None, description="Filter by species"),
@@ -181,6 +188,7 @@ async def search_characters(
     summary="Search series",
     description="Search series with filters."
 )
+@cache_response(ttl=300, tags=["series:*"])
 async def search_series(
     q: str = Query(..., min_length=1, description="Search term"),
     status: Optional[str] = Query(None, description="Filter by series status"),
@@ -209,6 +217,7 @@ async def search_series(
     summary="Search magic systems",
     description="Search magic systems with filters."
 )
+@cache_response(ttl=300, tags=["magic_systems:*"])
 async def search_magic_systems(
     q: str = Query(..., min_length=1, description="Search term"),
     is_investiture_based: Optional[bool] = Query(None, description="Filter by investiture-based status"),
@@ -237,6 +246,7 @@ async def search_magic_systems(
     summary="Search shards",
     description="Search shards with filters."
 )
+@cache_response(ttl=300, tags=["shards:*"])
 async def search_shards(
     q: str = Query(..., min_length=1, description="Search term"),
     status: Optional[str] = Query(None, description="Filter by shard status"),
@@ -1,33 +1,43 @@
 """
 Series API endpoints.
 """
-from typing import List, Optional
+from typing import List, Optional, Type, Union
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 
-from app.api.dependencies import get_series_service, get_db
+from app.api.dependencies import (
+    get_series_service, get_series_fields, get_series_includes, get_series_list_schema, get_db
+)
+from app.api.cache import CachedRoute, cache_response
+from app.models import Series
 from app.services import SeriesService
+from app.services.include_service import IncludeResolver
 from app.schemas.series import (
-    SeriesCreate, SeriesUpdate, SeriesResponse, SeriesSummary, SeriesOverview
+    SeriesCreate, SeriesUpdate, SeriesResponse, SeriesListItem, SeriesSummary, SeriesOverview
 )
-from app.schemas.base import PaginatedResponse, ErrorResponse
+from app.schemas.base import BaseSchema, PaginatedResponse, ErrorResponse
+from app.schemas.serializers import compound_response, sparse_response, trusted_response
 from app.core.config import settings
 
-router = APIRouter()
+router = APIRouter(route_class=CachedRoute)
 
 
 @router.get(
     "/",
-    response_model=PaginatedResponse[SeriesResponse],
+    response_model=Union[PaginatedResponse[SeriesListItem], PaginatedResponse[SeriesResponse]],
     summary="Get all series",
     description="Retrieve a paginated list of all series with optional filtering."
 )
+@cache_response(tags=["series:*"], stale_ttl=settings.CACHE_STALE_TTL, includes=Series)
 async def get_series(
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(settings.DEFAULT_PAGE_SIZE, ge=1, le=settings.MAX_PAGE_SIZE, description="Number of records to return"),
     name: Optional[str] = Query(None, description="Filter by series name"),
     status: Optional[str] = Query(None, description="Filter by series status"),
     world_id: Optional[str] = Query(None, description="Filter by world ID"),
+    fields: Optional[List[str]] = Depends(get_series_fields),
+    item_schema: Type[BaseSchema] = Depends(get_series_list_schema),
+    include: Optional[IncludeResolver] = Depends(get_series_includes),
     service: SeriesService = Depends(get_series_service)
 ):
     """Get all series with pagination and filtering."""
@@ -39,23 +49,31 @@ async def get_series(
     if world_id:
         filters["world_id"] = world_id
     
-    series_list = service.get_multi(skip=skip, limit=limit, filters=filters, order_by="name")
+    series_list = await service.get_multi_cached(skip=skip, limit=limit, filters=filters, order_by="name")
     total = service.count(filters)
     
-    return service.get_paginated_response(series_list, total, skip, limit)
+    page = service.get_paginated_response(series_list, total, skip, limit)
+    if include:
+        return compound_response(PaginatedResponse[item_schema], page, include, fields)
+    return trusted_response(PaginatedResponse[item_schema], page, fields)
 
 
 @router.get(
     "/overview",
     response_model=SeriesOverview,
     summary="Get series overview",
-    description="Get an overview of all series with statistics."
+    description="Get statistics over all series, refreshed every few minutes rather than on each write. "
+                "Set limit to also embed a page of series."
 )
 async def get_series_overview(
+    skip: int = Query(0, ge=0, description="Number of series to skip in the embedded page"),
+    limit: int = Query(
+        0, ge=0, le=settings.MAX_PAGE_SIZE, description="Number of series to embed, 0 for statistics only"
+    ),
     service: SeriesService = Depends(get_series_service)
 ):
-    """Get series overview with statistics."""
-    return service.get_series_overview()
+    """Get series overview statistics, optionally with a page of series."""
+    return await service.get_overview_cached(service.get_series_overview, skip=skip, limit=limit)
 
 
 @router.get(
@@ -64,11 +82,13 @@ async def get_series_overview(
     summary="Get ongoing series",
     description="Get all ongoing series."
 )
+@cache_response(tags=["series:*"], stale_ttl=settings.CACHE_STALE_TTL)
 async def get_ongoing_series(
+    fields: Optional[List[str]] = Depends(get_series_fields),
     service: SeriesService = Depends(get_series_service)
 ):
     """Get ongoing series."""
-    return service.get_ongoing_series()
+    return sparse_response(List[SeriesResponse], service.get_ongoing_series(), fields)
 
 
 @router.get(
@@ -77,11 +97,13 @@ async def get_ongoing_series(
     summary="Get completed series",
     description="Get all completed series."
 )
+@cache_response(tags=["series:*"], stale_ttl=settings.CACHE_STALE_TTL)
 async def get_completed_series(
+    fields: Optional[List[str]] = Depends(get_series_fields),
     service: SeriesService = Depends(get_series_service)
 ):
     """Get completed series."""
-    return service.get_completed_series()
+    return sparse_response(List[SeriesResponse], service.get_completed_series(), fields)
 
 
 @router.get(
@@ -90,12 +112,14 @@ async def get_completed_series(
     summary="Get series by world",
     description="Get all series set in a specific world."
 )
+@cache_response(tags=["series:*"], stale_ttl=settings.CACHE_STALE_TTL)
 async def get_series_by_world(
     world_id: str,
+    fields: Optional[List[str]] = Depends(get_series_fields),
     service: SeriesService = Depends(get_series_service)
 ):
     """Get series by world."""
-    return service.get_series_by_world(world_id)
+    return sparse_response(List[SeriesResponse], service.get_series_by_world(world_id), fields)
 
 
 @router.get(
@@ -104,12 +128,14 @@ async def get_series_by_world(
     summary="Get series by status",
     description="Get all series with a specific status."
 )
+@cache_response(tags=["series:*"], stale_ttl=settings.CACHE_STALE_TTL)
 async def get_series_by_status(
     status: str,
+    fields: Optional[List[str]] = Depends(get_series_fields),
     service: SeriesService = Depends(get_series_service)
 ):
     """Get series by status."""
-    return service.get_series_by_status(status)
+    return sparse_response(List[SeriesResponse], service.get_series_by_status(status), fields)
 
 
 @router.get(
@@ -118,12 +144,14 @@ async def get_series_by_status(
     summary="Search series",
     description="Search series by name and description."
 )
+@cache_response(ttl=300, tags=["series:*"])
 async def search_series(
     q: str = Query(..., min_length=1, description="Search term"),
+    fields: Optional[List[str]] = Depends(get_series_fields),
     service: SeriesService = Depends(get_series_service)
 ):
     """Search series by name and description."""
-    return service.search_series(q)
+    return sparse_response(List[SeriesResponse], service.search_series(q), fields)
 
 
 @router.get(
@@ -135,15 +163,20 @@ async def search_series(
         404: {"model": ErrorResponse, "description": "Series not found"}
     }
 )
+@cache_response(tags=["series:{series_id}"], stale_ttl=settings.CACHE_STALE_TTL, includes=Series)
 async def get_series_by_id(
     series_id: str,
+    fields: Optional[List[str]] = Depends(get_series_fields),
+    include: Optional[IncludeResolver] = Depends(get_series_includes),
     service: SeriesService = Depends(get_series_service)
 ):
     """Get a series by ID."""
     series = service.get(series_id)
     if not series:
         raise HTTPException(status_code=404, detail="Series not found")
-    return series
+    if include:
+        return compound_response(SeriesResponse, series, include, fields)
+    return sparse_response(SeriesResponse, series, fields)
 
 
 @router.get(
@@ -155,6 +188,7 @@ async def get_series_by_id(
         404: {"model": ErrorResponse, "description": "Series not found"}
     }
 )
+@cache_response(tags=["series:*", "books:*"], stale_ttl=settings.CACHE_STALE_TTL)
 async def get_series_summary(
     series_id: str,
     service: SeriesService = Depends(get_series_service)
@@ -175,15 +209,17 @@ async def get_series_summary(
         404: {"model": ErrorResponse, "description": "Series not found"}
     }
 )
+@cache_response(tags=["series:*"], stale_ttl=settings.CACHE_STALE_TTL)
 async def get_series_by_name(
     name: str,
+    fields: Optional[List[str]] = Depends(get_series_fields),
     service: SeriesService = Depends(get_series_service)
 ):
     """Get a series by name."""
     series = service.get_series_by_name(name)
     if not series:
         raise HTTPException(status_code=404, detail="Series not found")
-    return series
+    return sparse_response(SeriesResponse, series, fields)
 
 
 @router.post(
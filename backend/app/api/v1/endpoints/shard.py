@@ -5,16 +5,20 @@ from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 
-from app.api.dependencies import get_shard_service, get_db
+from app.api.dependencies import get_shard_service, get_shard_fields, get_shard_includes, get_db
+from app.api.cache import CachedRoute, cache_response
+from app.models import Shard
 from app.services import ShardService
+from app.services.include_service import IncludeResolver
 from app.schemas.shard import (
     ShardCreate, ShardUpdate, ShardResponse, ShardSummary, ShardOverview,
     ShardVesselCreate, ShardVesselResponse
 )
 from app.schemas.base import PaginatedResponse, ErrorResponse
+from app.schemas.serializers import compound_response, sparse_response, trusted_response
 from app.core.config import settings
 
-router = APIRouter()
+router = APIRouter(route_class=CachedRoute)
 
 
 @router.get(
@@ -23,6 +27,7 @@ router = APIRouter()
     summary="Get all shards",
     description="Retrieve a paginated list of all shards with optional filtering."
 )
+@cache_response(tags=["shards:*"], stale_ttl=settings.CACHE_STALE_TTL, includes=Shard)
 async def get_shards(
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(settings.DEFAULT_PAGE_SIZE, ge=1, le=settings.MAX_PAGE_SIZE, description="Number of records to return"),
@@ -30,6 +35,8 @@ async def get_shards(
     intent: Optional[str] = Query(None, description="Filter by shard intent"),
     status: Optional[str] = Query(None, description="Filter by shard status"),
     is_combined: Optional[bool] = Query(None, description="Filter by combined status"),
+    fields: Optional[List[str]] = Depends(get_shard_fields),
+    include: Optional[IncludeResolver] = Depends(get_shard_includes),
     service: ShardService = Depends(get_shard_service)
 ):
     """Get all shards with pagination and filtering."""
@@ -43,23 +50,31 @@ async def get_shards(
     if is_combined is not None:
         filters["is_combined"] = is_combined
     
-    shards = service.get_multi(skip=skip, limit=limit, filters=filters, order_by="name")
+    shards = await service.get_multi_cached(skip=skip, limit=limit, filters=filters, order_by="name")
     total = service.count(filters)
     
-    return service.get_paginated_response(shards, total, skip, limit)
+    page = service.get_paginated_response(shards, total, skip, limit)
+    if include:
+        return compound_response(PaginatedResponse[ShardResponse], page, include, fields)
+    return trusted_response(PaginatedResponse[ShardResponse], page, fields)
 
 
 @router.get(
     "/overview",
     response_model=ShardOverview,
     summary="Get shards overview",
-    description="Get an overview of all shards with statistics."
+    description="Get statistics over all shards, refreshed every few minutes rather than on each write. "
+                "Set limit to also embed a page of shards."
 )
 async def get_shards_overview(
+    skip: int = Query(0, ge=0, description="Number of shards to skip in the embedded page"),
+    limit: int = Query(
+        0, ge=0, le=settings.MAX_PAGE_SIZE, description="Number of shards to embed, 0 for statistics only"
+    ),
     service: ShardService = Depends(get_shard_service)
 ):
-    """Get shards overview with statistics."""
-    return service.get_shards_overview()
+    """Get shards overview statistics, optionally with a page of shards."""
+    return await service.get_overview_cached(service.get_shards_overview, skip=skip, limit=limit)
 
 
 @router.get(
@@ -68,11 +83,13 @@ async def get_shards_overview(
     summary="Get whole shards",
     description="Get all whole shards."
 )
+@cache_response(tags=["shards:*"], stale_ttl=settings.CACHE_STALE_TTL)
 async def get_whole_shards(
+    fields: Optional[List[str]] = Depends(get_shard_fields),
     service: ShardService = Depends(get_shard_service)
 ):
     """Get whole shards."""
-    return service.get_whole_shards()
+    return sparse_response(List[ShardResponse], service.get_whole_shards(), fields)
 
 
 @router.get(
@@ -81,11 +98,13 @@ async def get_whole_shards(
     summary="Get splintered shards",
     description="Get all splintered shards."
 )
+@cache_response(tags=["shards:*"], stale_ttl=settings.CACHE_STALE_TTL)
 async def get_splintered_shards(
+    fields: Optional[List[str]] = Depends(get_shard_fields),
     service: ShardService = Depends(get_shard_service)
 ):
     """Get splintered shards."""
-    return service.get_splintered_shards()
+    return sparse_response(List[ShardResponse], service.get_splintered_shards(), fields)
 
 
 @router.get(
@@ -94,11 +113,13 @@ async def get_splintered_shards(
     summary="Get combined shards",
     description="Get all combined shards."
 )
+@cache_response(tags=["shards:*"], stale_ttl=settings.CACHE_STALE_TTL)
 async def get_combined_shards(
+    fields: Optional[List[str]] = Depends(get_shard_fields),
     service: ShardService = Depends(get_shard_service)
 ):
     """Get combined shards."""
-    return service.get_combined_shards()
+    return sparse_response(List[ShardResponse], service.get_combined_shards(), fields)
 
 
 @router.get(
@@ -107,12 +128,14 @@ async def get_combined_shards(
     summary="Get shards by intent",
     description="Get all shards with a specific intent."
 )
+@cache_response(tags=["shards:*"], stale_ttl=settings.CACHE_STALE_TTL)
 async def get_shards_by_intent(
     intent: str,
+    fields: Optional[List[str]] = Depends(get_shard_fields),
     service: ShardService = Depends(get_shard_service)
 ):
     """Get shards by intent."""
-    return service.get_shards_by_intent(intent)
+    return sparse_response(List[ShardResponse], service.get_shards_by_intent(intent), fields)
 
 
 @router.get(
@@ -121,12 +144,14 @@ async def get_shards_by_intent(
     summary="Get shards by status",
     description="Get all shards with a specific status."
 )
+@cache_response(tags=["shards:*"], stale_ttl=settings.CACHE_STALE_TTL)
 async def get_shards_by_status(
     status: str,
+    fields: Optional[List[str]] = Depends(get_shard_fields),
     service: ShardService = Depends(get_shard_service)
 ):
     """Get shards by status."""
-    return service.get_shards_by_status(status)
+    return sparse_response(List[ShardResponse], service.get_shards_by_status(status), fields)
 
 
 @router.get(
@@ -135,12 +160,14 @@ async def get_shards_by_status(
     summary="Get shards by vessel",
     description="Get all shards held by a specific vessel."
 )
+@cache_response(tags=["shards:*"], stale_ttl=settings.CACHE_STALE_TTL)
 async def get_shards_by_vessel(
     vessel_name: str,
+    fields: Optional[List[str]] = Depends(get_shard_fields),
     service: ShardService = Depends(get_shard_service)
 ):
     """Get shards by vessel."""
-    return service.get_shards_by_vessel(vessel_name)
+    return sparse_response(List[ShardResponse], service.get_shards_by_vessel(vessel_name), fields)
 
 
 @router.get(
@@ -149,12 +176,14 @@ async def get_shards_by_vessel(
     summary="Search shards",
     description="Search shards by name, intent, and description."
 )
+@cache_response(ttl=300, tags=["shards:*"])
 async def search_shards(
     q: str = Query(..., min_length=1, description="Search term"),
+    fields: Optional[List[str]] = Depends(get_shard_fields),
     service: ShardService = Depends(get_shard_service)
 ):
     """Search shards by name, intent, and description."""
-    return service.search_shards(q)
+    return sparse_response(List[ShardResponse], service.search_shards(q), fields)
 
 
 @router.get(
@@ -166,15 +195,20 @@ async def search_shards(
         404: {"model": ErrorResponse, "description": "Shard not found"}
     }
 )
+@cache_response(tags=["shards:{shard_id}"], stale_ttl=settings.CACHE_STALE_TTL, includes=Shard)
 async def get_shard(
     shard_id: str,
+    fields: Optional[List[str]] = Depends(get_shard_fields),
+    include: Optional[IncludeResolver] = Depends(get_shard_includes),
     service: ShardService = Depends(get_shard_service)
 ):
     """Get a shard by ID."""
     shard = service.get(shard_id)
     if not shard:
         raise HTTPException(status_code=404, detail="Shard not found")
-    return shard
+    if include:
+        return compound_response(ShardResponse, shard, include, fields)
+    return sparse_response(ShardResponse, shard, fields)
 
 
 @router.get(
@@ -186,6 +220,7 @@ async def get_shard(
         404: {"model": ErrorResponse, "description": "Shard not found"}
     }
 )
+@cache_response(tags=["shards:*"], stale_ttl=settings.CACHE_STALE_TTL)
 async def get_shard_with_vessels(
     shard_id: str,
     service: ShardService = Depends(get_shard_service)
@@ -206,15 +241,17 @@ async def get_shard_with_vessels(
         404: {"model": ErrorResponse, "description": "Shard not found"}
     }
 )
+@cache_response(tags=["shards:*"], stale_ttl=settings.CACHE_STALE_TTL)
 async def get_shard_by_name(
     name: str,
+    fields: Optional[List[str]] = Depends(get_shard_fields),
     service: ShardService = Depends(get_shard_service)
 ):
     """Get a shard by name."""
     shard = service.get_shard_by_name(name)
     if not shard:
         raise HTTPException(status_code=404, detail="Shard not found")
-    return shard
+    return sparse_response(ShardResponse, shard, fields)
 
 
 @router.post(
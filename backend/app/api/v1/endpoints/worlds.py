@@ -1,33 +1,43 @@
 """
 World API endpoints.
 """
-from typing import List, Optional
+from typing import List, Optional, Type, Union
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 
-from app.api.dependencies import get_world_service, get_db
+from app.api.dependencies import (
+    get_world_service, get_world_fields, get_world_includes, get_world_list_schema, get_db
+)
+from app.api.cache import CachedRoute, cache_response
+from app.models import World
 from app.services import WorldService
+from app.services.include_service import IncludeResolver
 from app.schemas.world import (
-    WorldCreate, WorldUpdate, WorldResponse, WorldSummary, WorldOverview
+    WorldCreate, WorldUpdate, WorldResponse, WorldListItem, WorldSummary, WorldOverview
 )
-from app.schemas.base import PaginatedResponse, ErrorResponse
+from app.schemas.base import BaseSchema, PaginatedResponse, ErrorResponse
+from app.schemas.serializers import compound_response, sparse_response, trusted_response
 from app.core.config import settings
 
-router = APIRouter()
+router = APIRouter(route_class=CachedRoute)
 
 
 @router.get(
     "/",
-    response_model=PaginatedResponse[WorldResponse],
+    response_model=Union[PaginatedResponse[WorldListItem], PaginatedResponse[WorldResponse]],
     summary="Get all worlds",
     description="Retrieve a paginated list of all worlds with optional filtering."
 )
+@cache_response(tags=["worlds:*"], stale_ttl=settings.CACHE_STALE_TTL, includes=World)
 async def get_worlds(
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(settings.DEFAULT_PAGE_SIZE, ge=1, le=settings.MAX_PAGE_SIZE, description="Number of records to return"),
     name: Optional[str] = Query(None, description="Filter by world name"),
     system: Optional[str] = Query(None, description="Filter by planetary system"),
     is_habitable: Optional[bool] = Query(None, description="Filter by habitable status"),
+    fields: Optional[List[str]] = Depends(get_world_fields),
+    item_schema: Type[BaseSchema] = Depends(get_world_list_schema),
+    include: Optional[IncludeResolver] = Depends(get_world_includes),
     service: WorldService = Depends(get_world_service)
 ):
     """Get all worlds with pagination and filtering."""
@@ -39,23 +49,31 @@ async def get_worlds(
     if is_habitable is not None:
         filters["is_habitable"] = is_habitable
     
-    worlds = service.get_multi(skip=skip, limit=limit, filters=filters, order_by="name")
+    worlds = await service.get_multi_cached(skip=skip, limit=limit, filters=filters, order_by="name")
     total = service.count(filters)
     
-    return service.get_paginated_response(worlds, total, skip, limit)
+    page = service.get_paginated_response(worlds, total, skip, limit)
+    if include:
+        return compound_response(PaginatedResponse[item_schema], page, include, fields)
+    return trusted_response(PaginatedResponse[item_schema], page, fields)
 
 
 @router.get(
     "/overview",
     response_model=WorldOverview,
     summary="Get worlds overview",
-    description="Get an overview of all worlds with statistics."
+    description="Get statistics over all worlds, refreshed every few minutes rather than on each write. "
+                "Set limit to also embed a page of worlds."
 )
 async def get_worlds_overview(
+    skip: int = Query(0, ge=0, description="Number of worlds to skip in the embedded page"),
+    limit: int = Query(
+        0, ge=0, le=settings.MAX_PAGE_SIZE, description="Number of worlds to embed, 0 for statistics only"
+    ),
     service: WorldService = Depends(get_world_service)
 ):
-    """Get worlds overview with statistics."""
-    return service.get_worlds_overview()
+    """Get worlds overview statistics, optionally with a page of worlds."""
+    return await service.get_overview_cached(service.get_worlds_overview, skip=skip, limit=limit)
 
 
 @router.get(
@@ -64,11 +82,13 @@ async def get_worlds_overview(
     summary="Get habitable worlds",
     description="Get all habitable worlds."
 )
+@cache_response(tags=["worlds:*"], stale_ttl=settings.CACHE_STALE_TTL)
 async def get_habitable_worlds(
+    fields: Optional[List[str]] = Depends(get_world_fields),
     service: WorldService = Depends(get_world_service)
 ):
     """Get all habitable worlds."""
-    return service.get_habitable_worlds()
+    return sparse_response(List[WorldResponse], service.get_habitable_worlds(), fields)
 
 
 @router.get(
@@ -77,12 +97,14 @@ async def get_habitable_worlds(
     summary="Get worlds by system",
     description="Get all worlds in a specific planetary system."
 )
+@cache_response(tags=["worlds:*"], stale_ttl=settings.CACHE_STALE_TTL)
 async def get_worlds_by_system(
     system: str,
+    fields: Optional[List[str]] = Depends(get_world_fields),
     service: WorldService = Depends(get_world_service)
 ):
     """Get worlds by planetary system."""
-    return service.get_worlds_by_system(system)
+    return sparse_response(List[WorldResponse], service.get_worlds_by_system(system), fields)
 
 
 @router.get(
@@ -91,11 +113,13 @@ async def get_worlds_by_system(
     summary="Get worlds with series",
     description="Get worlds that have series associated with them."
 )
+@cache_response(tags=["worlds:*", "series:*"], stale_ttl=settings.CACHE_STALE_TTL)
 async def get_worlds_with_series(
+    fields: Optional[List[str]] = Depends(get_world_fields),
     service: WorldService = Depends(get_world_service)
 ):
     """Get worlds with series."""
-    return service.get_worlds_with_series()
+    return sparse_response(List[WorldResponse], service.get_worlds_with_series(), fields)
 
 
 @router.get(
@@ -104,11 +128,13 @@ async def get_worlds_with_series(
     summary="Get worlds with magic systems",
     description="Get worlds that have magic systems."
 )
+@cache_response(tags=["worlds:*", "magic_systems:*"], stale_ttl=settings.CACHE_STALE_TTL)
 async def get_worlds_with_magic_systems(
+    fields: Optional[List[str]] = Depends(get_world_fields),
     service: WorldService = Depends(get_world_service)
 ):
     """Get worlds with magic systems."""
-    return service.get_worlds_with_magic_systems()
+    return sparse_response(List[WorldResponse], service.get_worlds_with_magic_systems(), fields)
 
 
 @router.get(
@@ -117,12 +143,14 @@ async def get_worlds_with_magic_systems(
     summary="Search worlds",
     description="Search worlds by name and description."
 )
+@cache_response(ttl=300, tags=["worlds:*"])
 async def search_worlds(
     q: str = Query(..., min_length=1, description="Search term"),
+    fields: Optional[List[str]] = Depends(get_world_fields),
     service: WorldService = Depends(get_world_service)
 ):
     """Search worlds by name and description."""
-    return service.search_worlds(q)
+    return sparse_response(List[WorldResponse], service.search_worlds(q), fields)
 
 
 @router.get(
@@ -134,15 +162,20 @@ async def search_worlds(
         404: {"model": ErrorResponse, "description": "World not found"}
     }
 )
+@cache_response(tags=["worlds:{world_id}"], stale_ttl=settings.CACHE_STALE_TTL, includes=World)
 async def get_world(
     world_id: str,
+    fields: Optional[List[str]] = Depends(get_world_fields),
+    include: Optional[IncludeResolver] = Depends(get_world_includes),
     service: WorldService = Depends(get_world_service)
 ):
     """Get a world by ID."""
     world = service.get(world_id)
     if not world:
         raise HTTPException(status_code=404, detail="World not found")
-    return world
+    if include:
+        return compound_response(WorldResponse, world, include, fields)
+    return sparse_response(WorldResponse, world, fields)
 
 
 @router.get(
@@ -154,6 +187,7 @@ async def get_world(
         404: {"model": ErrorResponse, "description": "World not found"}
     }
 )
+@cache_response(tags=["worlds:*", "series:*", "books:*", "characters:*", "magic_systems:*", "shards:*"], stale_ttl=settings.CACHE_STALE_TTL)
 async def get_world_summary(
     world_id: str,
     service: WorldService = Depends(get_world_service)
@@ -174,15 +208,17 @@ async def get_world_summary(
         404: {"model": ErrorResponse, "description": "World not found"}
     }
 )
+@cache_response(tags=["worlds:*"], stale_ttl=settings.CACHE_STALE_TTL)
 async def get_world_by_name(
     name: str,
+    fields: Optional[List[str]] = Depends(get_world_fields),
     service: WorldService = Depends(get_world_service)
 ):
     """Get a world by name."""
     world = service.get_world_by_name(name)
     if not world:
         raise HTTPException(status_code=404, detail="World not found")
-    return world
+    return sparse_response(WorldResponse, world, fields)
 
 
 @router.post(
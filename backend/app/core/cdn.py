@@ -0,0 +1,62 @@
+"""
+CDN purge hooks.
+
+Cacheable responses carry a ``Surrogate-Key`` header; when repositories write,
+the keys of the affected entities are handed to the configured purge hook so
+the CDN drops every response that depends on them.
+"""
+from typing import List, Optional
+
+import structlog
+
+from app.core.config import settings
+
+logger = structlog.get_logger(__name__)
+
+
+class PurgeHook:
+    """Interface for purging surrogate keys from a CDN."""
+
+    async def purge(self, keys: List[str]) -> None:
+        """Purge every cached response tagged with any of the keys."""
+        raise NotImplementedError
+
+
+class NullPurgeHook(PurgeHook):
+    """Purge hook for deployments without a CDN."""
+
+    async def purge(self, keys: List[str]) -> None:
+        return None
+
+
+class LoggingPurgeHook(PurgeHook):
+    """Stand-in purge hook that logs and records purge requests instead of sending them."""
+
+    def __init__(self):
+        self.purged: List[List[str]] = []
+
+    async def purge(self, keys: List[str]) -> None:
+        self.purged.append(list(keys))
+        logger.info("CDN purge requested", surrogate_keys=keys)
+
+
+PURGE_HOOKS = {
+    "none": NullPurgeHook,
+    "logging": LoggingPurgeHook,
+}
+
+_purge_hook: Optional[PurgeHook] = None
+
+
+def get_purge_hook() -> PurgeHook:
+    """Get the configured purge hook."""
+    global _purge_hook
+    if _purge_hook is None:
+        _purge_hook = PURGE_HOOKS[settings.CDN_PURGE_HOOK]()
+    return _purge_hook
+
+
+def set_purge_hook(hook: PurgeHook) -> None:
+    """Replace the purge hook, e.g. with a CDN-specific implementation."""
+    global _purge_hook
+    _purge_hook = hook
@@ -28,6 +28,12 @@ class Settings(BaseSettings):
     # Redis Settings
     REDIS_URL: str = "redis://localhost:6379/0"
     REDIS_TEST_URL: Optional[str] = None
+    REDIS_MAX_CONNECTIONS: int = 50
+    REDIS_SOCKET_TIMEOUT: float = 0.25  # Seconds; cache calls give up rather than stall requests
+    REDIS_SOCKET_CONNECT_TIMEOUT: float = 0.25
+    REDIS_HEALTH_CHECK_INTERVAL: int = 15  # Seconds between health check PINGs
+    REDIS_CIRCUIT_FAILURE_THRESHOLD: int = 5  # Consecutive failures that open the circuit
+    REDIS_CIRCUIT_RESET_TIMEOUT: float = 30.0  # Seconds Redis is skipped once the circuit opens
     
     # Elasticsearch Settings
     ELASTICSEARCH_URL: str = "http://localhost:9200"
@@ -37,6 +43,7 @@ class Settings(BaseSettings):
     SECRET_KEY: str = "your-secret-key-here-change-in-production"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    ADMIN_API_KEY: Optional[str] = None  # X-Admin-Key for /admin endpoints; without one they only answer in DEBUG
     
     # CORS Settings
     ALLOWED_ORIGINS: List[str] = [
@@ -65,9 +72,57 @@ class Settings(BaseSettings):
     # Pagination
     DEFAULT_PAGE_SIZE: int = 20
     MAX_PAGE_SIZE: int = 100
+    INCLUDE_MAX_RELATED: int = 100  # Entities a to-many include side-loads per resource
+    
+    # Batch Requests
+    BATCH_MAX_REQUESTS: int = 20  # GET requests accepted in one batch
+    BATCH_CONCURRENCY: int = 8  # Requests of a batch run at once, each with its own database session
+    
+    # Bulk Export
+    EXPORT_BATCH_SIZE: int = 1000  # Rows fetched and serialized per chunk of a streamed export
+    EXPORT_ROW_GROUP_SIZE: int = 65536  # Rows per Parquet row group / Arrow write
+    EXPORT_CACHE_DIR: str = "/tmp/cosmere-exports"  # Built CSV, Parquet and Arrow exports, one file per dataset version
     
     # Cache Settings
     CACHE_TTL: int = 3600  # 1 hour in seconds
+    CACHE_ENABLED: bool = True  # Serve @cache_response endpoints from Redis
+    CACHE_LOCAL_ENABLED: bool = True  # In-process tier in front of Redis
+    CACHE_LOCAL_MAX_ENTRIES: int = 1024
+    CACHE_LOCAL_TTL: int = 30  # Upper bound on local staleness if a broadcast is missed
+    CACHE_TABLE_CHECK_INTERVAL: int = 5  # Seconds between reads of table row counts and update times per process
+    CACHE_TTL_JITTER: float = 0.1  # TTLs are shortened by up to this fraction
+    CACHE_XFETCH_BETA: float = 1.0  # >1 favours earlier refreshes
+    CACHE_LOCK_TIMEOUT: float = 10.0  # Seconds a recompute lock is held at most
+    CACHE_STALE_TTL: int = 86400  # Stale-while-revalidate window for rarely changing data
+    CACHE_NEGATIVE_TTL: int = 60  # 404s and empty results are cached this long at most
+    OVERVIEW_STATS_TTL: int = 300  # Overview statistics are recomputed this often, not on every write
+    CACHE_CODEC: str = "json"  # Cache payload serializer: "json" (orjson) or "msgpack"
+    CACHE_COMPRESSION: str = "zlib"  # "none", "zlib" or "zstd"
+    CACHE_COMPRESSION_THRESHOLD: int = 1024  # Payloads larger than this many bytes are compressed
+    HTTP_CACHE_MAX_AGE: int = 60  # Cache-Control max-age for browsers
+    CDN_PURGE_HOOK: str = "logging"  # Purge hook notified of written entities: "logging" or "none"
+    
+    # Cache Warming
+    CACHE_WARM_ENABLED: bool = True  # Warm hot responses at startup
+    CACHE_WARM_INTERVAL: int = 900  # Seconds between scheduled warm runs, 0 to warm at startup only
+    CACHE_WARM_READINESS_GATE: bool = False  # /health/ready reports 503 until the first warm run finishes
+    CACHE_WARM_CONCURRENCY: int = 4
+    CACHE_WARM_PATHS: List[str] = [
+        "/api/v1/worlds/overview",
+        "/api/v1/series/overview",
+        "/api/v1/books/overview",
+        "/api/v1/characters/overview",
+        "/api/v1/magic-systems/overview",
+        "/api/v1/worlds/",
+        "/api/v1/series/",
+        "/api/v1/shards/",
+    ]
+    CACHE_WARM_TOP_CHARACTERS: int = 50  # Most requested character responses to warm
+    CACHE_WARM_HOT_KEYS: int = 100  # Most requested responses of any kind to warm
+    
+    # Query Instrumentation
+    QUERY_RECORDER_ENABLED: bool = False
+    QUERY_RECORDER_PATH: str = "query_shapes.json"
     
     class Config:
         env_file = ".env"
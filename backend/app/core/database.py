@@ -8,6 +8,7 @@ from sqlalchemy.pool import StaticPool
 import structlog
 
 from app.core.config import settings
+from app.core.query_recorder import install_query_recorder
 
 logger = structlog.get_logger(__name__)
 
@@ -21,6 +22,9 @@ engine = create_engine(
     echo=settings.DEBUG,
 )
 
+if settings.QUERY_RECORDER_ENABLED:
+    install_query_recorder(engine)
+
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
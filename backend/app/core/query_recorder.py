@@ -0,0 +1,158 @@
+"""
+Opt-in query shape recorder.
+
+When enabled, every statement executed on the engine is normalized into a
+"shape" (literals and IN-list lengths removed) and aggregated per endpoint with
+call counts and cumulative time. The recorded shapes feed
+``scripts/advise_indexes.py``, which EXPLAINs the hottest ones and proposes
+composite indexes.
+"""
+import json
+import re
+import threading
+import time
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+# ASGI scope of the request currently being served; the endpoint is resolved
+# lazily because routing happens after the middleware runs.
+_current_scope: ContextVar[Optional[dict]] = ContextVar("query_recorder_scope", default=None)
+
+_WHITESPACE = re.compile(r"\s+")
+_IN_LIST = re.compile(r"\bIN \(\?(?:\s*,\s*\?)*\)", re.IGNORECASE)
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"(?<![\w.])\d+(?:\.\d+)?\b")
+_PLACEHOLDER = re.compile(r"%\(\w+\)s|(?<!:):\w+|\$\d+|\?")
+
+
+def normalize_statement(statement: str) -> str:
+    """Reduce a SQL statement to its shape so equivalent queries aggregate together."""
+    shape = _WHITESPACE.sub(" ", statement).strip()
+    shape = _STRING_LITERAL.sub("?", shape)
+    shape = _PLACEHOLDER.sub("?", shape)
+    shape = _NUMBER_LITERAL.sub("?", shape)
+    return _IN_LIST.sub("IN (...)", shape)
+
+
+def _current_endpoint() -> str:
+    """Label for the endpoint serving the current request, if any."""
+    scope = _current_scope.get()
+    if scope is None:
+        return "<no request>"
+    route = scope.get("route")
+    path = getattr(route, "path", None) or scope.get("path", "")
+    return f"{scope.get('method', '')} {path}".strip()
+
+
+class QueryRecorder:
+    """Aggregates normalized query shapes per endpoint."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, Dict[str, Any]]] = {}
+
+    def record(self, statement: str, parameters: Any, duration: float) -> None:
+        """Record one execution of a statement."""
+        endpoint = _current_endpoint()
+        shape = normalize_statement(statement)
+        with self._lock:
+            shapes = self._stats.setdefault(endpoint, {})
+            entry = shapes.get(shape)
+            if entry is None:
+                entry = shapes[shape] = {
+                    "calls": 0,
+                    "total_time": 0.0,
+                    "max_time": 0.0,
+                    "statement": statement,
+                    "parameters": parameters,
+                }
+            entry["calls"] += 1
+            entry["total_time"] += duration
+            entry["max_time"] = max(entry["max_time"], duration)
+
+    def reset(self) -> None:
+        """Discard all recorded shapes."""
+        with self._lock:
+            self._stats.clear()
+
+    def snapshot(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """Copy of the per-endpoint statistics."""
+        with self._lock:
+            return {
+                endpoint: {shape: dict(entry) for shape, entry in shapes.items()}
+                for endpoint, shapes in self._stats.items()
+            }
+
+    def top_shapes(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Shapes across all endpoints ordered by cumulative time."""
+        merged: Dict[str, Dict[str, Any]] = {}
+        for endpoint, shapes in self.snapshot().items():
+            for shape, entry in shapes.items():
+                total = merged.setdefault(shape, {
+                    "shape": shape,
+                    "calls": 0,
+                    "total_time": 0.0,
+                    "statement": entry["statement"],
+                    "parameters": entry["parameters"],
+                    "endpoints": [],
+                })
+                total["calls"] += entry["calls"]
+                total["total_time"] += entry["total_time"]
+                total["endpoints"].append(endpoint)
+        return sorted(merged.values(), key=lambda e: e["total_time"], reverse=True)[:limit]
+
+    def load(self, path: str) -> None:
+        """Replace the recorded statistics with a previous dump."""
+        with open(path, "r", encoding="utf-8") as f:
+            stats = json.load(f)
+        with self._lock:
+            self._stats = stats
+
+    def dump(self, path: str) -> None:
+        """Write the recorded statistics to a JSON file."""
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.snapshot(), f, indent=2, default=str)
+        logger.info("Query shapes written", path=path)
+
+
+query_recorder = QueryRecorder()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_recorder_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info["query_recorder_start"].pop()
+    query_recorder.record(statement, parameters, time.perf_counter() - started)
+
+
+def install_query_recorder(engine: Engine) -> None:
+    """Attach the recorder to an engine's cursor execution events."""
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+        logger.info("Query shape recorder enabled")
+
+
+class QueryRecorderMiddleware:
+    """ASGI middleware that tags recorded queries with the serving endpoint."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        token = _current_scope.set(scope)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _current_scope.reset(token)
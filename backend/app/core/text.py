@@ -0,0 +1,22 @@
+"""
+Text normalization helpers.
+"""
+import unicodedata
+from typing import Optional
+
+
+def normalize_name(value: Optional[str]) -> Optional[str]:
+    """
+    Normalize a name, title or alias for case- and accent-insensitive lookups.
+
+    Args:
+        value: Raw name
+
+    Returns:
+        Optional[str]: Case-folded name with accents stripped and whitespace collapsed
+    """
+    if value is None:
+        return None
+    decomposed = unicodedata.normalize("NFKD", value)
+    stripped = "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return " ".join(stripped.casefold().split())
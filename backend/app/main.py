@@ -2,8 +2,9 @@
 Main FastAPI application entry point.
 """
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 import structlog
 
@@ -11,6 +12,10 @@ from app.core.config import settings
 from app.core.database import engine
 from app.api.v1.api import api_router
 from app.core.logging import setup_logging
+from app.core.query_recorder import QueryRecorderMiddleware, query_recorder
+from app.services.cache_metrics import PROMETHEUS_AVAILABLE
+from app.services.cache_service import cache_service
+from app.services.cache_warmer import cache_warmer
 
 # Setup logging
 setup_logging()
@@ -28,9 +33,18 @@ async def lifespan(app: FastAPI):
     Base.metadata.create_all(bind=engine)
     logger.info("Database tables created")
     
+    await cache_service.start_invalidation_listener()
+    await cache_service.start_health_checks()
+    await cache_warmer.start(app)
+    
     yield
     
     # Shutdown
+    await cache_warmer.stop()
+    await cache_service.flush_hot_keys()
+    await cache_service.close()
+    if settings.QUERY_RECORDER_ENABLED:
+        query_recorder.dump(settings.QUERY_RECORDER_PATH)
     logger.info("Shutting down Cosmere API application")
 
 
@@ -44,6 +58,7 @@ def create_application() -> FastAPI:
         docs_url=f"{settings.API_V1_STR}/docs",
         redoc_url=f"{settings.API_V1_STR}/redoc",
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
 
     # Add middleware
@@ -61,6 +76,9 @@ def create_application() -> FastAPI:
             allowed_hosts=["localhost", "127.0.0.1", "*.yourdomain.com"]
         )
 
+    if settings.QUERY_RECORDER_ENABLED:
+        app.add_middleware(QueryRecorderMiddleware)
+
     # Include API router
     app.include_router(api_router, prefix=settings.API_V1_STR)
 
@@ -86,6 +104,15 @@ async def health_check():
     return {"status": "healthy", "service": "cosmere-api"}
 
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus metrics endpoint."""
+    if not PROMETHEUS_AVAILABLE:
+        return Response("prometheus-client is not installed\n", status_code=503, media_type="text/plain")
+    from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(
@@ -11,6 +11,7 @@ from app.models.shard import Shard
 from app.models.character_relationship import CharacterRelationship
 from app.models.book_character import BookCharacter
 from app.models.character_magic_system import CharacterMagicSystem
+from app.models.character_alias import CharacterAlias
 
 __all__ = [
     "Base",
@@ -23,4 +24,5 @@ __all__ = [
     "CharacterRelationship",
     "BookCharacter",
     "CharacterMagicSystem",
+    "CharacterAlias",
 ]
@@ -2,13 +2,47 @@
 Base model with common fields and methods.
 """
 from datetime import datetime
-from sqlalchemy import Column, DateTime, String, Text
+from sqlalchemy import Column, DateTime, String, Text, JSON, Index, cast, event, exists, func, select, type_coerce
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import declared_attr
+from sqlalchemy.orm import declared_attr, deferred
 import uuid
 
+from app.models.serializer import row_serializer
+
 Base = declarative_base()
 
+# Structured data is stored as JSONB on PostgreSQL (GIN-indexable, supports
+# containment queries) and falls back to plain JSON on SQLite.
+JSONType = JSON().with_variant(JSONB(), "postgresql")
+
+# Deferred group of long free-text columns, which list endpoints leave out
+LONG_TEXT = "long_text"
+
+
+def long_text():
+    """Create a nullable Text column in the deferred LONG_TEXT group."""
+    return deferred(Column(Text, nullable=True), group=LONG_TEXT)
+
+
+def gin_index(name, column):
+    """Create a GIN index that is only emitted on PostgreSQL."""
+    return Index(name, column, postgresql_using="gin").ddl_if(dialect="postgresql")
+
+
+def json_array_contains(column, value, dialect_name):
+    """Build a filter matching rows whose JSON array column contains value."""
+    if dialect_name == "postgresql":
+        # JSONB @> containment, served by the GIN index
+        return type_coerce(column, JSONB).contains([value])
+    elements = func.json_each(column).table_valued("value")
+    return exists(select(1).select_from(elements).where(elements.c.value == value))
+
+
+def json_text_ilike(column, search_term):
+    """Build a case-insensitive substring filter over a JSON column's text."""
+    return cast(column, Text).ilike(f"%{search_term}%")
+
 
 class TimestampMixin:
     """Mixin to add created_at and updated_at timestamps."""
@@ -28,14 +62,8 @@ class BaseModel(Base, TimestampMixin):
         return cls.__name__.lower() + 's'
     
     def to_dict(self):
-        """Convert model instance to dictionary."""
-        result = {}
-        for column in self.__table__.columns:
-            value = getattr(self, column.name)
-            if isinstance(value, datetime):
-                value = value.isoformat()
-            result[column.name] = value
-        return result
+        """Convert model instance to dictionary, leaving out columns whose loading was deferred."""
+        return self.__row_serializer__.to_dict(self)
     
     def update(self, **kwargs):
         """Update model instance with provided kwargs."""
@@ -57,4 +85,10 @@ class BaseModel(Base, TimestampMixin):
     @classmethod
     def count(cls, db):
         """Get total count of model instances."""
-        return db.query(cls).count()
\ No newline at end of file
+        return db.query(cls).count()
+
+
+@event.listens_for(BaseModel, "instrument_class", propagate=True)
+def _compile_row_serializer(mapper, cls):
+    """Compile each model's row serializer once, as the model is declared."""
+    cls.__row_serializer__ = row_serializer(cls)
@@ -2,10 +2,11 @@
 Book model for Cosmere books.
 """
 from datetime import date
-from sqlalchemy import Column, String, Text, Date, Integer, ForeignKey, Boolean
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, Date, Integer, ForeignKey, Boolean
+from sqlalchemy.orm import relationship, validates
 
-from app.models.base import BaseModel
+from app.core.text import normalize_name
+from app.models.base import BaseModel, long_text
 
 
 class Book(BaseModel):
@@ -15,14 +16,15 @@ class Book(BaseModel):
     
     id = Column(String(36), primary_key=True, index=True)
     title = Column(String(255), nullable=False, index=True)
+    normalized_title = Column(String(255), nullable=True, index=True)
     isbn = Column(String(20), nullable=True, unique=True)
     publication_date = Column(Date, nullable=True)
     word_count = Column(Integer, nullable=True)
     chronological_order = Column(Integer, nullable=True, index=True)
     series_id = Column(String(36), ForeignKey("series.id"), nullable=True, index=True)
     world_id = Column(String(36), ForeignKey("worlds.id"), nullable=False, index=True)
-    summary = Column(Text, nullable=True)
-    cosmere_significance = Column(Text, nullable=True)
+    summary = long_text()
+    cosmere_significance = long_text()
     
     # Relationships
     series = relationship("Series", back_populates="books")
@@ -30,13 +32,18 @@ class Book(BaseModel):
     characters = relationship("BookCharacter", back_populates="book")
     first_appearance_characters = relationship("Character", foreign_keys="Character.first_appearance_book_id")
     
+    @validates("title")
+    def _set_normalized_title(self, key, title):
+        self.normalized_title = normalize_name(title)
+        return title
+    
     def __repr__(self):
         return f"<Book(id='{self.id}', title='{self.title}')>"
     
     @classmethod
     def get_by_title(cls, db, title):
         """Get book by title."""
-        return db.query(cls).filter(cls.title == title).first()
+        return db.query(cls).filter(cls.normalized_title == normalize_name(title)).first()
     
     @classmethod
     def get_by_series(cls, db, series_id):
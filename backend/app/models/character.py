@@ -1,11 +1,13 @@
 """
 Character model for Cosmere characters.
 """
-from sqlalchemy import Column, String, Text, ForeignKey, ARRAY, Enum
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, ForeignKey, ARRAY, Enum
+from sqlalchemy.orm import relationship, validates
 import enum
 
-from app.models.base import BaseModel
+from app.core.text import normalize_name
+from app.models.base import BaseModel, JSONType, gin_index, json_text_ilike, long_text
+from app.models.character_alias import CharacterAlias
 
 
 class CharacterStatus(enum.Enum):
@@ -20,18 +22,24 @@ class Character(BaseModel):
     """Character model representing a Cosmere character."""
     
     __tablename__ = "characters"
+    __table_args__ = (
+        gin_index("ix_characters_aliases_gin", "aliases"),
+        gin_index("ix_characters_affiliations_gin", "affiliations"),
+        gin_index("ix_characters_magic_abilities_gin", "magic_abilities"),
+    )
     
     id = Column(String(36), primary_key=True, index=True)
     name = Column(String(255), nullable=False, index=True)
-    aliases = Column(Text, nullable=True)  # JSON string of aliases
+    normalized_name = Column(String(255), nullable=True, index=True)
+    aliases = Column(JSONType, nullable=True)  # List of aliases
     world_of_origin_id = Column(String(36), ForeignKey("worlds.id"), nullable=False, index=True)
     species = Column(String(100), nullable=True)
     status = Column(String(50), nullable=True)
     first_appearance_book_id = Column(String(36), ForeignKey("books.id"), nullable=True, index=True)
-    biography = Column(Text, nullable=True)
-    magic_abilities = Column(Text, nullable=True)  # JSON string
-    affiliations = Column(Text, nullable=True)  # JSON string
-    cosmere_significance = Column(Text, nullable=True)  # JSON string
+    biography = long_text()
+    magic_abilities = Column(JSONType, nullable=True)
+    affiliations = Column(JSONType, nullable=True)
+    cosmere_significance = Column(JSONType, nullable=True)
     
     # Relationships
     world_of_origin = relationship("World", back_populates="characters")
@@ -44,6 +52,29 @@ class Character(BaseModel):
                                     foreign_keys="CharacterRelationship.related_character_id",
                                     back_populates="related_character")
     magic_systems = relationship("CharacterMagicSystem", back_populates="character")
+    alias_entries = relationship("CharacterAlias", back_populates="character",
+                                 cascade="all, delete-orphan")
+    
+    @validates("name")
+    def _set_normalized_name(self, key, name):
+        self.normalized_name = normalize_name(name)
+        return name
+    
+    @validates("aliases")
+    def _sync_alias_entries(self, key, aliases):
+        """Keep the character_aliases lookup rows in step with the aliases list."""
+        existing = {entry.normalized_alias: entry for entry in self.alias_entries}
+        entries = {}
+        for alias in aliases or []:
+            if not isinstance(alias, str):
+                continue
+            normalized = normalize_name(alias)
+            if normalized and normalized not in entries:
+                entries[normalized] = existing.get(normalized) or CharacterAlias(
+                    normalized_alias=normalized, alias=alias
+                )
+        self.alias_entries = list(entries.values())
+        return aliases
     
     def __repr__(self):
         return f"<Character(id='{self.id}', name='{self.name}')>"
@@ -51,12 +82,14 @@ class Character(BaseModel):
     @classmethod
     def get_by_name(cls, db, name):
         """Get character by name."""
-        return db.query(cls).filter(cls.name == name).first()
+        return db.query(cls).filter(cls.normalized_name == normalize_name(name)).first()
     
     @classmethod
     def get_by_alias(cls, db, alias):
         """Get character by alias."""
-        return db.query(cls).filter(cls.aliases.contains([alias])).all()
+        return db.query(cls).join(cls.alias_entries).filter(
+            CharacterAlias.normalized_alias == normalize_name(alias)
+        ).all()
     
     @classmethod
     def get_by_world(cls, db, world_id):
@@ -78,5 +111,5 @@ class Character(BaseModel):
         """Search characters by name or aliases."""
         return db.query(cls).filter(
             (cls.name.ilike(f"%{search_term}%")) |
-            (cls.aliases.any(lambda x: search_term.lower() in x.lower()))
+            json_text_ilike(cls.aliases, search_term)
         ).all()
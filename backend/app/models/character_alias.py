@@ -0,0 +1,23 @@
+"""
+CharacterAlias lookup table for resolving characters by alias.
+"""
+from sqlalchemy import Column, String, ForeignKey
+from sqlalchemy.orm import relationship
+
+from app.models.base import BaseModel
+
+
+class CharacterAlias(BaseModel):
+    """CharacterAlias row mapping a normalized alias to a character."""
+
+    __tablename__ = "character_aliases"
+
+    normalized_alias = Column(String(255), primary_key=True)
+    character_id = Column(String(36), ForeignKey("characters.id", ondelete="CASCADE"), primary_key=True, index=True)
+    alias = Column(String(255), nullable=False)  # Alias as originally written
+
+    # Relationships
+    character = relationship("Character", back_populates="alias_entries")
+
+    def __repr__(self):
+        return f"<CharacterAlias(normalized_alias='{self.normalized_alias}', character_id='{self.character_id}')>"
@@ -1,10 +1,10 @@
 """
 Magic System model for Cosmere magic systems.
 """
-from sqlalchemy import Column, String, Text, ForeignKey, Boolean
+from sqlalchemy import Column, String, ForeignKey, Boolean
 from sqlalchemy.orm import relationship
 
-from app.models.base import BaseModel
+from app.models.base import BaseModel, JSONType, long_text
 
 
 class MagicSystem(BaseModel):
@@ -15,12 +15,12 @@ class MagicSystem(BaseModel):
     id = Column(String(50), primary_key=True, index=True)
     name = Column(String(100), nullable=False, index=True)
     world_id = Column(String(50), ForeignKey("worlds.id"), nullable=True, index=True)
-    description = Column(Text, nullable=True)
-    mechanics = Column(Text, nullable=True)  # How the magic works
-    requirements = Column(Text, nullable=True)  # Requirements to use the magic
-    limitations = Column(Text, nullable=True)  # Limitations of the magic
+    description = long_text()
+    mechanics = long_text()  # How the magic works
+    requirements = long_text()  # Requirements to use the magic
+    limitations = long_text()  # Limitations of the magic
     is_investiture_based = Column(Boolean, default=True)
-    related_systems = Column(Text, nullable=True)  # JSON string of related magic systems
+    related_systems = Column(JSONType, nullable=True)  # Related magic systems
     
     # Relationships
     world = relationship("World", back_populates="magic_systems")
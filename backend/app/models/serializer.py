@@ -0,0 +1,95 @@
+"""
+Compiled row serializers.
+
+A model's columns and the conversion each one needs are worked out once per
+model, so serializing a row is a single pass over a tuple of (name, converter)
+pairs reading the row's loaded state, with no per-value type checks: dates and
+datetimes become ISO strings, enums their values and JSON columns either pass
+through or, for flat formats like CSV, become JSON text.
+"""
+import enum
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import orjson
+from sqlalchemy import JSON, Date, DateTime, Enum
+from sqlalchemy.orm.base import instance_state
+
+Converter = Optional[Callable[[Any], Any]]
+
+
+def _isoformat(value: Any) -> Any:
+    return value.isoformat()
+
+
+def _enum_value(value: Any) -> Any:
+    # Enum columns may still hold the raw string assigned before a flush
+    return value.value if isinstance(value, enum.Enum) else value
+
+
+def _json_text(value: Any) -> str:
+    return orjson.dumps(value).decode()
+
+
+class RowSerializer:
+    """
+    Serializes rows of one model to dictionaries or flat value tuples.
+
+    Columns a query left unloaded (deferred long text, sparse fieldsets) are
+    left out of dictionaries; expired columns are reloaded as on attribute
+    access.
+    """
+
+    def __init__(self, model: type, json_text: bool = False, iso_dates: bool = True):
+        self.model = model
+        columns = []
+        for column in model.__table__.columns:
+            converter: Converter = None
+            if isinstance(column.type, (DateTime, Date)):
+                converter = _isoformat if iso_dates else None
+            elif isinstance(column.type, Enum):
+                converter = _enum_value
+            elif isinstance(column.type, JSON):
+                converter = _json_text if json_text else None
+            columns.append((column.key, converter))
+        self.columns: Tuple[Tuple[str, Converter], ...] = tuple(columns)
+        self.names: Tuple[str, ...] = tuple(name for name, _ in columns)
+
+    def _loaded(self, row: Any) -> Dict[str, Any]:
+        """The row's column values that are loaded, reloading expired ones."""
+        state = instance_state(row)
+        if state.has_identity and not state.expired_attributes:
+            return state.dict
+        # Expired columns reload on access; unset columns of new rows read as None
+        unloaded = state.unloaded - state.expired_attributes if state.has_identity else ()
+        return {name: getattr(row, name) for name in self.names if name not in unloaded}
+
+    def to_dict(self, row: Any) -> Dict[str, Any]:
+        """A row's loaded columns as a dictionary."""
+        values = self._loaded(row)
+        result = {}
+        for name, convert in self.columns:
+            if name in values:
+                value = values[name]
+                result[name] = value if convert is None or value is None else convert(value)
+        return result
+
+    def values(self, row: Any) -> List[Any]:
+        """A row's column values in column order, None for unloaded ones."""
+        values = self._loaded(row)
+        result = []
+        for name, convert in self.columns:
+            value = values.get(name)
+            result.append(value if convert is None or value is None else convert(value))
+        return result
+
+
+_serializers: Dict[Tuple[type, bool, bool], RowSerializer] = {}
+
+
+def row_serializer(model: type, json_text: bool = False, iso_dates: bool = True) -> RowSerializer:
+    """Row serializer of a model, compiled once per model and conversion options."""
+    key = (model, json_text, iso_dates)
+    serializer = _serializers.get(key)
+    if serializer is None:
+        serializer = _serializers[key] = RowSerializer(model, json_text, iso_dates)
+    return serializer
@@ -1,11 +1,11 @@
 """
 Series model for book series.
 """
-from sqlalchemy import Column, String, Text, Integer, ForeignKey, Enum
+from sqlalchemy import Column, String, Integer, ForeignKey, Enum
 from sqlalchemy.orm import relationship
 import enum
 
-from app.models.base import BaseModel
+from app.models.base import BaseModel, JSONType, long_text
 
 
 class SeriesStatus(enum.Enum):
@@ -23,12 +23,12 @@ class Series(BaseModel):
     
     id = Column(String(50), primary_key=True, index=True)
     name = Column(String(100), nullable=False, index=True)
-    description = Column(Text, nullable=True)
+    description = long_text()
     world_id = Column(String(50), ForeignKey("worlds.id"), nullable=True, index=True)
     planned_books = Column(Integer, nullable=True)
     current_books = Column(Integer, default=0)
     status = Column(Enum(SeriesStatus), default=SeriesStatus.ONGOING)
-    reading_order = Column(Text, nullable=True)  # JSON string for reading order
+    reading_order = Column(JSONType, nullable=True)  # Reading order data
     
     # Relationships
     world = relationship("World", foreign_keys=[world_id])
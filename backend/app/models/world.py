@@ -1,10 +1,11 @@
 """
 World model for Cosmere worlds.
 """
-from sqlalchemy import Column, String, Text, Boolean, ForeignKey
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, Boolean, ForeignKey
+from sqlalchemy.orm import relationship, validates
 
-from app.models.base import BaseModel
+from app.core.text import normalize_name
+from app.models.base import BaseModel, JSONType, long_text
 
 
 class World(BaseModel):
@@ -14,10 +15,11 @@ class World(BaseModel):
     
     id = Column(String(36), primary_key=True, index=True)
     name = Column(String(255), nullable=False, index=True)
+    normalized_name = Column(String(255), nullable=True, index=True)
     system = Column(String(255), nullable=True)  # Planetary system
     shard_id = Column(String(36), ForeignKey("shards.id"), nullable=True, index=True)
-    geography = Column(Text, nullable=True)  # JSON string
-    culture_notes = Column(Text, nullable=True)
+    geography = Column(JSONType, nullable=True)
+    culture_notes = long_text()
     technology_level = Column(String(100), nullable=True)
     
     # Relationships
@@ -26,13 +28,18 @@ class World(BaseModel):
     characters = relationship("Character", back_populates="world_of_origin")
     magic_systems = relationship("MagicSystem", back_populates="world")
     
+    @validates("name")
+    def _set_normalized_name(self, key, name):
+        self.normalized_name = normalize_name(name)
+        return name
+    
     def __repr__(self):
         return f"<World(id='{self.id}', name='{self.name}')>"
     
     @classmethod
     def get_by_name(cls, db, name):
         """Get world by name."""
-        return db.query(cls).filter(cls.name == name).first()
+        return db.query(cls).filter(cls.normalized_name == normalize_name(name)).first()
     
     @classmethod
     def get_by_system(cls, db, system):
@@ -1,16 +1,87 @@
 """
 Base repository with common CRUD operations.
 """
-from typing import TypeVar, Generic, Type, List, Optional, Dict, Any
-from sqlalchemy.orm import Session, Query
-from sqlalchemy import and_, or_
-from app.models.base import BaseModel
+from datetime import datetime
+from typing import TypeVar, Generic, Type, List, Optional, Dict, Any, Callable, Iterator, Tuple
+from sqlalchemy.orm import Load, ORMExecuteState, Session, Query, load_only
+from sqlalchemy import and_, event, func, or_, select
+from app.models.base import LONG_TEXT, BaseModel
 import logging
 
 logger = logging.getLogger(__name__)
 
 ModelType = TypeVar("ModelType", bound=BaseModel)
 
+# Callbacks invoked with (table name, record id) after every committed write
+_write_listeners: List[Callable[[str, str], None]] = []
+
+
+def add_write_listener(listener: Callable[[str, str], None]) -> None:
+    """Register a callback to be notified of committed repository writes."""
+    if listener not in _write_listeners:
+        _write_listeners.append(listener)
+
+
+# Session.info key mapping models to the only columns to load for them
+SELECTED_COLUMNS = "selected_columns"
+
+
+def select_columns(db: Session, model: Type[BaseModel], fields: Optional[List[str]]) -> None:
+    """
+    Load only the given fields' columns whenever the session loads ``model``.
+
+    Sparse fieldsets use this so unrequested (often heavy Text) columns are
+    never fetched; the primary key is always loaded.
+    """
+    columns = [getattr(model, name) for name in fields or [] if name in model.__table__.columns]
+    if columns:
+        db.info.setdefault(SELECTED_COLUMNS, {})[model] = columns
+
+
+# Session.info key holding the models whose long text columns stay unloaded
+SUMMARY_MODELS = "summary_models"
+
+
+def summarize(db: Session, model: Type[BaseModel]) -> None:
+    """Leave the long text columns of ``model`` unloaded for the rest of the session."""
+    db.info.setdefault(SUMMARY_MODELS, set()).add(model)
+
+
+def table_state(db: Session, model: Type[BaseModel]) -> Tuple[int, Optional[datetime]]:
+    """
+    Row count and latest update time of a model's table.
+
+    Read from the table itself, so writes that bypass the repositories
+    (seed and import scripts, migrations, direct SQL) still change it.
+    """
+    count, updated_at = db.query(func.count(model.id), func.max(model.updated_at)).one()
+    return count, updated_at
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _apply_column_loading(state: ORMExecuteState) -> None:
+    """
+    Decide which columns each loaded model fetches.
+    
+    Long text columns are mapped as deferred so list endpoints can skip them,
+    but everything else (detail reads, caches, imports) expects whole rows, so
+    they are undeferred unless the session summarizes the model or selected a
+    sparse fieldset for it.
+    """
+    # Column loads are deferred attributes being fetched on access; leave them be
+    if not state.is_select or state.is_column_load:
+        return
+    selected = state.session.info.get(SELECTED_COLUMNS, {})
+    summarized = state.session.info.get(SUMMARY_MODELS, ())
+    for description in state.statement.column_descriptions:
+        entity = description.get("expr")
+        if not isinstance(entity, type) or not issubclass(entity, BaseModel):
+            continue
+        if entity in selected:
+            state.statement = state.statement.options(load_only(*selected[entity]))
+        elif entity not in summarized:
+            state.statement = state.statement.options(Load(entity).undefer_group(LONG_TEXT))
+
 
 class BaseRepository(Generic[ModelType]):
     """Base repository with common CRUD operations."""
@@ -19,6 +90,27 @@ class BaseRepository(Generic[ModelType]):
         self.model = model
         self.db = db
     
+    @property
+    def dialect_name(self) -> str:
+        """Name of the database dialect the session is bound to."""
+        return self.db.get_bind().dialect.name
+    
+    def selected_columns(self) -> Optional[List[Any]]:
+        """Columns this session is restricted to for the model, if a sparse fieldset was selected."""
+        return self.db.info.get(SELECTED_COLUMNS, {}).get(self.model)
+    
+    def summarized(self) -> bool:
+        """Whether this session leaves the model's long text columns unloaded."""
+        return self.model in self.db.info.get(SUMMARY_MODELS, ())
+    
+    def _notify_write(self, id: str) -> None:
+        """Notify write listeners that a record of this model changed."""
+        for listener in _write_listeners:
+            try:
+                listener(self.model.__tablename__, id)
+            except Exception as e:
+                logger.error(f"Error notifying write listener for {self.model.__name__} {id}: {e}")
+    
     def get(self, id: str) -> Optional[ModelType]:
         """Get a single record by ID."""
         try:
@@ -36,27 +128,65 @@ class BaseRepository(Generic[ModelType]):
     ) -> List[ModelType]:
         """Get multiple records with pagination and filtering."""
         try:
-            query = self.db.query(self.model)
-            
-            # Apply filters
-            if filters:
-                for field, value in filters.items():
-                    if hasattr(self.model, field) and value is not None:
-                        if isinstance(value, list):
-                            query = query.filter(getattr(self.model, field).in_(value))
-                        else:
-                            query = query.filter(getattr(self.model, field) == value)
-            
-            # Apply ordering
-            if order_by:
-                if hasattr(self.model, order_by):
-                    query = query.order_by(getattr(self.model, order_by))
-            
+            query = self._filtered_query(self.db.query(self.model), filters, order_by)
             return query.offset(skip).limit(limit).all()
         except Exception as e:
             logger.error(f"Error getting multiple {self.model.__name__}: {e}")
             return []
     
+    def get_ids(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        filters: Optional[Dict[str, Any]] = None,
+        order_by: Optional[str] = None
+    ) -> List[str]:
+        """Get the IDs of a page of records, filtered and ordered like get_multi."""
+        try:
+            query = self._filtered_query(self.db.query(self.model.id), filters, order_by)
+            return [row.id for row in query.offset(skip).limit(limit).all()]
+        except Exception as e:
+            logger.error(f"Error getting {self.model.__name__} ids: {e}")
+            return []
+    
+    def get_many(self, ids: List[str]) -> List[ModelType]:
+        """Get records by ID with a single IN query."""
+        if not ids:
+            return []
+        try:
+            return self.db.query(self.model).filter(self.model.id.in_(ids)).all()
+        except Exception as e:
+            logger.error(f"Error getting {self.model.__name__} by ids: {e}")
+            return []
+    
+    def iter_batches(self, batch_size: int = 1000) -> Iterator[List[ModelType]]:
+        """
+        Stream every record in primary key order, ``batch_size`` rows at a time.
+        
+        Rows are fetched with a server-side cursor (``yield_per``), so memory
+        stays bounded by one batch however large the table is.
+        """
+        statement = select(self.model).order_by(self.model.id).execution_options(yield_per=batch_size)
+        yield from self.db.scalars(statement).partitions()
+    
+    def _filtered_query(self, query: Query, filters: Optional[Dict[str, Any]], order_by: Optional[str]) -> Query:
+        """Apply get_multi style equality/IN filters and ordering to a query."""
+        # Apply filters
+        if filters:
+            for field, value in filters.items():
+                if hasattr(self.model, field) and value is not None:
+                    if isinstance(value, list):
+                        query = query.filter(getattr(self.model, field).in_(value))
+                    else:
+                        query = query.filter(getattr(self.model, field) == value)
+        
+        # Apply ordering
+        if order_by:
+            if hasattr(self.model, order_by):
+                query = query.order_by(getattr(self.model, order_by))
+        
+        return query
+    
     def create(self, obj_in: Dict[str, Any]) -> Optional[ModelType]:
         """Create a new record."""
         try:
@@ -65,6 +195,7 @@ class BaseRepository(Generic[ModelType]):
             self.db.commit()
             self.db.refresh(db_obj)
             logger.info(f"Created {self.model.__name__} with id {db_obj.id}")
+            self._notify_write(db_obj.id)
             return db_obj
         except Exception as e:
             logger.error(f"Error creating {self.model.__name__}: {e}")
@@ -85,6 +216,7 @@ class BaseRepository(Generic[ModelType]):
             self.db.commit()
             self.db.refresh(db_obj)
             logger.info(f"Updated {self.model.__name__} with id {id}")
+            self._notify_write(id)
             return db_obj
         except Exception as e:
             logger.error(f"Error updating {self.model.__name__} with id {id}: {e}")
@@ -101,6 +233,7 @@ class BaseRepository(Generic[ModelType]):
             self.db.delete(db_obj)
             self.db.commit()
             logger.info(f"Deleted {self.model.__name__} with id {id}")
+            self._notify_write(id)
             return True
         except Exception as e:
             logger.error(f"Error deleting {self.model.__name__} with id {id}: {e}")
@@ -110,18 +243,58 @@ class BaseRepository(Generic[ModelType]):
     def count(self, filters: Optional[Dict[str, Any]] = None) -> int:
         """Get total count of records."""
         try:
-            query = self.db.query(self.model)
+            # Counting the key alone keeps wide columns out of the count query
+            query = self.db.query(func.count(self.model.id))
             
             if filters:
                 for field, value in filters.items():
                     if hasattr(self.model, field) and value is not None:
                         query = query.filter(getattr(self.model, field) == value)
             
-            return query.count()
+            return query.scalar()
+        except Exception as e:
+            logger.error(f"Error counting {self.model.__name__}: {e}")
+            return 0
+    
+    def count_where(self, *criteria: Any) -> int:
+        """Count records matching SQL criteria, e.g. ``Book.series_id.isnot(None)``."""
+        try:
+            return self.db.query(func.count(self.model.id)).filter(*criteria).scalar()
         except Exception as e:
             logger.error(f"Error counting {self.model.__name__}: {e}")
             return 0
     
+    def count_by(self, key: Any, join: Any = None, default: Any = None) -> Dict[Any, int]:
+        """
+        Count records per value of ``key`` with one grouped query.
+        
+        Args:
+            key: Column or expression to group by, e.g. ``Character.species``
+            join: Relationship outer-joined before grouping, e.g. ``Book.world``
+                to group by ``World.name``
+            default: Group for records whose key is NULL
+        """
+        try:
+            query = self.db.query(key, func.count(self.model.id)).select_from(self.model)
+            if join is not None:
+                query = query.outerjoin(join)
+            counts: Dict[Any, int] = {}
+            for value, count in query.group_by(key).all():
+                value = default if value is None else value
+                counts[value] = counts.get(value, 0) + count
+            return counts
+        except Exception as e:
+            logger.error(f"Error counting {self.model.__name__} by {key}: {e}")
+            return {}
+    
+    def count_referenced(self, foreign_key: Any) -> int:
+        """Count records referenced by a foreign key column, e.g. ``Series.world_id``."""
+        try:
+            return self.db.query(func.count(func.distinct(foreign_key))).scalar()
+        except Exception as e:
+            logger.error(f"Error counting {self.model.__name__} referenced by {foreign_key}: {e}")
+            return 0
+    
     def exists(self, id: str) -> bool:
         """Check if a record exists."""
         try:
@@ -3,6 +3,7 @@ Book repository for data access operations.
 """
 from typing import List, Optional
 from sqlalchemy.orm import Session
+from app.core.text import normalize_name
 from app.models.book import Book
 from app.repositories.base import BaseRepository
 
@@ -14,8 +15,8 @@ class BookRepository(BaseRepository[Book]):
         super().__init__(Book, db)
     
     def get_by_title(self, title: str) -> Optional[Book]:
-        """Get book by title."""
-        return self.get_by_field("title", title)
+        """Get book by title (case- and accent-insensitive)."""
+        return self.get_by_field("normalized_title", normalize_name(title))
     
     def get_by_series(self, series_id: str) -> List[Book]:
         """Get books by series."""
@@ -3,7 +3,10 @@ Character repository for data access operations.
 """
 from typing import List, Optional
 from sqlalchemy.orm import Session
+from app.core.text import normalize_name
+from app.models.base import json_array_contains, json_text_ilike
 from app.models.character import Character, CharacterStatus
+from app.models.character_alias import CharacterAlias
 from app.repositories.base import BaseRepository
 
 
@@ -14,12 +17,20 @@ class CharacterRepository(BaseRepository[Character]):
         super().__init__(Character, db)
     
     def get_by_name(self, name: str) -> Optional[Character]:
-        """Get character by name."""
-        return self.get_by_field("name", name)
+        """Get character by name (case- and accent-insensitive)."""
+        return self.get_by_field("normalized_name", normalize_name(name))
     
     def get_by_alias(self, alias: str) -> List[Character]:
-        """Get characters by alias."""
-        return self.db.query(Character).filter(Character.aliases.contains([alias])).all()
+        """Get characters by alias (case- and accent-insensitive)."""
+        return self.db.query(Character).join(Character.alias_entries).filter(
+            CharacterAlias.normalized_alias == normalize_name(alias)
+        ).all()
+    
+    def get_by_affiliation(self, affiliation: str) -> List[Character]:
+        """Get characters by affiliation."""
+        return self.db.query(Character).filter(
+            json_array_contains(Character.affiliations, affiliation, self.dialect_name)
+        ).all()
     
     def get_by_world(self, world_id: str) -> List[Character]:
         """Get characters by world of origin."""
@@ -40,7 +51,7 @@ class CharacterRepository(BaseRepository[Character]):
         
         # Search in aliases
         alias_results = self.db.query(Character).filter(
-            Character.aliases.any(lambda x: search_term.lower() in x.lower())
+            json_text_ilike(Character.aliases, search_term)
         ).all()
         
         # Combine and deduplicate results
@@ -2,7 +2,9 @@
 Magic System repository for data access operations.
 """
 from typing import List, Optional
+from sqlalchemy import func
 from sqlalchemy.orm import Session
+from app.models.character_magic_system import CharacterMagicSystem
 from app.models.magic_system import MagicSystem
 from app.repositories.base import BaseRepository
 
@@ -54,4 +56,8 @@ class MagicSystemRepository(BaseRepository[MagicSystem]):
                 "active_user_count": len([u for u in ms.users if u.is_active])
             })
         
-        return result 
\ No newline at end of file
+        return result 
+    
+    def count_users(self) -> int:
+        """Count character uses of all magic systems."""
+        return self.db.query(func.count(CharacterMagicSystem.id)).scalar()
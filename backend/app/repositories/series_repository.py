@@ -2,7 +2,9 @@
 Series repository for data access operations.
 """
 from typing import List, Optional
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
+from app.models.book import Book
 from app.models.series import Series, SeriesStatus
 from app.repositories.base import BaseRepository
 
@@ -64,4 +66,12 @@ class SeriesRepository(BaseRepository[Series]):
                 "completion_percentage": (len(series.books) / series.planned_books * 100) if series.planned_books else 0
             })
         
-        return summaries 
\ No newline at end of file
+        return summaries 
+    
+    def average_completion(self) -> float:
+        """Average percentage of planned books published, over series with a planned book count."""
+        books = select(Book.series_id, func.count(Book.id).label("books")).group_by(Book.series_id).subquery()
+        average = self.db.query(
+            func.avg(func.coalesce(books.c.books, 0) * 100.0 / Series.planned_books)
+        ).outerjoin(books, books.c.series_id == Series.id).filter(Series.planned_books > 0).scalar()
+        return float(average or 0)
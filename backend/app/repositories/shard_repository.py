@@ -2,8 +2,9 @@
 Shard repository for data access operations.
 """
 from typing import List, Optional
+from sqlalchemy import func
 from sqlalchemy.orm import Session
-from app.models.shard import Shard, ShardStatus
+from app.models.shard import Shard, ShardStatus, ShardVessel
 from app.repositories.base import BaseRepository
 
 
@@ -59,4 +60,8 @@ class ShardRepository(BaseRepository[Shard]):
         return self.db.query(Shard).filter(
             (Shard.current_vessel == vessel_name) |
             (Shard.original_vessel == vessel_name)
-        ).all() 
\ No newline at end of file
+        ).all() 
+    
+    def count_vessels(self) -> int:
+        """Count the vessels of all shards."""
+        return self.db.query(func.count(ShardVessel.id)).scalar()
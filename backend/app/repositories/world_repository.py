@@ -3,6 +3,7 @@ World repository for data access operations.
 """
 from typing import List, Optional
 from sqlalchemy.orm import Session
+from app.core.text import normalize_name
 from app.models.world import World
 from app.repositories.base import BaseRepository
 
@@ -14,8 +15,8 @@ class WorldRepository(BaseRepository[World]):
         super().__init__(World, db)
     
     def get_by_name(self, name: str) -> Optional[World]:
-        """Get world by name."""
-        return self.get_by_field("name", name)
+        """Get world by name (case- and accent-insensitive)."""
+        return self.get_by_field("normalized_name", normalize_name(name))
     
     def get_by_system(self, system: str) -> List[World]:
         """Get worlds by planetary system."""
@@ -2,13 +2,18 @@
 API schemas for request/response models.
 """
 from app.schemas.base import BaseSchema, PaginatedResponse
-from app.schemas.world import WorldCreate, WorldUpdate, WorldResponse, WorldSummary
-from app.schemas.book import BookCreate, BookUpdate, BookResponse, BookSummary
-from app.schemas.character import CharacterCreate, CharacterUpdate, CharacterResponse, CharacterSummary
-from app.schemas.series import SeriesCreate, SeriesUpdate, SeriesResponse, SeriesSummary
-from app.schemas.magic_system import MagicSystemCreate, MagicSystemUpdate, MagicSystemResponse, MagicSystemSummary
+from app.schemas.world import WorldCreate, WorldUpdate, WorldResponse, WorldListItem, WorldSummary
+from app.schemas.book import BookCreate, BookUpdate, BookResponse, BookListItem, BookSummary
+from app.schemas.character import (
+    CharacterCreate, CharacterUpdate, CharacterResponse, CharacterListItem, CharacterSummary
+)
+from app.schemas.series import SeriesCreate, SeriesUpdate, SeriesResponse, SeriesListItem, SeriesSummary
+from app.schemas.magic_system import (
+    MagicSystemCreate, MagicSystemUpdate, MagicSystemResponse, MagicSystemListItem, MagicSystemSummary
+)
 from app.schemas.shard import ShardCreate, ShardUpdate, ShardResponse, ShardSummary
 from app.schemas.search import SearchRequest, SearchResponse, SearchSuggestion
+from app.schemas.batch import BatchRequest, BatchRequestItem, BatchResponse, BatchResponseItem
 
 __all__ = [
     "BaseSchema",
@@ -16,22 +21,27 @@ __all__ = [
     "WorldCreate",
     "WorldUpdate", 
     "WorldResponse",
+    "WorldListItem",
     "WorldSummary",
     "BookCreate",
     "BookUpdate",
     "BookResponse", 
+    "BookListItem",
     "BookSummary",
     "CharacterCreate",
     "CharacterUpdate",
     "CharacterResponse",
+    "CharacterListItem",
     "CharacterSummary",
     "SeriesCreate",
     "SeriesUpdate",
     "SeriesResponse",
+    "SeriesListItem",
     "SeriesSummary",
     "MagicSystemCreate",
     "MagicSystemUpdate",
     "MagicSystemResponse",
+    "MagicSystemListItem",
     "MagicSystemSummary",
     "ShardCreate",
     "ShardUpdate",
@@ -40,4 +50,8 @@ __all__ = [
     "SearchRequest",
     "SearchResponse",
     "SearchSuggestion",
+    "BatchRequest",
+    "BatchRequestItem",
+    "BatchResponse",
+    "BatchResponseItem",
 ]
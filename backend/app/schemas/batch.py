@@ -0,0 +1,38 @@
+"""
+Batch request schemas.
+"""
+from typing import Any, Dict, List, Optional
+from pydantic import Field
+
+from app.schemas.base import BaseSchema
+
+
+class BatchRequestItem(BaseSchema):
+    """Schema for one GET request of a batch."""
+
+    path: str = Field(
+        ...,
+        description="Path relative to the API root, with its query string",
+        example="/characters/kaladin?include=world"
+    )
+    headers: Optional[Dict[str, str]] = Field(None, description="Request headers, e.g. If-None-Match")
+
+
+class BatchRequest(BaseSchema):
+    """Schema for a batch of GET requests."""
+
+    requests: List[BatchRequestItem] = Field(..., description="Requests to run", min_length=1)
+
+
+class BatchResponseItem(BaseSchema):
+    """Schema for the response to one request of a batch."""
+
+    status: int = Field(..., description="HTTP status code")
+    headers: Dict[str, str] = Field(..., description="Response headers")
+    body: Any = Field(None, description="JSON body, text for other content types, null when empty")
+
+
+class BatchResponse(BaseSchema):
+    """Schema for the responses to a batch, in request order."""
+
+    responses: List[BatchResponseItem] = Field(..., description="Responses in request order")
@@ -50,6 +50,21 @@ class BookResponse(BookBase):
     updated_at: datetime = Field(..., description="Last update timestamp")
 
 
+class BookListItem(BaseSchema):
+    """Schema for book list items, without the summary and Cosmere significance."""
+    
+    title: str = Field(..., description="Book title", min_length=1, max_length=255)
+    isbn: Optional[str] = Field(None, description="ISBN", max_length=20)
+    publication_date: Optional[date] = Field(None, description="Publication date")
+    word_count: Optional[int] = Field(None, description="Word count", ge=0)
+    chronological_order: Optional[int] = Field(None, description="Chronological order", ge=0)
+    series_id: Optional[str] = Field(None, description="Series ID", max_length=36)
+    world_id: str = Field(..., description="World ID", max_length=36)
+    id: str = Field(..., description="Book ID")
+    created_at: datetime = Field(..., description="Creation timestamp")
+    updated_at: datetime = Field(..., description="Last update timestamp")
+
+
 class BookSummary(BaseSchema):
     """Schema for book summary with series and world info."""
     
@@ -73,7 +88,9 @@ class BookOverview(BaseSchema):
     standalone_books: int = Field(..., description="Number of standalone books")
     books_with_series: int = Field(..., description="Number of books with series")
     books_by_world: dict = Field(..., description="Books grouped by world")
-    books: List[BookResponse] = Field(..., description="List of books")
+    books: Optional[List[BookListItem]] = Field(
+        None, description="Page of books, embedded only when the overview is requested with a limit"
+    )
 
 
 class ReadingOrder(BaseSchema):
@@ -2,7 +2,7 @@
 Character schemas for API requests and responses.
 """
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, List, Optional
 from pydantic import BaseModel, Field
 
 from app.schemas.base import BaseSchema
@@ -12,15 +12,15 @@ class CharacterBase(BaseSchema):
     """Base character schema with common fields."""
     
     name: str = Field(..., description="Character name", min_length=1, max_length=255)
-    aliases: Optional[str] = Field(None, description="Character aliases as JSON string")
+    aliases: Optional[List[str]] = Field(None, description="Character aliases")
     world_of_origin_id: str = Field(..., description="World of origin ID", max_length=36)
     species: Optional[str] = Field(None, description="Character species", max_length=100)
     status: Optional[str] = Field(None, description="Character status", max_length=50)
     first_appearance_book_id: Optional[str] = Field(None, description="First appearance book ID", max_length=36)
     biography: Optional[str] = Field(None, description="Character biography")
-    magic_abilities: Optional[str] = Field(None, description="Magic abilities as JSON string")
-    affiliations: Optional[str] = Field(None, description="Affiliations as JSON string")
-    cosmere_significance: Optional[str] = Field(None, description="Cosmere significance as JSON string")
+    magic_abilities: Optional[Any] = Field(None, description="Magic abilities")
+    affiliations: Optional[Any] = Field(None, description="Affiliations")
+    cosmere_significance: Optional[Any] = Field(None, description="Cosmere significance")
 
 
 class CharacterCreate(CharacterBase):
@@ -33,15 +33,15 @@ class CharacterUpdate(BaseModel):
     """Schema for updating a character."""
     
     name: Optional[str] = Field(None, description="Character name", min_length=1, max_length=255)
-    aliases: Optional[str] = Field(None, description="Character aliases as JSON string")
+    aliases: Optional[List[str]] = Field(None, description="Character aliases")
     world_of_origin_id: Optional[str] = Field(None, description="World of origin ID", max_length=36)
     species: Optional[str] = Field(None, description="Character species", max_length=100)
     status: Optional[str] = Field(None, description="Character status", max_length=50)
     first_appearance_book_id: Optional[str] = Field(None, description="First appearance book ID", max_length=36)
     biography: Optional[str] = Field(None, description="Character biography")
-    magic_abilities: Optional[str] = Field(None, description="Magic abilities as JSON string")
-    affiliations: Optional[str] = Field(None, description="Affiliations as JSON string")
-    cosmere_significance: Optional[str] = Field(None, description="Cosmere significance as JSON string")
+    magic_abilities: Optional[Any] = Field(None, description="Magic abilities")
+    affiliations: Optional[Any] = Field(None, description="Affiliations")
+    cosmere_significance: Optional[Any] = Field(None, description="Cosmere significance")
 
 
 class CharacterResponse(CharacterBase):
@@ -52,6 +52,23 @@ class CharacterResponse(CharacterBase):
     updated_at: datetime = Field(..., description="Last update timestamp")
 
 
+class CharacterListItem(BaseSchema):
+    """Schema for character list items, without the biography."""
+    
+    name: str = Field(..., description="Character name", min_length=1, max_length=255)
+    aliases: Optional[List[str]] = Field(None, description="Character aliases")
+    world_of_origin_id: str = Field(..., description="World of origin ID", max_length=36)
+    species: Optional[str] = Field(None, description="Character species", max_length=100)
+    status: Optional[str] = Field(None, description="Character status", max_length=50)
+    first_appearance_book_id: Optional[str] = Field(None, description="First appearance book ID", max_length=36)
+    magic_abilities: Optional[Any] = Field(None, description="Magic abilities")
+    affiliations: Optional[Any] = Field(None, description="Affiliations")
+    cosmere_significance: Optional[Any] = Field(None, description="Cosmere significance")
+    id: str = Field(..., description="Character ID")
+    created_at: datetime = Field(..., description="Creation timestamp")
+    updated_at: datetime = Field(..., description="Last update timestamp")
+
+
 class CharacterSummary(BaseSchema):
     """Schema for character summary with relationships."""
     
@@ -76,4 +93,6 @@ class CharacterOverview(BaseSchema):
     characters_by_world: dict = Field(..., description="Characters grouped by world")
     characters_by_species: dict = Field(..., description="Characters grouped by species")
     characters_by_status: dict = Field(..., description="Characters grouped by status")
-    characters: List[CharacterResponse] = Field(..., description="List of characters")
+    characters: Optional[List[CharacterListItem]] = Field(
+        None, description="Page of characters, embedded only when the overview is requested with a limit"
+    )
@@ -2,7 +2,7 @@
 Magic System schemas for API requests and responses.
 """
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, List, Optional
 from pydantic import BaseModel, Field
 
 from app.schemas.base import BaseSchema
@@ -18,7 +18,7 @@ class MagicSystemBase(BaseSchema):
     requirements: Optional[str] = Field(None, description="Requirements to use the magic")
     limitations: Optional[str] = Field(None, description="Limitations of the magic")
     is_investiture_based: bool = Field(True, description="Whether the magic is investiture-based")
-    related_systems: Optional[str] = Field(None, description="Related magic systems")
+    related_systems: Optional[Any] = Field(None, description="Related magic systems")
 
 
 class MagicSystemCreate(MagicSystemBase):
@@ -37,7 +37,7 @@ class MagicSystemUpdate(BaseModel):
     requirements: Optional[str] = Field(None, description="Requirements to use the magic")
     limitations: Optional[str] = Field(None, description="Limitations of the magic")
     is_investiture_based: Optional[bool] = Field(None, description="Whether the magic is investiture-based")
-    related_systems: Optional[str] = Field(None, description="Related magic systems")
+    related_systems: Optional[Any] = Field(None, description="Related magic systems")
 
 
 class MagicSystemResponse(MagicSystemBase):
@@ -48,6 +48,18 @@ class MagicSystemResponse(MagicSystemBase):
     updated_at: datetime = Field(..., description="Last update timestamp")
 
 
+class MagicSystemListItem(BaseSchema):
+    """Schema for magic system list items, without the long text descriptions."""
+    
+    name: str = Field(..., description="Magic system name", min_length=1, max_length=100)
+    world_id: Optional[str] = Field(None, description="World ID", max_length=50)
+    is_investiture_based: bool = Field(True, description="Whether the magic is investiture-based")
+    related_systems: Optional[Any] = Field(None, description="Related magic systems")
+    id: str = Field(..., description="Magic system ID")
+    created_at: datetime = Field(..., description="Creation timestamp")
+    updated_at: datetime = Field(..., description="Last update timestamp")
+
+
 class MagicSystemSummary(BaseSchema):
     """Schema for magic system summary with users."""
     
@@ -66,4 +78,6 @@ class MagicSystemOverview(BaseSchema):
     magic_systems_by_world: dict = Field(..., description="Magic systems grouped by world")
     total_users: int = Field(..., description="Total number of users")
     average_users_per_system: float = Field(..., description="Average users per system")
-    magic_systems: List[MagicSystemResponse] = Field(..., description="List of magic systems") 
\ No newline at end of file
+    magic_systems: Optional[List[MagicSystemListItem]] = Field(
+        None, description="Page of magic systems, embedded only when the overview is requested with a limit"
+    ) 
\ No newline at end of file
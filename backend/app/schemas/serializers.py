@@ -0,0 +1,125 @@
+"""
+Trusted serializers building response bodies straight from rows.
+
+Rows read from our own database already satisfy the response schemas, so hot
+endpoints can skip Pydantic validation: a serializer copies the schema's
+fields off ORM objects or cached dictionaries and the result goes straight to
+orjson. Routes keep their ``response_model``, so OpenAPI is unchanged.
+
+Serializers also apply sparse fieldsets (``?fields=id,name``): only the
+selected fields are read, so columns left unloaded are never touched.
+Compound documents wrap the primary content in ``data`` next to the
+relations an ``?include=`` side-loads.
+"""
+from typing import (
+    Any, Collection, Dict, Iterable, List, Optional, Tuple, Type, Union, get_args, get_origin
+)
+
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+
+from app.schemas.base import PaginatedResponse
+
+
+def _nested_schema(annotation: Any) -> Tuple[Optional[Type[BaseModel]], bool]:
+    """Schema of a field holding a model or a list of models, and whether it is a list."""
+    if get_origin(annotation) is Union:
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) != 1:
+            return None, False
+        annotation = args[0]
+    many = get_origin(annotation) in (list, List)
+    if many:
+        annotation = (get_args(annotation) or (Any,))[0]
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation, many
+    return None, False
+
+
+class TrustedSerializer:
+    """Copies a schema's fields from objects or dictionaries without validating them."""
+
+    def __init__(self, schema: Type[BaseModel]):
+        self.schema = schema
+        self.fields: List[Tuple[str, Any, Optional["TrustedSerializer"], bool]] = []
+        # Sparse fieldsets of a page select the fields of its items
+        self.is_page = issubclass(schema, PaginatedResponse)
+
+    def _compile(self) -> None:
+        for name, field in self.schema.model_fields.items():
+            nested, many = _nested_schema(field.annotation)
+            default = None if field.is_required() else field.get_default(call_default_factory=True)
+            self.fields.append((name, default, serializer_for(nested) if nested else None, many))
+
+    def serialize(self, obj: Any, fields: Optional[Collection[str]] = None) -> Dict[str, Any]:
+        """Build the schema's output for one ORM object or dictionary, optionally only some fields."""
+        if isinstance(obj, dict):
+            get = obj.get
+        else:
+            def get(name, default):
+                return getattr(obj, name, default)
+        selected = self.fields
+        item_fields = None
+        if fields is not None:
+            if self.is_page:
+                item_fields = fields
+            else:
+                selected = [field for field in self.fields if field[0] in fields]
+        result = {}
+        for name, default, nested, many in selected:
+            value = get(name, default)
+            if nested is not None and value is not None:
+                if many:
+                    value = [nested.serialize(item, item_fields) for item in value]
+                else:
+                    value = nested.serialize(value, item_fields)
+            result[name] = value
+        return result
+
+    def serialize_many(self, objs: Iterable[Any], fields: Optional[Collection[str]] = None) -> List[Dict[str, Any]]:
+        return [self.serialize(obj, fields) for obj in objs]
+
+
+_serializers: Dict[Type[BaseModel], TrustedSerializer] = {}
+
+
+def serializer_for(schema: Type[BaseModel]) -> TrustedSerializer:
+    """Trusted serializer of a schema, built once per schema."""
+    serializer = _serializers.get(schema)
+    if serializer is None:
+        # Registered before compiling so self-referencing schemas terminate
+        serializer = _serializers[schema] = TrustedSerializer(schema)
+        serializer._compile()
+    return serializer
+
+
+def serialize(schema: Any, content: Any, fields: Optional[Collection[str]] = None) -> Any:
+    """Trusted content as ``schema`` (a model or ``List[model]``), optionally only some fields."""
+    if get_origin(schema) in (list, List):
+        return serializer_for(get_args(schema)[0]).serialize_many(content, fields)
+    return serializer_for(schema).serialize(content, fields)
+
+
+def trusted_response(schema: Any, content: Any, fields: Optional[Collection[str]] = None,
+                     status_code: int = 200) -> ORJSONResponse:
+    """Response rendering trusted content as ``schema`` (a model or ``List[model]``) without validating it."""
+    return ORJSONResponse(serialize(schema, content, fields), status_code=status_code)
+
+
+def sparse_response(schema: Any, content: Any, fields: Optional[Collection[str]]) -> Any:
+    """Content restricted to a sparse fieldset, or unchanged for response_model validation without one."""
+    if fields is None:
+        return content
+    return trusted_response(schema, content, fields)
+
+
+def compound_response(schema: Any, content: Any, includes: Any,
+                      fields: Optional[Collection[str]] = None) -> ORJSONResponse:
+    """Response with the content under ``data`` and the relations an IncludeResolver side-loads for its rows."""
+    if get_origin(schema) in (list, List):
+        rows = content
+    elif issubclass(schema, PaginatedResponse):
+        rows = content["items"]
+    else:
+        rows = [content]
+    return ORJSONResponse({"data": serialize(schema, content, fields), **includes.resolve(rows)})
@@ -2,7 +2,7 @@
 Series schemas for API requests and responses.
 """
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, List, Optional
 from pydantic import BaseModel, Field
 
 from app.schemas.base import BaseSchema
@@ -17,7 +17,7 @@ class SeriesBase(BaseSchema):
     planned_books: Optional[int] = Field(None, description="Number of planned books", ge=0)
     current_books: int = Field(0, description="Number of current books", ge=0)
     status: str = Field("ongoing", description="Series status")
-    reading_order: Optional[str] = Field(None, description="Reading order information")
+    reading_order: Optional[Any] = Field(None, description="Reading order information")
 
 
 class SeriesCreate(SeriesBase):
@@ -35,7 +35,7 @@ class SeriesUpdate(BaseModel):
     planned_books: Optional[int] = Field(None, description="Number of planned books", ge=0)
     current_books: Optional[int] = Field(None, description="Number of current books", ge=0)
     status: Optional[str] = Field(None, description="Series status")
-    reading_order: Optional[str] = Field(None, description="Reading order information")
+    reading_order: Optional[Any] = Field(None, description="Reading order information")
 
 
 class SeriesResponse(SeriesBase):
@@ -46,6 +46,20 @@ class SeriesResponse(SeriesBase):
     updated_at: datetime = Field(..., description="Last update timestamp")
 
 
+class SeriesListItem(BaseSchema):
+    """Schema for series list items, without the description."""
+    
+    name: str = Field(..., description="Series name", min_length=1, max_length=100)
+    world_id: Optional[str] = Field(None, description="World ID", max_length=50)
+    planned_books: Optional[int] = Field(None, description="Number of planned books", ge=0)
+    current_books: int = Field(0, description="Number of current books", ge=0)
+    status: str = Field("ongoing", description="Series status")
+    reading_order: Optional[Any] = Field(None, description="Reading order information")
+    id: str = Field(..., description="Series ID")
+    created_at: datetime = Field(..., description="Creation timestamp")
+    updated_at: datetime = Field(..., description="Last update timestamp")
+
+
 class SeriesSummary(BaseSchema):
     """Schema for series summary with books."""
     
@@ -64,4 +78,6 @@ class SeriesOverview(BaseSchema):
     completed_series: int = Field(..., description="Number of completed series")
     series_by_world: dict = Field(..., description="Series grouped by world")
     average_completion_percentage: float = Field(..., description="Average completion percentage")
-    series: List[SeriesResponse] = Field(..., description="List of series") 
\ No newline at end of file
+    series: Optional[List[SeriesListItem]] = Field(
+        None, description="Page of series, embedded only when the overview is requested with a limit"
+    ) 
\ No newline at end of file
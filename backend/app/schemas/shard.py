@@ -96,4 +96,6 @@ class ShardOverview(BaseSchema):
     shards_by_status: dict = Field(..., description="Shards grouped by status")
     total_vessels: int = Field(..., description="Total number of vessels")
     average_vessels_per_shard: float = Field(..., description="Average vessels per shard")
-    shards: List[ShardResponse] = Field(..., description="List of shards") 
\ No newline at end of file
+    shards: Optional[List[ShardResponse]] = Field(
+        None, description="Page of shards, embedded only when the overview is requested with a limit"
+    ) 
\ No newline at end of file
@@ -2,7 +2,7 @@
 World schemas for API requests and responses.
 """
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, List, Optional
 from pydantic import BaseModel, Field
 
 from app.schemas.base import BaseSchema
@@ -14,7 +14,7 @@ class WorldBase(BaseSchema):
     name: str = Field(..., description="World name", min_length=1, max_length=255)
     system: Optional[str] = Field(None, description="Planetary system", max_length=255)
     shard_id: Optional[str] = Field(None, description="Shard ID", max_length=36)
-    geography: Optional[str] = Field(None, description="Geography information (JSON)")
+    geography: Optional[Any] = Field(None, description="Geography information")
     culture_notes: Optional[str] = Field(None, description="Cultural notes")
     technology_level: Optional[str] = Field(None, description="Technology level", max_length=100)
 
@@ -31,7 +31,7 @@ class WorldUpdate(BaseModel):
     name: Optional[str] = Field(None, description="World name", min_length=1, max_length=255)
     system: Optional[str] = Field(None, description="Planetary system", max_length=255)
     shard_id: Optional[str] = Field(None, description="Shard ID", max_length=36)
-    geography: Optional[str] = Field(None, description="Geography information (JSON)")
+    geography: Optional[Any] = Field(None, description="Geography information")
     culture_notes: Optional[str] = Field(None, description="Cultural notes")
     technology_level: Optional[str] = Field(None, description="Technology level", max_length=100)
 
@@ -44,6 +44,19 @@ class WorldResponse(WorldBase):
     updated_at: datetime = Field(..., description="Last update timestamp")
 
 
+class WorldListItem(BaseSchema):
+    """Schema for world list items, without the cultural notes."""
+    
+    name: str = Field(..., description="World name", min_length=1, max_length=255)
+    system: Optional[str] = Field(None, description="Planetary system", max_length=255)
+    shard_id: Optional[str] = Field(None, description="Shard ID", max_length=36)
+    geography: Optional[Any] = Field(None, description="Geography information")
+    technology_level: Optional[str] = Field(None, description="Technology level", max_length=100)
+    id: str = Field(..., description="World ID")
+    created_at: datetime = Field(..., description="Creation timestamp")
+    updated_at: datetime = Field(..., description="Last update timestamp")
+
+
 class WorldSummary(BaseSchema):
     """Schema for world summary with statistics."""
     
@@ -64,4 +77,6 @@ class WorldOverview(BaseSchema):
     habitable_worlds: int = Field(..., description="Number of habitable worlds")
     worlds_with_series: int = Field(..., description="Number of worlds with series")
     worlds_with_magic_systems: int = Field(..., description="Number of worlds with magic systems")
-    worlds: List[WorldResponse] = Field(..., description="List of worlds") 
\ No newline at end of file
+    worlds: Optional[List[WorldListItem]] = Field(
+        None, description="Page of worlds, embedded only when the overview is requested with a limit"
+    ) 
\ No newline at end of file
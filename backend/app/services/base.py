@@ -1,15 +1,20 @@
 """
 Base service with common business logic.
 """
-from typing import TypeVar, Generic, Type, List, Optional, Dict, Any
+import time
+from typing import TypeVar, Generic, Type, List, Optional, Dict, Any, Callable
 from sqlalchemy.orm import Session
-from app.repositories.base import BaseRepository
+from app.repositories.base import BaseRepository, summarize
+from app.services.cache_service import cache_service
 import logging
 
 logger = logging.getLogger(__name__)
 
 RepositoryType = TypeVar("RepositoryType", bound=BaseRepository)
 
+# Entity cache variant of records loaded without their long text columns
+SUMMARY_VARIANT = "summary"
+
 
 class BaseService(Generic[RepositoryType]):
     """Base service with common business logic."""
@@ -31,6 +36,74 @@ class BaseService(Generic[RepositoryType]):
         """Get multiple records with pagination and filtering."""
         return self.repository.get_multi(skip=skip, limit=limit, filters=filters, order_by=order_by)
     
+    async def get_many_cached(self, ids: List[str]) -> List[Any]:
+        """
+        Get records by ID as dictionaries, in the given order.
+        
+        Cached records come back from one MGET; only the misses are loaded, with
+        a single IN query, and written back in one pipelined round trip. Summary
+        records (long text left out) are cached apart from whole ones. With a
+        sparse fieldset selected, partially loaded rows are returned instead and
+        the entity cache is bypassed.
+        """
+        if self.repository.selected_columns():
+            # Sparse rows must not be cached as entities; load just their columns
+            found = {obj.id: obj for obj in self.repository.get_many(ids)}
+            return [found[id] for id in ids if id in found]
+        entity_type = self.repository.model.__tablename__
+        variant = SUMMARY_VARIANT if self.repository.summarized() else None
+        found = await cache_service.get_entities(entity_type, ids, variant)
+        missing = [id for id in ids if id not in found]
+        if missing:
+            started = time.perf_counter()
+            loaded = {obj.id: obj.to_dict() for obj in self.repository.get_many(missing)}
+            family = f"entity:{entity_type}:{variant}" if variant else f"entity:{entity_type}"
+            cache_service.metrics.record_compute(family, time.perf_counter() - started, len(missing))
+            await cache_service.set_entities(entity_type, loaded, variant=variant)
+            found.update(loaded)
+        return [found[id] for id in ids if id in found]
+    
+    async def get_multi_cached(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        filters: Optional[Dict[str, Any]] = None,
+        order_by: Optional[str] = None
+    ) -> List[Any]:
+        """Get a page of records like get_multi, resolving the rows through the entity cache."""
+        ids = self.repository.get_ids(skip=skip, limit=limit, filters=filters, order_by=order_by)
+        return await self.get_many_cached(ids)
+    
+    async def get_overview_cached(
+        self,
+        compute_stats: Callable[[RepositoryType], Dict[str, Any]],
+        skip: int = 0,
+        limit: int = 0
+    ) -> Dict[str, Any]:
+        """
+        Get overview statistics, with a page of summary records embedded when ``limit`` is set.
+        
+        The statistics come from the overview statistics cache, refreshed on its
+        own schedule; the page resolves through the entity cache like any list,
+        so it reflects writes immediately. Records are embedded under the table
+        name, e.g. ``characters``. ``compute_stats`` is called with a repository
+        on a session of its own, since a background refresh can outlive the
+        request and its session; it is opened on the request session's bind, so
+        it reads the same database (``get_db`` overrides included).
+        """
+        entity_type = self.repository.model.__tablename__
+        bind = self.repository.db.get_bind()
+        
+        async def compute():
+            with Session(bind=bind, autoflush=False) as db:
+                return compute_stats(type(self.repository)(db))
+        
+        overview = dict(await cache_service.get_or_set_overview_stats(entity_type, compute))
+        if limit:
+            summarize(self.repository.db, self.repository.model)
+            overview[entity_type] = await self.get_multi_cached(skip=skip, limit=limit, order_by="name")
+        return overview
+    
     def create(self, obj_in: Dict[str, Any]) -> Optional[Any]:
         """Create a new record with validation."""
         # Add business logic validation here
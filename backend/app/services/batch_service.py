@@ -0,0 +1,92 @@
+"""
+Batched GET requests.
+
+A batch runs several GET requests through the application itself,
+concurrently, and returns their responses in request order, so a client can
+render a screen from one round trip. Every request goes through the same
+routes, response cache and middleware as if it had been made directly, and
+gets its own database session: sparse fieldsets and summary lists configure
+column loading per session, so requests sharing one would affect each other.
+"""
+import asyncio
+from typing import Any, Dict, List, Optional
+from urllib.parse import unquote
+import logging
+
+import httpx
+import orjson
+
+from app.core.config import settings
+from app.schemas.batch import BatchRequestItem
+from app.services.cache_warmer import WARM_REQUEST_HEADER
+
+logger = logging.getLogger(__name__)
+
+# API paths a batch may not request: nested batches and file downloads
+EXCLUDED_PREFIXES = ("/batch", "/export")
+
+# Response headers describing the encoded body, which is re-encoded in the batch
+DROPPED_HEADERS = {"content-length", "content-encoding", "transfer-encoding"}
+
+# Request headers a client may not set on a batched request
+PROTECTED_HEADERS = {"host", WARM_REQUEST_HEADER}
+
+
+def batch_url(path: str) -> str:
+    """
+    URL of a batched request's path, relative to the API root.
+
+    Raises:
+        ValueError: If the path is not a relative API path a batch may request
+    """
+    if not path.startswith("/") or path.startswith("//") or "://" in path:
+        raise ValueError(f"Batch path '{path}' must be relative to the API root, e.g. /characters/kaladin")
+    # Checked as the router will see it, so percent-encoding cannot hide a segment
+    route = unquote(path.split("?", 1)[0])
+    if "//" in route or "\\" in route or any(segment in (".", "..") for segment in route.split("/")):
+        raise ValueError(f"Batch path '{path}' must not contain empty or dot segments")
+    if any(route == prefix or route.startswith(f"{prefix}/") for prefix in EXCLUDED_PREFIXES):
+        raise ValueError(f"Batch path '{path}' cannot be requested in a batch")
+    return f"{settings.API_V1_STR}{path}"
+
+
+def _request_headers(headers: Optional[Dict[str, str]]) -> Dict[str, str]:
+    """A batched request's headers without the ones only the server may set."""
+    return {name: value for name, value in (headers or {}).items() if name.lower() not in PROTECTED_HEADERS}
+
+
+def _result(response: httpx.Response) -> Dict[str, Any]:
+    """One batched response; JSON bodies are embedded as they are, without re-parsing."""
+    body: Any = None
+    if response.content:
+        if response.headers.get("content-type", "").startswith("application/json"):
+            body = orjson.Fragment(response.content)
+        else:
+            body = response.text
+    headers = {name: value for name, value in response.headers.items() if name not in DROPPED_HEADERS}
+    return {"status": response.status_code, "headers": headers, "body": body}
+
+
+async def run_batch(app: Any, requests: List[BatchRequestItem]) -> List[Dict[str, Any]]:
+    """
+    Run a batch of GET requests through ``app`` and return their responses in order.
+
+    Raises:
+        ValueError: If the batch is too large or a path cannot be requested
+    """
+    if len(requests) > settings.BATCH_MAX_REQUESTS:
+        raise ValueError(f"A batch holds at most {settings.BATCH_MAX_REQUESTS} requests, got {len(requests)}")
+    urls = [batch_url(item.path) for item in requests]
+    semaphore = asyncio.Semaphore(settings.BATCH_CONCURRENCY)
+    # Unhandled errors come back as 500 responses instead of failing the batch
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://localhost") as client:
+        async def run(url: str, item: BatchRequestItem) -> Dict[str, Any]:
+            async with semaphore:
+                response = await client.get(url, headers=_request_headers(item.headers))
+            return _result(response)
+
+        results = await asyncio.gather(*(run(url, item) for url, item in zip(urls, requests)))
+    logger.debug(f"Ran batch of {len(results)} requests")
+    return list(results)
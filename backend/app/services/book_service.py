@@ -1,9 +1,12 @@
 """
 Book service for business logic operations.
 """
+import time
 from typing import List, Optional, Dict, Any
+from app.models import Book, World
 from app.repositories.book_repository import BookRepository
 from app.services.base import BaseService
+from app.services.cache_service import cache_service
 import logging
 
 logger = logging.getLogger(__name__)
@@ -23,6 +26,18 @@ class BookService(BaseService[BookRepository]):
         """Get books by series."""
         return self.repository.get_by_series(series_id)
     
+    async def get_books_by_series_cached(self, series_id: str) -> List[Dict[str, Any]]:
+        """Get books by series as dictionaries, through the books-by-series cache."""
+        if self.repository.selected_columns():
+            return self.get_books_by_series(series_id)
+        books = await cache_service.get_books_by_series(series_id)
+        if books is None:
+            started = time.perf_counter()
+            books = [book.to_dict() for book in self.get_books_by_series(series_id)]
+            cache_service.metrics.record_compute("books:series", time.perf_counter() - started)
+            await cache_service.set_books_by_series(series_id, books)
+        return books
+    
     def get_books_by_world(self, world_id: str) -> List[Any]:
         """Get books by world."""
         return self.repository.get_by_world(world_id)
@@ -47,28 +62,17 @@ class BookService(BaseService[BookRepository]):
         """Get books with series information."""
         return self.repository.get_books_with_series_info()
     
-    def get_books_overview(self) -> Dict[str, Any]:
-        """Get an overview of all books with statistics."""
-        books = self.get_multi()
-        
-        total_books = len(books)
-        standalone_books = len([b for b in books if b.is_standalone])
-        books_with_series = len([b for b in books if b.series_id])
-        
-        # Group by world
-        books_by_world = {}
-        for book in books:
-            world_name = book.world.name if book.world else "Unknown"
-            if world_name not in books_by_world:
-                books_by_world[world_name] = 0
-            books_by_world[world_name] += 1
+    def get_books_overview(self, repository: Optional[BookRepository] = None) -> Dict[str, Any]:
+        """Get an overview of all books with statistics, without the records themselves."""
+        repository = repository or self.repository
+        total_books = repository.count()
+        books_with_series = repository.count_where(Book.series_id.isnot(None))
         
         return {
             "total_books": total_books,
-            "standalone_books": standalone_books,
+            "standalone_books": total_books - books_with_series,
             "books_with_series": books_with_series,
-            "books_by_world": books_by_world,
-            "books": books
+            "books_by_world": repository.count_by(World.name, join=Book.world, default="Unknown")
         }
     
     def get_reading_order(self, series_id: str) -> List[Dict[str, Any]]:
@@ -0,0 +1,143 @@
+"""
+Binary codecs for cache payloads.
+
+Every encoded payload starts with a header byte naming the serializer and
+compression used, so the configured codec can change without flushing Redis:
+values written under an older codec still decode. Header bytes are >= 0x80 and
+therefore never clash with the plain JSON text stored before codecs existed.
+
+Cached misses (404s and empty results) skip serialization altogether and are
+stored as a compact sentinel: a zero byte, the status code and the raw body.
+"""
+import json
+import zlib
+from dataclasses import dataclass
+from typing import Any, Optional
+import logging
+
+import orjson
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Optional codec imports
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+    msgpack = None
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+    zstandard = None
+
+HEADER_FLAG = 0x80
+NEGATIVE_MARKER = 0x00
+
+SERIALIZERS = {"json": 1, "msgpack": 2}
+COMPRESSIONS = {"none": 0, "zlib": 1, "zstd": 2}
+
+
+class CodecError(ValueError):
+    """Raised when a payload cannot be decoded by this process."""
+
+
+@dataclass(frozen=True)
+class NegativeResult:
+    """A cached miss: a 404 or an empty result set, with the response body to answer it with."""
+    status_code: int = 404
+    body: bytes = b""
+
+    def encode(self) -> bytes:
+        return bytes([NEGATIVE_MARKER]) + self.status_code.to_bytes(2, "big") + self.body
+
+    @classmethod
+    def decode(cls, payload: bytes) -> "NegativeResult":
+        return cls(int.from_bytes(payload[1:3], "big"), payload[3:])
+
+
+class CacheCodec:
+    """Serializes cache values with a version header and optional compression."""
+
+    def __init__(self, serializer: str = "json", compression: str = "zlib", threshold: int = 1024):
+        if serializer == "msgpack" and not MSGPACK_AVAILABLE:
+            logger.warning("msgpack not available - falling back to JSON cache codec")
+            serializer = "json"
+        if compression == "zstd" and not ZSTD_AVAILABLE:
+            logger.warning("zstandard not available - falling back to zlib cache compression")
+            compression = "zlib"
+        self.serializer = serializer
+        self.compression = compression
+        self.threshold = threshold
+        self._zstd_compressor = zstandard.ZstdCompressor() if compression == "zstd" else None
+
+    @classmethod
+    def from_settings(cls) -> "CacheCodec":
+        """Codec configured by CACHE_CODEC, CACHE_COMPRESSION and CACHE_COMPRESSION_THRESHOLD."""
+        return cls(settings.CACHE_CODEC, settings.CACHE_COMPRESSION, settings.CACHE_COMPRESSION_THRESHOLD)
+
+    @property
+    def name(self) -> str:
+        return f"{self.serializer}+{self.compression}"
+
+    def encode(self, value: Any) -> bytes:
+        """Encode a value, compressing it when it exceeds the threshold and compression pays off."""
+        if isinstance(value, NegativeResult):
+            return value.encode()
+        data = self._serialize(value)
+        compression = "none"
+        if self.compression != "none" and len(data) > self.threshold:
+            compressed = self._compress(data)
+            if len(compressed) < len(data):
+                data, compression = compressed, self.compression
+        header = HEADER_FLAG | (COMPRESSIONS[compression] << 3) | SERIALIZERS[self.serializer]
+        return bytes([header]) + data
+
+    def decode(self, payload: bytes) -> Any:
+        """Decode a payload written by any codec, including pre-codec plain JSON."""
+        if isinstance(payload, str):
+            payload = payload.encode("utf-8")
+        if payload and payload[0] == NEGATIVE_MARKER:
+            return NegativeResult.decode(payload)
+        if not payload or payload[0] < HEADER_FLAG:
+            return json.loads(payload)
+        header, data = payload[0], payload[1:]
+        compression = (header >> 3) & 0x0F
+        serializer = header & 0x07
+        if compression == COMPRESSIONS["zlib"]:
+            data = zlib.decompress(data)
+        elif compression == COMPRESSIONS["zstd"]:
+            if not ZSTD_AVAILABLE:
+                raise CodecError("zstandard payload but zstandard is not installed")
+            data = zstandard.ZstdDecompressor().decompress(data)
+        elif compression != COMPRESSIONS["none"]:
+            raise CodecError(f"Unknown cache compression {compression}")
+        if serializer == SERIALIZERS["json"]:
+            return orjson.loads(data)
+        if serializer == SERIALIZERS["msgpack"]:
+            if not MSGPACK_AVAILABLE:
+                raise CodecError("msgpack payload but msgpack is not installed")
+            return msgpack.unpackb(data, raw=False)
+        raise CodecError(f"Unknown cache serializer {serializer}")
+
+    def _serialize(self, value: Any) -> bytes:
+        if self.serializer == "msgpack":
+            return msgpack.packb(value, default=str, use_bin_type=True)
+        return orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+    def _compress(self, data: bytes) -> bytes:
+        if self.compression == "zstd":
+            return self._zstd_compressor.compress(data)
+        return zlib.compress(data, 1)
+
+
+def codec_for(name: str, threshold: Optional[int] = None) -> CacheCodec:
+    """Codec from a ``serializer+compression`` name such as ``"msgpack+zstd"``."""
+    serializer, _, compression = name.partition("+")
+    return CacheCodec(serializer, compression or "none",
+                      settings.CACHE_COMPRESSION_THRESHOLD if threshold is None else threshold)
@@ -0,0 +1,157 @@
+"""
+Cache effectiveness metrics per key family.
+
+Keys are named ``cosmere:<family>:<hash>``; the family (``world``,
+``books:series``, ``search``, ``response:get_world``, ...) is what metrics are
+broken down by. Counts are kept in-process for the admin summary, which ranks
+families by the database time their hits saved, and mirrored to Prometheus
+when ``prometheus_client`` is installed.
+"""
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Optional Prometheus import
+try:
+    from prometheus_client import Counter, Gauge, Histogram
+    PROMETHEUS_AVAILABLE = True
+except ImportError:
+    PROMETHEUS_AVAILABLE = False
+
+LATENCY_BUCKETS = (0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+SIZE_BUCKETS = (128, 512, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+# Lookup outcomes
+HIT = "hit"
+MISS = "miss"
+STALE = "stale"
+_RESULT_FIELDS = {HIT: "hits", MISS: "misses", STALE: "stale"}
+
+
+def family_of(key: str) -> str:
+    """Key family of a cache key, e.g. ``"books:series"`` for ``cosmere:books:series:<hash>``."""
+    parts = key.split(":")
+    return ":".join(parts[1:-1]) or key
+
+
+@dataclass
+class FamilyStats:
+    """In-process totals for one key family."""
+    hits: int = 0
+    misses: int = 0
+    stale: int = 0
+    errors: int = 0
+    lookup_seconds: float = 0.0
+    computes: int = 0
+    compute_seconds: float = 0.0
+    writes: int = 0
+    bytes_written: int = 0
+    max_payload: int = 0
+
+    @property
+    def lookups(self) -> int:
+        return self.hits + self.misses + self.stale
+
+    def summary(self) -> Dict[str, Any]:
+        avg_compute = self.compute_seconds / self.computes if self.computes else 0.0
+        served = self.hits + self.stale
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "stale": self.stale,
+            "errors": self.errors,
+            "hit_ratio": round(served / self.lookups, 4) if self.lookups else None,
+            "avg_lookup_ms": round(self.lookup_seconds / self.lookups * 1000, 3) if self.lookups else None,
+            "avg_compute_ms": round(avg_compute * 1000, 3),
+            "avg_payload_bytes": self.bytes_written // self.writes if self.writes else None,
+            "max_payload_bytes": self.max_payload,
+            # Every hit or stale serve skipped one computation of average cost
+            "db_time_saved_seconds": round(served * avg_compute, 3),
+        }
+
+
+class CacheMetrics:
+    """Records cache lookups, computations, payload sizes and errors per key family."""
+
+    def __init__(self):
+        self.families: Dict[str, FamilyStats] = {}
+        self._eviction_sources: Dict[str, Callable[[], int]] = {}
+        if PROMETHEUS_AVAILABLE:
+            self._lookups = Counter("cosmere_cache_lookups_total", "Cache lookups by outcome", ["family", "result"])
+            self._errors = Counter("cosmere_cache_errors_total", "Cache operation errors", ["family"])
+            self._lookup_latency = Histogram(
+                "cosmere_cache_lookup_seconds", "Cache lookup latency", ["family"], buckets=LATENCY_BUCKETS
+            )
+            self._compute_latency = Histogram(
+                "cosmere_cache_compute_seconds", "Time to compute a missed value", ["family"]
+            )
+            self._payload_size = Histogram(
+                "cosmere_cache_payload_bytes", "Encoded size of cached values", ["family"], buckets=SIZE_BUCKETS
+            )
+            self._evictions = Gauge("cosmere_cache_evictions", "Entries evicted from a cache tier", ["tier"])
+
+    def _stats(self, family: str) -> FamilyStats:
+        stats = self.families.get(family)
+        if stats is None:
+            stats = self.families[family] = FamilyStats()
+        return stats
+
+    def record_lookup(self, key: str, result: str, seconds: float) -> None:
+        """Record a lookup of a key as a hit, miss or stale serve."""
+        family = family_of(key)
+        stats = self._stats(family)
+        field = _RESULT_FIELDS[result]
+        setattr(stats, field, getattr(stats, field) + 1)
+        stats.lookup_seconds += seconds
+        if PROMETHEUS_AVAILABLE:
+            self._lookups.labels(family, result).inc()
+            self._lookup_latency.labels(family).observe(seconds)
+
+    def record_compute(self, family: str, seconds: float, count: int = 1) -> None:
+        """Record the time spent computing ``count`` values after misses."""
+        stats = self._stats(family)
+        stats.computes += count
+        stats.compute_seconds += seconds
+        if PROMETHEUS_AVAILABLE:
+            self._compute_latency.labels(family).observe(seconds / max(count, 1))
+
+    def record_write(self, key: str, size: int) -> None:
+        """Record the encoded size of a value written to the cache."""
+        family = family_of(key)
+        stats = self._stats(family)
+        stats.writes += 1
+        stats.bytes_written += size
+        stats.max_payload = max(stats.max_payload, size)
+        if PROMETHEUS_AVAILABLE:
+            self._payload_size.labels(family).observe(size)
+
+    def record_error(self, key: Optional[str] = None) -> None:
+        """Record a failed cache operation."""
+        family = family_of(key) if key else "redis"
+        self._stats(family).errors += 1
+        if PROMETHEUS_AVAILABLE:
+            self._errors.labels(family).inc()
+
+    def track_evictions(self, tier: str, source: Callable[[], int]) -> None:
+        """Report a cache tier's eviction count, read whenever metrics are collected."""
+        self._eviction_sources[tier] = source
+        if PROMETHEUS_AVAILABLE:
+            self._evictions.labels(tier).set_function(source)
+
+    def evictions(self) -> Dict[str, int]:
+        return {tier: source() for tier, source in self._eviction_sources.items()}
+
+    def summary(self) -> List[Dict[str, Any]]:
+        """Per-family totals, ranked by database time saved."""
+        families = [{"family": family, **stats.summary()} for family, stats in self.families.items()]
+        return sorted(families, key=lambda family: family["db_time_saved_seconds"], reverse=True)
+
+    def reset(self) -> None:
+        """Clear the in-process totals; Prometheus counters keep counting."""
+        self.families.clear()
+
+
+# Global cache metrics instance
+cache_metrics = CacheMetrics()
@@ -1,11 +1,27 @@
 """
 Cache service for Redis-based caching.
 """
+import asyncio
 import json
 import hashlib
-from typing import Any, Optional, Dict, List
-from datetime import timedelta
+import math
+import random
+import time
+import uuid
+from collections import Counter
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Optional, Dict, List, Tuple
+from datetime import datetime, timedelta, timezone
 from app.core.config import settings
+from app.core.database import get_db
+from app.models import Book, Character, MagicSystem, Series, Shard, World
+from app.repositories.base import table_state
+from app.services.cache_codec import CacheCodec, NegativeResult
+from app.services.cache_metrics import HIT, MISS, STALE, cache_metrics, family_of
+from app.services.circuit_breaker import CircuitBreaker
+from app.services.local_cache import LocalCache
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 import logging
 
 logger = logging.getLogger(__name__)
@@ -14,9 +30,37 @@ logger = logging.getLogger(__name__)
 try:
     import aioredis
     REDIS_AVAILABLE = True
+    # Errors meaning Redis itself is unreachable, as opposed to a bad command or payload
+    REDIS_FAILURES = (aioredis.exceptions.ConnectionError, aioredis.exceptions.TimeoutError,
+                      OSError, asyncio.TimeoutError)
 except ImportError:
     REDIS_AVAILABLE = False
     aioredis = None
+    REDIS_FAILURES = ()
+
+# Entity types (table names) that cache tags and generation counters refer to
+ENTITY_TYPES = ["worlds", "series", "books", "characters", "magic_systems", "shards"]
+
+# Models of the entity types, whose table states response validators include
+ENTITY_MODELS = {model.__tablename__: model for model in (World, Series, Book, Character, MagicSystem, Shard)}
+
+# Overviews embed statistics across every entity type
+OVERVIEW_TAGS = [f"{entity_type}:*" for entity_type in ENTITY_TYPES]
+
+# Pub/sub channel keeping every worker's local cache coherent
+INVALIDATION_CHANNEL = "cosmere:invalidate"
+
+# Sorted sets ranking requested responses, overall and per resource family
+HOT_KEYS_KEY = "cosmere:hot"
+HOT_KEYS_TTL = 7 * 24 * 3600
+
+# Deletes a lock only if it is still held by the given token
+RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
 
 
 class CacheService:
@@ -26,16 +70,89 @@ class CacheService:
         self.redis_url = settings.REDIS_URL
         self.default_ttl = settings.CACHE_TTL
         self._redis = None
+        self._pool = None
+        self._health_check: Optional[asyncio.Task] = None
+        # Skips Redis entirely while it is down instead of timing out on every call
+        self.breaker = CircuitBreaker(
+            settings.REDIS_CIRCUIT_FAILURE_THRESHOLD, settings.REDIS_CIRCUIT_RESET_TIMEOUT
+        )
+        self.codec = CacheCodec.from_settings()
+        self.instance_id = uuid.uuid4().hex
+        self._listener: Optional[asyncio.Task] = None
+        self._inflight: Dict[str, asyncio.Future] = {}
+        # Requests per (family, path?query) since the last flush to Redis
+        self._hot_keys: Counter = Counter()
+        # Row count and latest update time (ns) per entity type, with when they were read
+        self._table_states: Dict[str, Tuple[int, int]] = {}
+        self._table_checked: Dict[str, float] = {}
+        # In-process first tier; generation and version counters are cached
+        # alongside so hits and validator checks skip Redis entirely
+        self.local: Optional[LocalCache] = None
+        self._local_counters: Optional[LocalCache] = None
+        if settings.CACHE_LOCAL_ENABLED:
+            self.local = LocalCache(settings.CACHE_LOCAL_MAX_ENTRIES, settings.CACHE_LOCAL_TTL)
+            self._local_counters = LocalCache(len(ENTITY_TYPES) * 4, settings.CACHE_LOCAL_TTL)
+        self.metrics = cache_metrics
+        if self.local is not None:
+            self.metrics.track_evictions("local", lambda: self.local.evictions)
     
     async def get_redis(self):
-        """Get Redis connection."""
+        """Get the pooled Redis client, or None while Redis is unavailable or the circuit is open."""
         if not REDIS_AVAILABLE:
             logger.warning("Redis not available - caching disabled")
             return None
+        if not self.breaker.allow():
+            return None
         if self._redis is None:
-            self._redis = aioredis.from_url(self.redis_url)
+            self._pool = aioredis.ConnectionPool.from_url(
+                self.redis_url,
+                max_connections=settings.REDIS_MAX_CONNECTIONS,
+                socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+                socket_connect_timeout=settings.REDIS_SOCKET_CONNECT_TIMEOUT,
+                health_check_interval=settings.REDIS_HEALTH_CHECK_INTERVAL,
+            )
+            self._redis = aioredis.Redis(connection_pool=self._pool)
         return self._redis
     
+    def _record_error(self, error: Exception, key: str = None) -> None:
+        """Count an error, and towards opening the circuit if it means Redis is unreachable."""
+        self.metrics.record_error(key)
+        if isinstance(error, REDIS_FAILURES):
+            was_allowed = self.breaker.allow()
+            self.breaker.record_failure()
+            if was_allowed and not self.breaker.allow():
+                logger.warning(f"Redis circuit opened for {self.breaker.reset_timeout}s after: {error}")
+    
+    async def ping(self) -> bool:
+        """Check Redis health, closing the circuit on success."""
+        if not REDIS_AVAILABLE:
+            return False
+        if self._redis is None and not self.breaker.allow():
+            return False
+        try:
+            # Bypasses the breaker: this is the probe that decides when to close it
+            redis = self._redis
+            if redis is None:
+                redis = await self.get_redis()
+            await asyncio.wait_for(redis.ping(), settings.REDIS_SOCKET_TIMEOUT)
+            self.breaker.record_success()
+            return True
+        except Exception as e:
+            logger.error(f"Redis health check failed: {e}")
+            self._record_error(e)
+            return False
+    
+    async def start_health_checks(self) -> None:
+        """Ping Redis periodically so the circuit closes as soon as Redis is back."""
+        if REDIS_AVAILABLE and self._health_check is None:
+            self._health_check = asyncio.create_task(self._check_health())
+    
+    async def _check_health(self) -> None:
+        while True:
+            await asyncio.sleep(settings.REDIS_HEALTH_CHECK_INTERVAL)
+            if self.breaker.state != CircuitBreaker.OPEN:
+                await self.ping()
+    
     def _generate_key(self, prefix: str, *args, **kwargs) -> str:
         """Generate a cache key from prefix and arguments."""
         # Create a hash of the arguments
@@ -48,45 +165,291 @@ class CacheService:
             key_parts.append(f"{key}:{value}")
         
         key_string = "|".join(key_parts)
-        return f"cosmere:{hashlib.md5(key_string.encode()).hexdigest()}"
+        return f"cosmere:{prefix}:{hashlib.md5(key_string.encode()).hexdigest()}"
+    
+    def _generation_key(self, entity_type: str) -> str:
+        """Key of the generation counter namespacing an entity type's cache keys."""
+        return f"cosmere:gen:{entity_type}"
+    
+    async def _key(self, prefix: str, *args, tags: List[str] = None, **kwargs) -> str:
+        """
+        Generate a cache key namespaced by the generations of the entity types it depends on.
+        
+        Bumping an entity type's generation orphans every key depending on it, so
+        whole-type flushes are O(1); orphaned keys age out through their TTL.
+        """
+        entity_types = sorted({tag.split(":", 1)[0] for tag in tags or []})
+        if entity_types:
+            generations = await self._generations(entity_types)
+            kwargs["generations"] = ",".join(f"{t}@{g}" for t, g in zip(entity_types, generations))
+        return self._generate_key(prefix, *args, **kwargs)
+    
+    async def _generations(self, entity_types: List[str]) -> List[int]:
+        """Current generation of each entity type, from the local tier when known."""
+        if self._local_counters is not None:
+            cached = [self._local_counters.get(f"gen:{t}") for t in entity_types]
+            if all(generation is not None for generation in cached):
+                return cached
+        generations = [0] * len(entity_types)
+        try:
+            redis = await self.get_redis()
+            if redis is not None:
+                values = await redis.mget(*[self._generation_key(t) for t in entity_types])
+                generations = [int(value or 0) for value in values]
+                if self._local_counters is not None:
+                    for entity_type, generation in zip(entity_types, generations):
+                        self._local_counters.set(f"gen:{entity_type}", generation)
+        except Exception as e:
+            logger.error(f"Error reading cache generations: {e}")
+            self._record_error(e)
+        return generations
+    
+    def _version_key(self, entity_type: str) -> str:
+        """Key holding the time of the last write to an entity type, in nanoseconds."""
+        return f"cosmere:version:{entity_type}"
+    
+    async def _versions(self, entity_types: List[str]) -> Optional[List[int]]:
+        """Last write time of each entity type, or None if Redis cannot be reached."""
+        if self._local_counters is not None:
+            cached = [self._local_counters.get(f"version:{t}") for t in entity_types]
+            if all(version is not None for version in cached):
+                return cached
+        try:
+            redis = await self.get_redis()
+            if redis is None:
+                return None
+            keys = [self._version_key(t) for t in entity_types]
+            values = await redis.mget(*keys)
+            if not all(values):
+                # Unknown after a flush: start from now so validators never repeat
+                now = time.time_ns()
+                for key, value in zip(keys, values):
+                    if not value:
+                        await redis.set(key, now, nx=True)
+                values = await redis.mget(*keys)
+            versions = [int(value) for value in values]
+            if self._local_counters is not None:
+                for entity_type, version in zip(entity_types, versions):
+                    self._local_counters.set(f"version:{entity_type}", version)
+            return versions
+        except Exception as e:
+            logger.error(f"Error reading cache versions: {e}")
+            self._record_error(e)
+            return None
     
-    async def get(self, key: str) -> Optional[Any]:
-        """Get a value from cache."""
+    async def table_states(self, entity_types: List[str],
+                           get_session: Callable[[], Iterator[Session]] = get_db) -> Dict[str, Tuple[int, int]]:
+        """
+        Row count and latest update time of each entity type's table.
+        
+        Write versions only advance on repository writes; the table states also
+        catch seed and import scripts, migrations and direct SQL. They are read
+        at most every CACHE_TABLE_CHECK_INTERVAL seconds per process, in the
+        threadpool so the query never blocks the event loop.
+        
+        Args:
+            entity_types: Entity types whose tables to read
+            get_session: ``get_db``-style dependency yielding the session to
+                read with, so requests read through their own (overridable) one
+        """
+        now = time.monotonic()
+        interval = settings.CACHE_TABLE_CHECK_INTERVAL
+        due = [
+            t for t in entity_types
+            if t in ENTITY_MODELS and now - self._table_checked.get(t, -math.inf) >= interval
+        ]
+        if due:
+            try:
+                states = await run_in_threadpool(self._read_table_states, due, get_session)
+            except Exception as e:
+                logger.error(f"Error reading table states: {e}")
+            else:
+                self._table_states.update(states)
+                self._table_checked.update(dict.fromkeys(due, now))
+        return {t: self._table_states[t] for t in entity_types if t in self._table_states}
+    
+    def _read_table_states(self, entity_types: List[str],
+                           get_session: Callable[[], Iterator[Session]]) -> Dict[str, Tuple[int, int]]:
+        """Read table states with one session; blocking, so run off the event loop."""
+        states = {}
+        with contextmanager(get_session)() as db:
+            for entity_type in entity_types:
+                count, updated_at = table_state(db, ENTITY_MODELS[entity_type])
+                stamp = int(updated_at.replace(tzinfo=timezone.utc).timestamp() * 1e9) if updated_at else 0
+                states[entity_type] = (count, stamp)
+        return states
+    
+    def _tables_token(self, states: Dict[str, Tuple[int, int]]) -> str:
+        """Table states as one string for keys and validators."""
+        return ",".join(f"{t}@{states[t][0]}-{states[t][1]}" for t in sorted(states))
+    
+    async def response_validators(self, path: str, query: str, tags: List[str] = None,
+                                  get_session: Callable[[], Iterator[Session]] = get_db) -> Optional[Tuple[str, datetime]]:
+        """
+        Strong ETag and Last-Modified for an API response.
+        
+        Both derive from the last write time and the table state of the entity
+        types the response depends on, so they can be checked without rendering
+        or fetching the body. Table states are read with ``get_session``.
+        """
+        entity_types = sorted({tag.split(":", 1)[0] for tag in tags or []})
+        if not entity_types:
+            return None
+        versions = await self._versions(entity_types)
+        if versions is None:
+            return None
+        states = await self.table_states(entity_types, get_session)
+        state = ",".join(f"{t}@{v}" for t, v in zip(entity_types, versions))
+        state += "|" + self._tables_token(states)
+        etag = f'"{hashlib.md5(f"{path}?{query}|{state}".encode()).hexdigest()}"'
+        modified = max(versions + [stamp for _, stamp in states.values()])
+        last_modified = datetime.fromtimestamp(modified / 1e9, timezone.utc).replace(microsecond=0)
+        return etag, last_modified
+    
+    def entity_tags(self, entity_type: str, entity_id: str) -> List[str]:
+        """Tags invalidated by a write to one entity."""
+        return [f"{entity_type}:{entity_id}", f"{entity_type}:*"]
+    
+    async def get(self, key: str, tags: List[str] = None) -> Optional[Any]:
+        """Get a value from the local tier, falling back to Redis."""
+        started = time.perf_counter()
+        value = await self._lookup(key, tags)
+        self.metrics.record_lookup(key, MISS if value is None else HIT, time.perf_counter() - started)
+        return value
+    
+    async def _lookup(self, key: str, tags: List[str] = None) -> Optional[Any]:
+        if self.local is not None:
+            value = self.local.get(key)
+            if value is not None:
+                return value
         try:
             redis = await self.get_redis()
             if redis is None:
                 return None
             value = await redis.get(key)
+            self.breaker.record_success()
             if value:
-                return json.loads(value)
+                value = self.codec.decode(value)
+                if self.local is not None:
+                    self.local.set(key, value, tags=tags)
+                return value
             return None
         except Exception as e:
             logger.error(f"Error getting from cache: {e}")
+            self._record_error(e, key)
             return None
     
-    async def set(self, key: str, value: Any, ttl: int = None) -> bool:
-        """Set a value in cache."""
+    def _jittered_ttl(self, ttl: int = None) -> int:
+        """Shorten a TTL by a random fraction so keys written together do not expire together."""
+        ttl = ttl or self.default_ttl
+        return max(1, int(ttl * (1 - random.uniform(0, settings.CACHE_TTL_JITTER))))
+    
+    async def set(self, key: str, value: Any, ttl: int = None, tags: List[str] = None, jitter: bool = True) -> bool:
+        """Set a value in cache, optionally registering it under invalidation tags."""
+        ttl = self._jittered_ttl(ttl) if jitter else ttl or self.default_ttl
+        payload = self._store_local(key, value, ttl, tags)
         try:
             redis = await self.get_redis()
             if redis is None:
                 return False
-            ttl = ttl or self.default_ttl
-            await redis.setex(key, ttl, json.dumps(value, default=str))
+            pipe = redis.pipeline(transaction=False)
+            self._pipeline_set(pipe, key, payload, ttl, tags)
+            await pipe.execute()
             return True
         except Exception as e:
             logger.error(f"Error setting cache: {e}")
+            self._record_error(e, key)
             return False
     
+    async def get_many(self, keys: List[str], tags: Dict[str, List[str]] = None) -> List[Optional[Any]]:
+        """Get several values, fetching every local miss from Redis with a single MGET."""
+        started = time.perf_counter()
+        values = await self._lookup_many(keys, tags)
+        # The batch costs one round trip; spread it across its keys
+        seconds = (time.perf_counter() - started) / max(len(keys), 1)
+        for key, value in zip(keys, values):
+            self.metrics.record_lookup(key, MISS if value is None else HIT, seconds)
+        return values
+    
+    async def _lookup_many(self, keys: List[str], tags: Dict[str, List[str]] = None) -> List[Optional[Any]]:
+        values: List[Optional[Any]] = [None] * len(keys)
+        remote = []
+        for index, key in enumerate(keys):
+            value = self.local.get(key) if self.local is not None else None
+            if value is None:
+                remote.append(index)
+            else:
+                values[index] = value
+        if not remote:
+            return values
+        try:
+            redis = await self.get_redis()
+            if redis is None:
+                return values
+            payloads = await redis.mget(*[keys[index] for index in remote])
+            self.breaker.record_success()
+            for index, payload in zip(remote, payloads):
+                if payload:
+                    values[index] = self.codec.decode(payload)
+                    if self.local is not None:
+                        self.local.set(keys[index], values[index], tags=(tags or {}).get(keys[index]))
+        except Exception as e:
+            logger.error(f"Error getting many from cache: {e}")
+            self._record_error(e)
+        return values
+    
+    async def set_many(self, items: Dict[str, Any], ttl: int = None, tags: Dict[str, List[str]] = None) -> bool:
+        """Set several values in one pipelined round trip, with per-key tags."""
+        if not items:
+            return True
+        pending = []
+        for key, value in items.items():
+            key_ttl = self._jittered_ttl(ttl)
+            key_tags = (tags or {}).get(key)
+            pending.append((key, self._store_local(key, value, key_ttl, key_tags), key_ttl, key_tags))
+        try:
+            redis = await self.get_redis()
+            if redis is None:
+                return False
+            pipe = redis.pipeline(transaction=False)
+            for key, payload, key_ttl, key_tags in pending:
+                self._pipeline_set(pipe, key, payload, key_ttl, key_tags)
+            await pipe.execute()
+            return True
+        except Exception as e:
+            logger.error(f"Error setting many in cache: {e}")
+            self._record_error(e)
+            return False
+    
+    def _store_local(self, key: str, value: Any, ttl: int, tags: Optional[List[str]]) -> bytes:
+        """Encode a value, storing it in the local tier as a Redis hit would decode it."""
+        payload = self.codec.encode(value)
+        self.metrics.record_write(key, len(payload))
+        if self.local is not None:
+            self.local.set(key, self.codec.decode(payload), ttl, tags)
+        return payload
+    
+    def _pipeline_set(self, pipe, key: str, payload: bytes, ttl: int, tags: Optional[List[str]]) -> None:
+        pipe.setex(key, ttl, payload)
+        for tag in tags or []:
+            tag_key = self._tag_key(tag)
+            pipe.sadd(tag_key, key)
+            pipe.expire(tag_key, max(ttl, self.default_ttl))
+    
     async def delete(self, key: str) -> bool:
         """Delete a value from cache."""
+        if self.local is not None:
+            self.local.delete(key)
         try:
             redis = await self.get_redis()
             if redis is None:
                 return False
             await redis.delete(key)
+            await self._publish(redis, {"keys": [key]})
             return True
         except Exception as e:
             logger.error(f"Error deleting from cache: {e}")
+            self._record_error(e)
             return False
     
     async def exists(self, key: str) -> bool:
@@ -98,99 +461,509 @@ class CacheService:
             return await redis.exists(key) > 0
         except Exception as e:
             logger.error(f"Error checking cache existence: {e}")
+            self._record_error(e)
             return False
     
-    async def get_or_set(self, key: str, getter_func, ttl: int = None) -> Any:
-        """Get from cache or set if not exists."""
-        # Try to get from cache first
-        cached_value = await self.get(key)
-        if cached_value is not None:
-            return cached_value
+    async def get_or_set(self, key: str, getter_func, ttl: int = None, tags: List[str] = None,
+                         lock: bool = False, stale_ttl: int = None) -> Any:
+        """
+        Get from cache or compute and set, protected against stampedes.
         
-        # If not in cache, get from function and cache it
-        value = await getter_func() if hasattr(getter_func, '__call__') else getter_func
-        await self.set(key, value, ttl)
-        return value
+        Values are stored with their expiry and compute time so a caller can
+        refresh them early with probability rising towards expiry (XFetch).
+        Concurrent callers in this process share a single computation; with
+        ``lock`` a Redis lock also keeps other workers from recomputing at once.
+        With ``stale_ttl`` entries outlive ``ttl`` by that many seconds, during
+        which they are served immediately while a background refresh runs.
+        Keys written here must only be read through get_or_set. A getter
+        returning None is not cached; one returning a NegativeResult is cached
+        for CACHE_NEGATIVE_TTL as a sentinel and returned as is.
+        """
+        started = time.perf_counter()
+        entry = await self._lookup(key, tags)
+        elapsed = time.perf_counter() - started
+        if isinstance(entry, NegativeResult):
+            self.metrics.record_lookup(key, HIT, elapsed)
+            return entry
+        if entry is not None:
+            if time.time() < entry["expires_at"] and not self._should_refresh_early(entry):
+                self.metrics.record_lookup(key, HIT, elapsed)
+                return entry["value"]
+            if stale_ttl:
+                # Stale-while-revalidate: answer now, refresh in the background
+                self.metrics.record_lookup(key, STALE, elapsed)
+                flight = self._refresh(key, getter_func, ttl, tags, lock, entry, stale_ttl)
+                flight.add_done_callback(lambda done: self._log_background_failure(key, done))
+                return entry["value"]
+        
+        self.metrics.record_lookup(key, MISS, elapsed)
+        return await asyncio.shield(self._refresh(key, getter_func, ttl, tags, lock, entry, stale_ttl))
+    
+    def _refresh(self, key: str, getter_func, ttl: Optional[int], tags: Optional[List[str]],
+                 lock: bool, stale: Optional[Dict[str, Any]], stale_ttl: Optional[int]) -> asyncio.Future:
+        """Start recomputing a key, or join the computation already in flight."""
+        flight = self._inflight.get(key)
+        if flight is None:
+            flight = asyncio.ensure_future(self._recompute(key, getter_func, ttl, tags, lock, stale, stale_ttl))
+            self._inflight[key] = flight
+            flight.add_done_callback(lambda done: self._refresh_done(key, done))
+        return flight
+    
+    def _refresh_done(self, key: str, flight: asyncio.Future) -> None:
+        self._inflight.pop(key, None)
+        # Awaiting callers receive the exception; mark it retrieved for the rest
+        if not flight.cancelled():
+            flight.exception()
+    
+    def _log_background_failure(self, key: str, flight: asyncio.Future) -> None:
+        if not flight.cancelled() and flight.exception() is not None:
+            logger.error(f"Error refreshing cache key {key} in the background: {flight.exception()}")
     
-    async def invalidate_pattern(self, pattern: str) -> int:
-        """Invalidate all keys matching a pattern."""
+    def _should_refresh_early(self, entry: Dict[str, Any]) -> bool:
+        """XFetch: recompute before expiry with probability scaled by compute time."""
+        delta = entry.get("delta", 0)
+        gap = -delta * settings.CACHE_XFETCH_BETA * math.log(1 - random.random())
+        return time.time() + gap >= entry.get("expires_at", 0)
+    
+    async def _recompute(self, key: str, getter_func, ttl: Optional[int], tags: Optional[List[str]],
+                         lock: bool, stale: Optional[Dict[str, Any]], stale_ttl: Optional[int]) -> Any:
+        lock_token = None
+        if lock:
+            lock_token = await self._acquire_lock(key)
+            if lock_token is None:
+                # Another worker is recomputing: serve what we have or wait for its result
+                if stale is not None:
+                    return stale["value"]
+                entry = await self._wait_for(key, tags)
+                if isinstance(entry, NegativeResult):
+                    return entry
+                if entry is not None:
+                    return entry["value"]
+        try:
+            started = time.monotonic()
+            value = await getter_func() if hasattr(getter_func, '__call__') else getter_func
+            self.metrics.record_compute(family_of(key), time.monotonic() - started)
+            if isinstance(value, NegativeResult):
+                # Misses are cheap to store and must not outlive a create by much
+                await self.set(key, value, settings.CACHE_NEGATIVE_TTL, tags, jitter=False)
+            elif value is not None:
+                ttl = self._jittered_ttl(ttl)
+                entry = {
+                    "value": value,
+                    "delta": time.monotonic() - started,
+                    "expires_at": time.time() + ttl,
+                }
+                await self.set(key, entry, ttl + (stale_ttl or 0), tags, jitter=False)
+            return value
+        finally:
+            if lock_token is not None:
+                await self._release_lock(key, lock_token)
+    
+    def _lock_key(self, key: str) -> str:
+        return f"cosmere:lock:{key}"
+    
+    async def _acquire_lock(self, key: str) -> Optional[str]:
+        """Try to take the cross-worker recompute lock; returns its token, or None if held elsewhere."""
+        token = uuid.uuid4().hex
+        try:
+            redis = await self.get_redis()
+            if redis is None:
+                return token
+            acquired = await redis.set(
+                self._lock_key(key), token, nx=True, px=int(settings.CACHE_LOCK_TIMEOUT * 1000)
+            )
+            return token if acquired else None
+        except Exception as e:
+            logger.error(f"Error acquiring cache lock: {e}")
+            self._record_error(e)
+            # Without Redis there is nothing to coordinate with
+            return token
+    
+    async def _release_lock(self, key: str, token: str) -> None:
+        try:
+            redis = await self.get_redis()
+            if redis is not None:
+                await redis.eval(RELEASE_LOCK_SCRIPT, 1, self._lock_key(key), token)
+        except Exception as e:
+            logger.error(f"Error releasing cache lock: {e}")
+            self._record_error(e)
+    
+    async def _wait_for(self, key: str, tags: Optional[List[str]]) -> Optional[Dict[str, Any]]:
+        """Poll for a value being computed by another worker, up to the lock timeout."""
+        deadline = time.monotonic() + settings.CACHE_LOCK_TIMEOUT
+        while time.monotonic() < deadline:
+            await asyncio.sleep(0.05)
+            entry = await self._lookup(key, tags)
+            if entry is not None:
+                return entry
+        return None
+    
+    async def invalidate_pattern(self, pattern: str, batch_size: int = 500) -> int:
+        """Invalidate all keys matching a pattern, scanning incrementally instead of blocking on KEYS."""
+        if self.local is not None:
+            self.local.invalidate_pattern(pattern)
         try:
             redis = await self.get_redis()
             if redis is None:
                 return 0
-            keys = await redis.keys(pattern)
-            if keys:
-                await redis.delete(*keys)
-                return len(keys)
-            return 0
+            await self._publish(redis, {"pattern": pattern})
+            deleted = 0
+            batch = []
+            async for key in redis.scan_iter(match=pattern, count=batch_size):
+                batch.append(key)
+                if len(batch) >= batch_size:
+                    deleted += await redis.unlink(*batch)
+                    batch = []
+            if batch:
+                deleted += await redis.unlink(*batch)
+            return deleted
         except Exception as e:
             logger.error(f"Error invalidating cache pattern: {e}")
+            self._record_error(e)
+            return 0
+    
+    def _tag_key(self, tag: str) -> str:
+        """Key of the set holding the cache keys registered under a tag."""
+        return f"cosmere:tag:{tag}"
+    
+    async def invalidate_tags(self, tags: List[str]) -> int:
+        """Invalidate every key registered under any of the given tags."""
+        tags = list(set(tags))
+        if not tags:
+            return 0
+        if self.local is not None:
+            self.local.invalidate_tags(tags)
+        try:
+            redis = await self.get_redis()
+            if redis is None:
+                return 0
+            await self._publish(redis, {"tags": tags})
+            tag_keys = [self._tag_key(tag) for tag in tags]
+            keys = await redis.sunion(*tag_keys)
+            await redis.unlink(*keys, *tag_keys)
+            return len(keys)
+        except Exception as e:
+            logger.error(f"Error invalidating cache tags: {e}")
+            self._record_error(e)
             return 0
     
     async def invalidate_entity(self, entity_type: str, entity_id: str = None) -> int:
-        """Invalidate cache for a specific entity type and optionally entity ID."""
-        pattern = f"cosmere:{entity_type}:*"
+        """
+        Invalidate cache for a specific entity type and optionally entity ID.
+        
+        With an ID, deletes the keys tagged with that entity or with the whole
+        type and returns how many were removed. Without one, bumps the type's
+        generation so every dependent key is orphaned at once and returns 0.
+        """
         if entity_id:
-            pattern = f"cosmere:{entity_type}:{entity_id}:*"
+            return await self.invalidate_tags(self.entity_tags(entity_type, entity_id))
+        try:
+            redis = await self.get_redis()
+            if redis is None:
+                return 0
+            generation = await redis.incr(self._generation_key(entity_type))
+            if self._local_counters is not None:
+                self._local_counters.set(f"gen:{entity_type}", generation)
+            await self._publish(redis, {"generations": {entity_type: generation}})
+        except Exception as e:
+            logger.error(f"Error bumping cache generation for {entity_type}: {e}")
+            self._record_error(e)
+            # Without the shared counter the local tier cannot tell which entries are stale
+            if self.local is not None:
+                self.local.clear()
+                self._local_counters.clear()
+        return 0
+    
+    async def invalidate_writes(self, writes: List[Tuple[str, str]]) -> int:
+        """
+        Invalidate entities that were written and advance their types' versions.
         
-        return await self.invalidate_pattern(pattern)
+        Args:
+            writes: (entity type, entity ID) pairs
+        """
+        if not writes:
+            return 0
+        versions = {entity_type: time.time_ns() for entity_type, _ in writes}
+        if self._local_counters is not None:
+            for entity_type, version in versions.items():
+                self._local_counters.set(f"version:{entity_type}", version)
+        try:
+            redis = await self.get_redis()
+            if redis is not None:
+                pipe = redis.pipeline(transaction=False)
+                for entity_type, version in versions.items():
+                    pipe.set(self._version_key(entity_type), version)
+                await pipe.execute()
+                await self._publish(redis, {"versions": versions})
+        except Exception as e:
+            logger.error(f"Error advancing cache versions: {e}")
+            self._record_error(e)
+        tags = [tag for entity_type, entity_id in writes for tag in self.entity_tags(entity_type, entity_id)]
+        return await self.invalidate_tags(tags)
+    
+    async def _publish(self, redis, message: Dict[str, Any]) -> None:
+        """Broadcast an invalidation to the other workers' local caches."""
+        if self.local is None:
+            return
+        message["origin"] = self.instance_id
+        await redis.publish(INVALIDATION_CHANNEL, json.dumps(message))
+    
+    def _apply_invalidation(self, message: Dict[str, Any]) -> None:
+        """Apply an invalidation broadcast by another worker to the local tier."""
+        if self.local is None or message.get("origin") == self.instance_id:
+            return
+        for key in message.get("keys", []):
+            self.local.delete(key)
+        if message.get("tags"):
+            self.local.invalidate_tags(message["tags"])
+        if message.get("pattern"):
+            self.local.invalidate_pattern(message["pattern"])
+        for entity_type, generation in message.get("generations", {}).items():
+            self._local_counters.set(f"gen:{entity_type}", generation)
+        for entity_type, version in message.get("versions", {}).items():
+            self._local_counters.set(f"version:{entity_type}", version)
+    
+    async def start_invalidation_listener(self) -> None:
+        """Subscribe to invalidations from other workers to keep the local tier coherent."""
+        if self.local is not None and REDIS_AVAILABLE and self._listener is None:
+            self._listener = asyncio.create_task(self._listen_for_invalidations())
+    
+    async def _listen_for_invalidations(self) -> None:
+        while True:
+            client = None
+            try:
+                # Subscriptions idle between messages, so they get their own
+                # connection without the pool's socket timeout
+                client = aioredis.from_url(
+                    self.redis_url,
+                    socket_connect_timeout=settings.REDIS_SOCKET_CONNECT_TIMEOUT,
+                    health_check_interval=settings.REDIS_HEALTH_CHECK_INTERVAL,
+                )
+                pubsub = client.pubsub()
+                await pubsub.subscribe(INVALIDATION_CHANNEL)
+                async for message in pubsub.listen():
+                    if message["type"] == "message":
+                        self._apply_invalidation(json.loads(message["data"]))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Cache invalidation listener error: {e}")
+                # Broadcasts may have been missed while disconnected
+                self.local.clear()
+                self._local_counters.clear()
+                await asyncio.sleep(5)
+            finally:
+                if client is not None:
+                    await client.close()
     
     # Entity-specific cache methods
+    async def _entity_keys(self, entity_type: str, entity_ids: List[str], variant: str = None) -> Dict[str, str]:
+        """Cache keys of single entities, resolving the type's generation once for the batch."""
+        generation = (await self._generations([entity_type]))[0]
+        family = f"entity:{entity_type}:{variant}" if variant else f"entity:{entity_type}"
+        return {
+            entity_id: self._generate_key(family, entity_id, generations=f"{entity_type}@{generation}")
+            for entity_id in entity_ids
+        }
+    
+    async def get_entities(self, entity_type: str, entity_ids: List[str], variant: str = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Get cached entities by ID in one round trip; missing IDs are absent from the result.
+        
+        A ``variant`` (e.g. ``"summary"``) keeps partial representations apart
+        from whole entities.
+        """
+        if not entity_ids:
+            return {}
+        keys = await self._entity_keys(entity_type, entity_ids, variant)
+        tags = {key: [f"{entity_type}:{entity_id}"] for entity_id, key in keys.items()}
+        values = await self.get_many(list(keys.values()), tags)
+        return {entity_id: value for entity_id, value in zip(keys, values) if value is not None}
+    
+    async def set_entities(self, entity_type: str, entities: Dict[str, Dict[str, Any]], ttl: int = None,
+                           variant: str = None) -> bool:
+        """Set entities by ID in one pipelined round trip."""
+        if not entities:
+            return True
+        keys = await self._entity_keys(entity_type, list(entities), variant)
+        return await self.set_many(
+            {keys[entity_id]: data for entity_id, data in entities.items()},
+            ttl,
+            {keys[entity_id]: [f"{entity_type}:{entity_id}"] for entity_id in entities},
+        )
+    
     async def get_world(self, world_id: str) -> Optional[Dict[str, Any]]:
         """Get world from cache."""
-        key = self._generate_key("world", world_id)
-        return await self.get(key)
+        tags = [f"worlds:{world_id}"]
+        key = await self._key("world", world_id, tags=tags)
+        return await self.get(key, tags)
     
     async def set_world(self, world_id: str, world_data: Dict[str, Any], ttl: int = None) -> bool:
         """Set world in cache."""
-        key = self._generate_key("world", world_id)
-        return await self.set(key, world_data, ttl)
+        tags = [f"worlds:{world_id}"]
+        key = await self._key("world", world_id, tags=tags)
+        return await self.set(key, world_data, ttl, tags)
     
     async def get_books_by_series(self, series_id: str) -> Optional[List[Dict[str, Any]]]:
         """Get books by series from cache."""
-        key = self._generate_key("books", "series", series_id)
-        return await self.get(key)
+        tags = ["books:*", f"series:{series_id}"]
+        key = await self._key("books:series", series_id, tags=tags)
+        return await self.get(key, tags)
     
     async def set_books_by_series(self, series_id: str, books_data: List[Dict[str, Any]], ttl: int = None) -> bool:
         """Set books by series in cache."""
-        key = self._generate_key("books", "series", series_id)
-        return await self.set(key, books_data, ttl)
+        tags = ["books:*", f"series:{series_id}"]
+        key = await self._key("books:series", series_id, tags=tags)
+        return await self.set(key, books_data, ttl, tags)
     
     async def get_character_relationships(self, character_id: str) -> Optional[Dict[str, Any]]:
         """Get character relationships from cache."""
-        key = self._generate_key("character", "relationships", character_id)
-        return await self.get(key)
+        tags = ["characters:*"]
+        key = await self._key("character:relationships", character_id, tags=tags)
+        return await self.get(key, tags)
     
     async def set_character_relationships(self, character_id: str, relationships_data: Dict[str, Any], ttl: int = None) -> bool:
         """Set character relationships in cache."""
-        key = self._generate_key("character", "relationships", character_id)
-        return await self.set(key, relationships_data, ttl)
+        tags = ["characters:*"]
+        key = await self._key("character:relationships", character_id, tags=tags)
+        return await self.set(key, relationships_data, ttl, tags)
     
     async def get_search_results(self, search_term: str, entity_type: str = None) -> Optional[Dict[str, Any]]:
         """Get search results from cache."""
-        key = self._generate_key("search", search_term, entity_type=entity_type)
-        return await self.get(key)
+        tags = self._search_tags(entity_type)
+        key = await self._key("search", search_term, tags=tags, entity_type=entity_type)
+        return await self.get(key, tags)
     
     async def set_search_results(self, search_term: str, results: Dict[str, Any], entity_type: str = None, ttl: int = None) -> bool:
         """Set search results in cache."""
-        key = self._generate_key("search", search_term, entity_type=entity_type)
-        return await self.set(key, results, ttl)
+        tags = self._search_tags(entity_type)
+        key = await self._key("search", search_term, tags=tags, entity_type=entity_type)
+        return await self.set(key, results, ttl, tags)
+    
+    def _search_tags(self, entity_type: str = None) -> List[str]:
+        """Search results depend on every row of the searched types."""
+        entity_types = [entity_type] if entity_type in ENTITY_TYPES else ENTITY_TYPES
+        return [f"{t}:*" for t in entity_types]
     
     async def get_overview(self, overview_type: str) -> Optional[Dict[str, Any]]:
         """Get overview data from cache."""
-        key = self._generate_key("overview", overview_type)
-        return await self.get(key)
+        key = await self._key("overview", overview_type, tags=OVERVIEW_TAGS)
+        return await self.get(key, OVERVIEW_TAGS)
     
     async def set_overview(self, overview_type: str, overview_data: Dict[str, Any], ttl: int = None) -> bool:
         """Set overview data in cache."""
-        key = self._generate_key("overview", overview_type)
-        return await self.set(key, overview_data, ttl)
+        key = await self._key("overview", overview_type, tags=OVERVIEW_TAGS)
+        return await self.set(key, overview_data, ttl, OVERVIEW_TAGS)
+    
+    async def get_or_set_overview_stats(self, overview_type: str, getter_func) -> Optional[Dict[str, Any]]:
+        """
+        Get overview statistics, recomputed at most once per OVERVIEW_STATS_TTL.
+        
+        Statistics aggregate whole tables, so they refresh on their own schedule
+        instead of on every write: once expired they are still served while one
+        background refresh runs.
+        """
+        key = self._generate_key("overview:stats", overview_type)
+        return await self.get_or_set(
+            key, getter_func, settings.OVERVIEW_STATS_TTL, lock=True, stale_ttl=settings.CACHE_STALE_TTL
+        )
+    
+    async def response_key(self, path: str, query: str, tags: List[str] = None, family: str = None,
+                           get_session: Callable[[], Iterator[Session]] = get_db) -> str:
+        """
+        Cache key of an API response, in the ``response:<family>`` key family when one is given.
+        
+        Keys include the state of the tables the response depends on, so writes
+        made outside the repositories also retire cached bodies.
+        """
+        entity_types = sorted({tag.split(":", 1)[0] for tag in tags or []})
+        return await self._key(
+            f"response:{family}" if family else "response", path, query, tags=tags,
+            tables=self._tables_token(await self.table_states(entity_types, get_session))
+        )
+    
+    async def get_or_set_response(self, path: str, query: str, render_func, ttl: int = None, tags: List[str] = None,
+                                  stale_ttl: int = None, family: str = None,
+                                  get_session: Callable[[], Iterator[Session]] = get_db) -> Optional[Dict[str, Any]]:
+        """Get a cached API response, rendering it once across concurrent requests and workers on a miss."""
+        key = await self.response_key(path, query, tags, family, get_session)
+        return await self.get_or_set(key, render_func, ttl, tags, lock=True, stale_ttl=stale_ttl)
+    
+    def record_request(self, family: str, path: str, query: str) -> None:
+        """Count a request to a cacheable response; counts reach Redis on flush_hot_keys."""
+        self._hot_keys[(family, f"{path}?{query}" if query else path)] += 1
+    
+    async def flush_hot_keys(self) -> bool:
+        """Add the request counts recorded by this worker to the shared hot key rankings."""
+        if not self._hot_keys:
+            return True
+        counts, self._hot_keys = self._hot_keys, Counter()
+        try:
+            redis = await self.get_redis()
+            if redis is None:
+                return False
+            pipe = redis.pipeline(transaction=False)
+            families = set()
+            for (family, url), count in counts.items():
+                pipe.zincrby(HOT_KEYS_KEY, count, url)
+                pipe.zincrby(f"{HOT_KEYS_KEY}:{family}", count, url)
+                families.add(family)
+            for key in [HOT_KEYS_KEY] + [f"{HOT_KEYS_KEY}:{family}" for family in families]:
+                pipe.expire(key, HOT_KEYS_TTL)
+            await pipe.execute()
+            return True
+        except Exception as e:
+            logger.error(f"Error flushing hot keys: {e}")
+            self._record_error(e)
+            return False
+    
+    async def hot_keys(self, limit: int, family: str = None) -> List[str]:
+        """Most requested response URLs, overall or within one resource family."""
+        if limit <= 0:
+            return []
+        try:
+            redis = await self.get_redis()
+            if redis is None:
+                return []
+            key = f"{HOT_KEYS_KEY}:{family}" if family else HOT_KEYS_KEY
+            urls = await redis.zrevrange(key, 0, limit - 1)
+            return [url.decode() if isinstance(url, bytes) else url for url in urls]
+        except Exception as e:
+            logger.error(f"Error getting hot keys: {e}")
+            self._record_error(e)
+            return []
+    
+    async def metrics_summary(self) -> Dict[str, Any]:
+        """Cache metrics per key family ranked by database time saved, with eviction counts."""
+        evictions: Dict[str, Optional[int]] = self.metrics.evictions()
+        evictions["redis"] = None
+        try:
+            redis = await self.get_redis()
+            if redis is not None:
+                evictions["redis"] = int((await redis.info("stats")).get("evicted_keys", 0))
+        except Exception as e:
+            logger.error(f"Error reading Redis stats: {e}")
+            self._record_error(e)
+        return {
+            "circuit": self.breaker.state,
+            "local_entries": len(self.local) if self.local is not None else None,
+            "evictions": evictions,
+            "families": self.metrics.summary(),
+        }
     
     async def close(self):
-        """Close Redis connection."""
+        """Close Redis connections."""
+        for task in (self._listener, self._health_check):
+            if task is not None:
+                task.cancel()
+        self._listener = None
+        self._health_check = None
         if self._redis:
             await self._redis.close()
             self._redis = None
+        if self._pool is not None:
+            await self._pool.disconnect()
+            self._pool = None
 
 
 # Global cache service instance
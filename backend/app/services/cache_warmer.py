@@ -0,0 +1,124 @@
+"""
+Cache warming for hot endpoints.
+
+After a deploy or a Redis flush the first wave of traffic would otherwise hit a
+cold cache. The warmer requests the configured paths and the most requested
+responses recorded by CachedRoute through the application itself, so entries
+are stored under exactly the keys real requests use, and fills the
+books-by-series cache. It runs once at startup without blocking it and then
+on a schedule.
+"""
+import asyncio
+from typing import Any, Dict, List, Optional
+import logging
+
+import httpx
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.repositories.book_repository import BookRepository
+from app.repositories.series_repository import SeriesRepository
+from app.services.cache_service import cache_service
+
+logger = logging.getLogger(__name__)
+
+# Marks warm requests so they are not counted as traffic
+WARM_REQUEST_HEADER = "x-cache-warmer"
+
+# Upper bound on series whose books are warmed
+MAX_WARM_SERIES = 1000
+
+
+class CacheWarmer:
+    """Warms hot cache entries at startup and on a schedule."""
+
+    def __init__(self):
+        self.app = None
+        self.ready = asyncio.Event()
+        self.last_run: Optional[Dict[str, Any]] = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self, app) -> None:
+        """Start warming in the background; ``ready`` is set once the first run finishes."""
+        self.app = app
+        if not (settings.CACHE_ENABLED and settings.CACHE_WARM_ENABLED):
+            self.ready.set()
+            return
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Cancel scheduled warming."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.warm()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Cache warming failed: {e}")
+            finally:
+                self.ready.set()
+            if settings.CACHE_WARM_INTERVAL <= 0:
+                return
+            await asyncio.sleep(settings.CACHE_WARM_INTERVAL)
+
+    async def warm(self) -> Dict[str, Any]:
+        """Warm the configured paths, the hottest recorded responses and books by series."""
+        await cache_service.flush_hot_keys()
+        urls = await self.warm_urls()
+        failed = await self._warm_urls(urls)
+        series = await self._warm_books_by_series()
+        self.last_run = {"urls": len(urls), "failed": failed, "series": series}
+        logger.info(f"Cache warmed: {self.last_run}")
+        return self.last_run
+
+    async def warm_urls(self) -> List[str]:
+        """Configured paths followed by the most requested characters and responses, without duplicates."""
+        urls = list(settings.CACHE_WARM_PATHS)
+        urls += await cache_service.hot_keys(settings.CACHE_WARM_TOP_CHARACTERS, family="characters")
+        urls += await cache_service.hot_keys(settings.CACHE_WARM_HOT_KEYS)
+        return list(dict.fromkeys(urls))
+
+    async def _warm_urls(self, urls: List[str]) -> List[str]:
+        """Request each URL through the application; returns the URLs that did not answer 200."""
+        semaphore = asyncio.Semaphore(settings.CACHE_WARM_CONCURRENCY)
+        transport = httpx.ASGITransport(app=self.app)
+        failed: List[str] = []
+
+        async with httpx.AsyncClient(transport=transport, base_url="http://localhost",
+                                     headers={WARM_REQUEST_HEADER: "1"}) as client:
+            async def warm_url(url: str) -> None:
+                async with semaphore:
+                    try:
+                        response = await client.get(url)
+                        if response.status_code != 200:
+                            failed.append(url)
+                    except Exception as e:
+                        logger.warning(f"Error warming {url}: {e}")
+                        failed.append(url)
+
+            await asyncio.gather(*(warm_url(url) for url in urls))
+        return failed
+
+    async def _warm_books_by_series(self) -> int:
+        """Refresh the books-by-series cache of every series."""
+        db = SessionLocal()
+        try:
+            books = BookRepository(db)
+            series_ids = SeriesRepository(db).get_ids(limit=MAX_WARM_SERIES)
+            for series_id in series_ids:
+                await cache_service.set_books_by_series(
+                    series_id, [book.to_dict() for book in books.get_by_series(series_id)]
+                )
+            return len(series_ids)
+        finally:
+            db.close()
+
+
+# Global cache warmer instance
+cache_warmer = CacheWarmer()
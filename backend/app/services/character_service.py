@@ -2,6 +2,7 @@
 Character service for business logic operations.
 """
 from typing import List, Optional, Dict, Any
+from app.models import Character, World
 from app.repositories.character_repository import CharacterRepository
 from app.services.base import BaseService
 import logging
@@ -23,6 +24,10 @@ class CharacterService(BaseService[CharacterRepository]):
         """Get characters by alias."""
         return self.repository.get_by_alias(alias)
     
+    def get_characters_by_affiliation(self, affiliation: str) -> List[Any]:
+        """Get characters by affiliation."""
+        return self.repository.get_by_affiliation(affiliation)
+    
     def get_characters_by_world(self, world_id: str) -> List[Any]:
         """Get characters by world of origin."""
         return self.repository.get_by_world(world_id)
@@ -55,42 +60,14 @@ class CharacterService(BaseService[CharacterRepository]):
         """Get characters who are POV characters in any book."""
         return self.repository.get_pov_characters()
     
-    def get_character_overview(self) -> Dict[str, Any]:
-        """Get an overview of all characters with statistics."""
-        characters = self.get_multi()
-        
-        total_characters = len(characters)
-        
-        # Group by world
-        characters_by_world = {}
-        for char in characters:
-            world_name = char.world_of_origin.name if char.world_of_origin else "Unknown"
-            if world_name not in characters_by_world:
-                characters_by_world[world_name] = 0
-            characters_by_world[world_name] += 1
-        
-        # Group by species
-        characters_by_species = {}
-        for char in characters:
-            species = char.species or "Unknown"
-            if species not in characters_by_species:
-                characters_by_species[species] = 0
-            characters_by_species[species] += 1
-        
-        # Group by status
-        characters_by_status = {}
-        for char in characters:
-            status = char.status.value if char.status else "unknown"
-            if status not in characters_by_status:
-                characters_by_status[status] = 0
-            characters_by_status[status] += 1
-        
+    def get_character_overview(self, repository: Optional[CharacterRepository] = None) -> Dict[str, Any]:
+        """Get an overview of all characters with statistics, without the records themselves."""
+        repository = repository or self.repository
         return {
-            "total_characters": total_characters,
-            "characters_by_world": characters_by_world,
-            "characters_by_species": characters_by_species,
-            "characters_by_status": characters_by_status,
-            "characters": characters
+            "total_characters": repository.count(),
+            "characters_by_world": repository.count_by(World.name, join=Character.world_of_origin, default="Unknown"),
+            "characters_by_species": repository.count_by(Character.species, default="Unknown"),
+            "characters_by_status": repository.count_by(Character.status, default="unknown")
         }
     
     def get_character_network(self, character_id: str) -> Optional[Dict[str, Any]]:
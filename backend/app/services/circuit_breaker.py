@@ -0,0 +1,46 @@
+"""
+Circuit breaker guarding calls to an unreliable dependency.
+"""
+import time
+
+
+class CircuitBreaker:
+    """
+    Stops calling a dependency after consecutive failures.
+
+    Closed: calls go through. After ``failure_threshold`` consecutive failures
+    the circuit opens and calls are skipped for ``reset_timeout`` seconds. It
+    then half-opens: calls go through again, the next failure reopens it and
+    a success closes it.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = 0.0
+        self._state = self.CLOSED
+
+    @property
+    def state(self) -> str:
+        if self._state == self.OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+            self._state = self.HALF_OPEN
+        return self._state
+
+    def allow(self) -> bool:
+        """Whether a call may be attempted now."""
+        return self.state != self.OPEN
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self._state = self.CLOSED
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            self._state = self.OPEN
+            self.opened_at = time.monotonic()
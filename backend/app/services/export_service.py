@@ -0,0 +1,192 @@
+"""
+Bulk export of whole entity and junction tables.
+
+Exports stream every row of a table with a server-side cursor and serialize
+it batch by batch, so memory stays constant regardless of table size and a
+full catalog pull is one request instead of thousands of OFFSET pages.
+
+NDJSON is streamed straight from the database. CSV, Parquet and Arrow IPC
+files are built once per dataset version and kept on disk, so repeated
+downloads (and ranged resumes) are served from the file.
+"""
+from typing import Any, Dict, Iterator, List, Tuple, Type
+import csv
+import glob
+import io
+import logging
+import os
+import tempfile
+from datetime import timezone
+
+import orjson
+from sqlalchemy import Boolean, Date, DateTime, Integer
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models import (
+    Book, BookCharacter, Character, CharacterMagicSystem, CharacterRelationship, MagicSystem, Series, Shard, World
+)
+from app.models.base import BaseModel
+from app.models.serializer import row_serializer
+from app.repositories.base import BaseRepository, table_state
+
+logger = logging.getLogger(__name__)
+
+# Optional pyarrow import
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Exportable tables by name
+EXPORT_MODELS: Dict[str, Type[BaseModel]] = {
+    model.__tablename__: model
+    for model in (
+        World, Series, Book, Character, MagicSystem, Shard,
+        BookCharacter, CharacterRelationship, CharacterMagicSystem,
+    )
+}
+
+# File export formats and their media types
+EXPORT_FORMATS = {
+    "csv": "text/csv",
+    "parquet": "application/vnd.apache.parquet",
+    "arrow": "application/vnd.apache.arrow.file",
+}
+
+# Formats written with pyarrow
+COLUMNAR_FORMATS = ("parquet", "arrow")
+
+
+def ndjson_lines(entity_type: str, batch_size: int = None) -> Iterator[bytes]:
+    """
+    Yield a table as newline-delimited JSON, one chunk per batch of rows.
+
+    The export uses its own session, opened when the first chunk is requested
+    and closed once the last row is sent or the client disconnects, so it
+    never outlives the generator that iterates it.
+    """
+    model = EXPORT_MODELS[entity_type]
+    to_dict = row_serializer(model).to_dict
+    rows = 0
+    with SessionLocal() as db:
+        for batch in BaseRepository(model, db).iter_batches(batch_size or settings.EXPORT_BATCH_SIZE):
+            yield b"".join(orjson.dumps(to_dict(row)) + b"\n" for row in batch)
+            rows += len(batch)
+    logger.info(f"Exported {rows} {entity_type} as NDJSON")
+
+
+def dataset_version(entity_type: str) -> str:
+    """
+    Version of a table's contents: its row count and latest update time.
+
+    Computed from the table itself, so writes that bypass the repositories
+    (imports, migrations) still produce a new version.
+    """
+    db = SessionLocal()
+    try:
+        count, updated_at = table_state(db, EXPORT_MODELS[entity_type])
+    finally:
+        db.close()
+    # Stored naive in UTC; timestamp() would otherwise read it as local time
+    stamp = int(updated_at.replace(tzinfo=timezone.utc).timestamp() * 1_000_000) if updated_at else 0
+    return f"{count}-{stamp}"
+
+
+def export_file(entity_type: str, export_format: str) -> Tuple[str, str]:
+    """
+    Path of a table's export in ``export_format`` and its dataset version.
+
+    The file is built on the first request for a version and reused until the
+    table changes; files of older versions are removed once a new one exists.
+
+    Raises:
+        RuntimeError: If the format needs pyarrow and it is not installed
+    """
+    if export_format in COLUMNAR_FORMATS and not PYARROW_AVAILABLE:
+        raise RuntimeError(f"{export_format} export requires pyarrow, which is not installed")
+    version = dataset_version(entity_type)
+    os.makedirs(settings.EXPORT_CACHE_DIR, exist_ok=True)
+    path = os.path.join(settings.EXPORT_CACHE_DIR, f"{entity_type}-{version}.{export_format}")
+    if not os.path.exists(path):
+        _build(entity_type, export_format, path)
+        for stale in glob.glob(os.path.join(settings.EXPORT_CACHE_DIR, f"{entity_type}-*.{export_format}")):
+            if stale != path:
+                try:
+                    os.remove(stale)
+                except OSError as e:
+                    logger.warning(f"Error removing stale export {stale}: {e}")
+    return path, version
+
+
+def _build(entity_type: str, export_format: str, path: str) -> None:
+    """Write a table's export next to ``path`` and move it into place once complete."""
+    model = EXPORT_MODELS[entity_type]
+    fd, partial = tempfile.mkstemp(dir=settings.EXPORT_CACHE_DIR, suffix=".partial")
+    db = SessionLocal()
+    try:
+        batches = BaseRepository(model, db).iter_batches(settings.EXPORT_BATCH_SIZE)
+        with os.fdopen(fd, "wb") as handle:
+            if export_format == "csv":
+                _write_csv(model, batches, handle)
+            else:
+                _write_columnar(model, batches, handle, export_format)
+        # Concurrent builds of one version write identical files; the last rename wins
+        os.replace(partial, path)
+        logger.info(f"Built {export_format} export of {entity_type} at {path}")
+    except BaseException:
+        if os.path.exists(partial):
+            os.remove(partial)
+        raise
+    finally:
+        db.close()
+
+
+def _write_csv(model: Type[BaseModel], batches: Iterator[List[BaseModel]], handle) -> None:
+    # Flat values: enums as their values, JSON as text, dates in ISO format
+    serializer = row_serializer(model, json_text=True)
+    text = io.TextIOWrapper(handle, encoding="utf-8", newline="")
+    writer = csv.writer(text)
+    writer.writerow(serializer.names)
+    for batch in batches:
+        writer.writerows(serializer.values(row) for row in batch)
+    text.flush()
+    text.detach()
+
+
+def _arrow_type(column) -> Any:
+    """Arrow type of a column's flat values."""
+    if isinstance(column.type, Boolean):
+        return pa.bool_()
+    if isinstance(column.type, Integer):
+        return pa.int64()
+    if isinstance(column.type, DateTime):
+        return pa.timestamp("us")
+    if isinstance(column.type, Date):
+        return pa.date32()
+    return pa.string()
+
+
+def _write_columnar(model: Type[BaseModel], batches: Iterator[List[BaseModel]], handle, export_format: str) -> None:
+    # Flat values with dates left to Arrow's own date and timestamp types
+    serializer = row_serializer(model, json_text=True, iso_dates=False)
+    schema = pa.schema([(column.key, _arrow_type(column)) for column in model.__table__.columns])
+    if export_format == "parquet":
+        writer = pq.ParquetWriter(handle, schema)
+    else:
+        writer = pa.ipc.new_file(handle, schema)
+    pending: List[Any] = []
+    pending_rows = 0
+    with writer:
+        for batch in batches:
+            columns = [list(column) for column in zip(*(serializer.values(row) for row in batch))]
+            pending.append(pa.RecordBatch.from_arrays(columns, schema=schema))
+            pending_rows += len(batch)
+            # Batches are grouped so Parquet row groups are not tiny
+            if pending_rows >= settings.EXPORT_ROW_GROUP_SIZE:
+                writer.write_table(pa.Table.from_batches(pending, schema=schema))
+                pending, pending_rows = [], 0
+        if pending:
+            writer.write_table(pa.Table.from_batches(pending, schema=schema))
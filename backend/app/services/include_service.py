@@ -0,0 +1,246 @@
+"""
+Expandable relations for ``?include=series,world,characters.magic_systems``.
+
+Includes are resolved level by level with one batched query per relation:
+to-one relations load their targets by the collected foreign keys, to-many
+relations by the parent ids, joined through the junction table where there is
+one. Related entities come back side-loaded and de-duplicated per entity type,
+next to the ids each parent relates to, so a page renders from one request.
+
+Side-loaded entities are serialized like list items, without internal and
+long text columns, and to-many relations load at most INCLUDE_MAX_RELATED
+entities per parent (the first by id), so one prolific world cannot pull in
+its whole cast.
+"""
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Type
+
+from pydantic import BaseModel as Schema
+from sqlalchemy import func, inspect, select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models import Book, BookCharacter, Character, CharacterMagicSystem, MagicSystem, Series, Shard, World
+from app.models.base import BaseModel
+from app.schemas import (
+    BookListItem, CharacterListItem, MagicSystemListItem, SeriesListItem, ShardResponse, WorldListItem
+)
+from app.schemas.serializers import serializer_for
+
+# Deepest include path accepted, e.g. characters.magic_systems.world
+MAX_INCLUDE_DEPTH = 3
+
+
+@dataclass(frozen=True)
+class Relation:
+    """
+    How a model reaches the entities an include name expands to.
+
+    To-one relations name the parent's ``foreign_key`` column. To-many
+    relations name the ``back_reference`` column pointing at the parent, on
+    the target or, when the relation goes through a ``junction`` model, on the
+    junction, whose ``junction_target`` column then points at the target.
+    """
+    target: Type[BaseModel]
+    foreign_key: Optional[str] = None
+    back_reference: Optional[str] = None
+    junction: Optional[Type[BaseModel]] = None
+    junction_target: Optional[str] = None
+
+
+RELATIONS: Dict[Type[BaseModel], Dict[str, Relation]] = {
+    Book: {
+        "series": Relation(Series, foreign_key="series_id"),
+        "world": Relation(World, foreign_key="world_id"),
+        "characters": Relation(
+            Character, back_reference="book_id", junction=BookCharacter, junction_target="character_id"
+        ),
+    },
+    Character: {
+        "world": Relation(World, foreign_key="world_of_origin_id"),
+        "first_appearance_book": Relation(Book, foreign_key="first_appearance_book_id"),
+        "books": Relation(Book, back_reference="character_id", junction=BookCharacter, junction_target="book_id"),
+        "magic_systems": Relation(
+            MagicSystem, back_reference="character_id", junction=CharacterMagicSystem,
+            junction_target="magic_system_id"
+        ),
+    },
+    Series: {
+        "world": Relation(World, foreign_key="world_id"),
+        "books": Relation(Book, back_reference="series_id"),
+    },
+    World: {
+        "shard": Relation(Shard, foreign_key="shard_id"),
+        "series": Relation(Series, back_reference="world_id"),
+        "books": Relation(Book, back_reference="world_id"),
+        "characters": Relation(Character, back_reference="world_of_origin_id"),
+        "magic_systems": Relation(MagicSystem, back_reference="world_id"),
+    },
+    MagicSystem: {
+        "world": Relation(World, foreign_key="world_id"),
+        "users": Relation(
+            Character, back_reference="magic_system_id", junction=CharacterMagicSystem,
+            junction_target="character_id"
+        ),
+    },
+    Shard: {
+        "worlds": Relation(World, back_reference="shard_id"),
+    },
+}
+
+
+# Schemas side-loaded entities are serialized with
+INCLUDED_SCHEMAS: Dict[Type[BaseModel], Type[Schema]] = {
+    World: WorldListItem,
+    Series: SeriesListItem,
+    Book: BookListItem,
+    Character: CharacterListItem,
+    MagicSystem: MagicSystemListItem,
+    Shard: ShardResponse,
+}
+
+
+def parse_includes(model: Type[BaseModel], include: str) -> Dict[str, dict]:
+    """
+    Parse an include parameter into a tree of relation names.
+
+    Raises:
+        ValueError: If a path names an unknown relation or is nested too deeply
+    """
+    tree: Dict[str, dict] = {}
+    for path in filter(None, (path.strip() for path in include.split(","))):
+        names = path.split(".")
+        if len(names) > MAX_INCLUDE_DEPTH:
+            raise ValueError(f"Include '{path}' is nested deeper than {MAX_INCLUDE_DEPTH} levels")
+        node, current = tree, model
+        for name in names:
+            relation = RELATIONS.get(current, {}).get(name)
+            if relation is None:
+                allowed = ", ".join(RELATIONS.get(current, {})) or "none"
+                raise ValueError(f"Unknown include '{path}': {current.__tablename__} relations are {allowed}")
+            node = node.setdefault(name, {})
+            current = relation.target
+    return tree
+
+
+def include_types(model: Type[BaseModel], include: str) -> List[str]:
+    """Entity types an include parameter side-loads, or none if it is invalid."""
+    try:
+        tree = parse_includes(model, include)
+    except ValueError:
+        return []
+    types: Set[str] = set()
+    pending = [(model, tree)]
+    while pending:
+        current, node = pending.pop()
+        for name, children in node.items():
+            target = RELATIONS[current][name].target
+            types.add(target.__tablename__)
+            pending.append((target, children))
+    return sorted(types)
+
+
+# Marks a field a sparse row does not carry
+_MISSING = object()
+
+
+def _value(row: Any, name: str) -> Any:
+    """A row's field, from a dictionary or from what an ORM object already loaded."""
+    if isinstance(row, dict):
+        return row.get(name, _MISSING)
+    # Never trigger a lazy load for a column a sparse fieldset left out
+    return inspect(row).dict.get(name, _MISSING)
+
+
+class IncludeResolver:
+    """Resolves an include tree for rows of one model with batched queries."""
+
+    def __init__(self, db: Session, model: Type[BaseModel], tree: Dict[str, dict]):
+        self.db = db
+        self.model = model
+        self.tree = tree
+
+    def resolve(self, rows: Iterable[Any]) -> Dict[str, Any]:
+        """
+        Side-load the included relations of ``rows``.
+
+        Returns ``included``, the related entities keyed by entity type, and
+        ``relationships``, mapping each include path to the ids every parent
+        relates to.
+        """
+        included: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        relationships: Dict[str, Dict[str, List[str]]] = {}
+        level = [(self.model, "", list(rows), self.tree)]
+        while level:
+            next_level = []
+            for model, prefix, parents, node in level:
+                for name, children in node.items():
+                    relation = RELATIONS[model][name]
+                    path = f"{prefix}{name}"
+                    targets, links = self._load(model, relation, parents)
+                    relationships[path] = links
+                    serializer = serializer_for(INCLUDED_SCHEMAS[relation.target])
+                    entities = included.setdefault(relation.target.__tablename__, {})
+                    for target in targets:
+                        if target.id not in entities:
+                            entities[target.id] = serializer.serialize(target)
+                    if children:
+                        next_level.append((relation.target, f"{path}.", targets, children))
+            level = next_level
+        return {
+            "included": {entity_type: list(entities.values()) for entity_type, entities in included.items()},
+            "relationships": relationships,
+        }
+
+    def _load(self, model: Type[BaseModel], relation: Relation,
+              parents: List[Any]) -> Tuple[List[BaseModel], Dict[str, List[str]]]:
+        """Targets of ``relation`` for all parents in one query, with the target ids per parent."""
+        target = relation.target
+        links: Dict[str, List[str]] = {}
+        if relation.foreign_key:
+            keys = {_value(parent, "id"): _value(parent, relation.foreign_key) for parent in parents}
+            unloaded = [parent_id for parent_id, key in keys.items() if key is _MISSING]
+            if unloaded:
+                # A sparse fieldset left the foreign key out; fetch just the keys
+                column = getattr(model, relation.foreign_key)
+                keys.update(self.db.query(model.id, column).filter(model.id.in_(unloaded)).all())
+            ids = {key for key in keys.values() if key is not None}
+            targets = self.db.query(target).filter(target.id.in_(ids)).all() if ids else []
+            found = {row.id for row in targets}
+            for parent_id, key in keys.items():
+                links[parent_id] = [key] if key in found else []
+            return targets, links
+
+        parent_ids = [_value(parent, "id") for parent in parents]
+        for parent_id in parent_ids:
+            links[parent_id] = []
+        if not parent_ids:
+            return [], links
+        # Rank each parent's targets by id so at most INCLUDE_MAX_RELATED load per parent
+        if relation.junction is not None:
+            reference = getattr(relation.junction, relation.back_reference)
+            target_id = getattr(relation.junction, relation.junction_target)
+        else:
+            reference = getattr(target, relation.back_reference)
+            target_id = target.id
+        ranked = (
+            select(
+                reference.label("parent_id"),
+                target_id.label("target_id"),
+                func.row_number().over(partition_by=reference, order_by=target_id).label("rank"),
+            )
+            .where(reference.in_(parent_ids))
+            .subquery()
+        )
+        pairs = (
+            self.db.query(ranked.c.parent_id, target)
+            .join(target, target.id == ranked.c.target_id)
+            .filter(ranked.c.rank <= settings.INCLUDE_MAX_RELATED)
+            .order_by(ranked.c.parent_id, ranked.c.rank)
+            .all()
+        )
+        targets: Dict[str, BaseModel] = {}
+        for parent_id, row in pairs:
+            links[parent_id].append(row.id)
+            targets.setdefault(row.id, row)
+        return list(targets.values()), links
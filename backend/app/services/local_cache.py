@@ -0,0 +1,83 @@
+"""
+In-process LRU cache used as the first tier in front of Redis.
+"""
+import fnmatch
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+
+class LocalCache:
+    """Bounded in-process cache with per-entry TTL, LRU eviction and tag tracking."""
+
+    def __init__(self, max_entries: int = 1024, ttl: int = 30):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.evictions = 0
+        self._entries: "OrderedDict[str, Tuple[float, Any, Tuple[str, ...]]]" = OrderedDict()
+        self._tag_index: Dict[str, Set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get a live value, marking it as recently used."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value, _ = entry
+        if expires_at <= time.monotonic():
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: Any, ttl: int = None, tags: List[str] = None) -> None:
+        """Store a value for at most the local TTL, evicting the least recently used entries."""
+        if key in self._entries:
+            self._remove(key)
+        ttl = min(ttl or self.ttl, self.ttl)
+        tags = tuple(tags or ())
+        self._entries[key] = (time.monotonic() + ttl, value, tags)
+        for tag in tags:
+            self._tag_index.setdefault(tag, set()).add(key)
+        while len(self._entries) > self.max_entries:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    def delete(self, key: str) -> bool:
+        """Remove a key."""
+        if key not in self._entries:
+            return False
+        self._remove(key)
+        return True
+
+    def invalidate_tags(self, tags: List[str]) -> int:
+        """Remove every key registered under any of the given tags."""
+        keys = set()
+        for tag in tags:
+            keys |= self._tag_index.get(tag, set())
+        for key in keys:
+            self._remove(key)
+        return len(keys)
+
+    def invalidate_pattern(self, pattern: str) -> int:
+        """Remove every key matching a glob-style pattern."""
+        keys = [key for key in self._entries if fnmatch.fnmatchcase(key, pattern)]
+        for key in keys:
+            self._remove(key)
+        return len(keys)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        self._entries.clear()
+        self._tag_index.clear()
+
+    def _remove(self, key: str) -> None:
+        _, _, tags = self._entries.pop(key)
+        for tag in tags:
+            keys = self._tag_index.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tag_index[tag]
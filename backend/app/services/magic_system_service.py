@@ -2,6 +2,7 @@
 Magic System service for business logic operations.
 """
 from typing import List, Optional, Dict, Any
+from app.models import MagicSystem, World
 from app.repositories.magic_system_repository import MagicSystemRepository
 from app.services.base import BaseService
 import logging
@@ -39,31 +40,18 @@ class MagicSystemService(BaseService[MagicSystemRepository]):
         """Get all magic systems for a world with user counts."""
         return self.repository.get_magic_systems_by_world(world_id)
     
-    def get_magic_systems_overview(self) -> Dict[str, Any]:
-        """Get an overview of all magic systems with statistics."""
-        magic_systems = self.get_multi()
-        
-        total_magic_systems = len(magic_systems)
-        investiture_based = len([ms for ms in magic_systems if ms.is_investiture_based])
-        
-        # Group by world
-        magic_systems_by_world = {}
-        for ms in magic_systems:
-            world_name = ms.world.name if ms.world else "Unknown"
-            if world_name not in magic_systems_by_world:
-                magic_systems_by_world[world_name] = 0
-            magic_systems_by_world[world_name] += 1
-        
-        # Calculate average users per magic system
-        total_users = sum(len(ms.users) for ms in magic_systems)
-        avg_users = total_users / total_magic_systems if total_magic_systems > 0 else 0
+    def get_magic_systems_overview(self, repository: Optional[MagicSystemRepository] = None) -> Dict[str, Any]:
+        """Get an overview of all magic systems with statistics, without the records themselves."""
+        repository = repository or self.repository
+        total_magic_systems = repository.count()
+        investiture_based = repository.count_where(MagicSystem.is_investiture_based.is_(True))
+        total_users = repository.count_users()
         
         return {
             "total_magic_systems": total_magic_systems,
             "investiture_based": investiture_based,
             "non_investiture_based": total_magic_systems - investiture_based,
-            "magic_systems_by_world": magic_systems_by_world,
+            "magic_systems_by_world": repository.count_by(World.name, join=MagicSystem.world, default="Unknown"),
             "total_users": total_users,
-            "average_users_per_system": avg_users,
-            "magic_systems": magic_systems
-        } 
\ No newline at end of file
+            "average_users_per_system": total_users / total_magic_systems if total_magic_systems > 0 else 0
+        }
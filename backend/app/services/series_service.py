@@ -2,6 +2,8 @@
 Series service for business logic operations.
 """
 from typing import List, Optional, Dict, Any
+from app.models import Series, World
+from app.models.series import SeriesStatus
 from app.repositories.series_repository import SeriesRepository
 from app.services.base import BaseService
 import logging
@@ -47,36 +49,13 @@ class SeriesService(BaseService[SeriesRepository]):
         """Get summary of all series with book counts."""
         return self.repository.get_series_summary()
     
-    def get_series_overview(self) -> Dict[str, Any]:
-        """Get an overview of all series with statistics."""
-        series_list = self.get_multi()
-        
-        total_series = len(series_list)
-        ongoing_series = len([s for s in series_list if s.status.value == "ongoing"])
-        completed_series = len([s for s in series_list if s.status.value == "complete"])
-        
-        # Group by world
-        series_by_world = {}
-        for series in series_list:
-            world_name = series.world.name if series.world else "Unknown"
-            if world_name not in series_by_world:
-                series_by_world[world_name] = 0
-            series_by_world[world_name] += 1
-        
-        # Calculate average completion percentage
-        completion_percentages = []
-        for series in series_list:
-            if series.planned_books and series.planned_books > 0:
-                completion = (len(series.books) / series.planned_books) * 100
-                completion_percentages.append(completion)
-        
-        avg_completion = sum(completion_percentages) / len(completion_percentages) if completion_percentages else 0
-        
+    def get_series_overview(self, repository: Optional[SeriesRepository] = None) -> Dict[str, Any]:
+        """Get an overview of all series with statistics, without the records themselves."""
+        repository = repository or self.repository
         return {
-            "total_series": total_series,
-            "ongoing_series": ongoing_series,
-            "completed_series": completed_series,
-            "series_by_world": series_by_world,
-            "average_completion_percentage": avg_completion,
-            "series": series_list
-        } 
\ No newline at end of file
+            "total_series": repository.count(),
+            "ongoing_series": repository.count_where(Series.status == SeriesStatus.ONGOING),
+            "completed_series": repository.count_where(Series.status == SeriesStatus.COMPLETE),
+            "series_by_world": repository.count_by(World.name, join=Series.world, default="Unknown"),
+            "average_completion_percentage": repository.average_completion()
+        }
@@ -2,6 +2,7 @@
 Shard service for business logic operations.
 """
 from typing import List, Optional, Dict, Any
+from app.models.shard import Shard, ShardStatus
 from app.repositories.shard_repository import ShardRepository
 from app.services.base import BaseService
 import logging
@@ -51,34 +52,22 @@ class ShardService(BaseService[ShardRepository]):
         """Get shards by vessel name."""
         return self.repository.get_shards_by_vessel(vessel_name)
     
-    def get_shards_overview(self) -> Dict[str, Any]:
-        """Get an overview of all shards with statistics."""
-        shards = self.get_multi()
-        
-        total_shards = len(shards)
-        whole_shards = len([s for s in shards if s.status.value == "whole"])
-        splintered_shards = len([s for s in shards if s.status.value == "splintered"])
-        combined_shards = len([s for s in shards if s.is_combined])
-        
-        # Group by status
-        shards_by_status = {}
-        for shard in shards:
-            status = shard.status.value
-            if status not in shards_by_status:
-                shards_by_status[status] = 0
-            shards_by_status[status] += 1
-        
-        # Calculate vessels statistics
-        total_vessels = sum(len(shard.vessels) for shard in shards)
-        avg_vessels = total_vessels / total_shards if total_shards > 0 else 0
+    def get_shards_overview(self, repository: Optional[ShardRepository] = None) -> Dict[str, Any]:
+        """Get an overview of all shards with statistics, without the records themselves."""
+        repository = repository or self.repository
+        total_shards = repository.count()
+        shards_by_status = {
+            status.value: count
+            for status, count in repository.count_by(Shard.status, default=ShardStatus.UNKNOWN).items()
+        }
+        total_vessels = repository.count_vessels()
         
         return {
             "total_shards": total_shards,
-            "whole_shards": whole_shards,
-            "splintered_shards": splintered_shards,
-            "combined_shards": combined_shards,
+            "whole_shards": shards_by_status.get(ShardStatus.WHOLE.value, 0),
+            "splintered_shards": shards_by_status.get(ShardStatus.SPLINTERED.value, 0),
+            "combined_shards": repository.count_where(Shard.is_combined.is_(True)),
             "shards_by_status": shards_by_status,
             "total_vessels": total_vessels,
-            "average_vessels_per_shard": avg_vessels,
-            "shards": shards
-        } 
\ No newline at end of file
+            "average_vessels_per_shard": total_vessels / total_shards if total_shards > 0 else 0
+        }
@@ -2,6 +2,7 @@
 World service for business logic operations.
 """
 from typing import List, Optional, Dict, Any
+from app.models import MagicSystem, Series
 from app.repositories.world_repository import WorldRepository
 from app.services.base import BaseService
 import logging
@@ -63,19 +64,12 @@ class WorldService(BaseService[WorldRepository]):
             "has_characters": len(world.characters) > 0
         }
     
-    def get_worlds_overview(self) -> Dict[str, Any]:
-        """Get an overview of all worlds with statistics."""
-        worlds = self.get_multi()
-        
-        total_worlds = len(worlds)
-        habitable_worlds = len([w for w in worlds if w.is_habitable])
-        worlds_with_series = len([w for w in worlds if w.series])
-        worlds_with_magic = len([w for w in worlds if w.magic_systems])
-        
+    def get_worlds_overview(self, repository: Optional[WorldRepository] = None) -> Dict[str, Any]:
+        """Get an overview of all worlds with statistics, without the records themselves."""
+        repository = repository or self.repository
         return {
-            "total_worlds": total_worlds,
-            "habitable_worlds": habitable_worlds,
-            "worlds_with_series": worlds_with_series,
-            "worlds_with_magic_systems": worlds_with_magic,
-            "worlds": worlds
-        } 
\ No newline at end of file
+            "total_worlds": repository.count(),
+            "habitable_worlds": repository.count({"is_habitable": True}),
+            "worlds_with_series": repository.count_referenced(Series.world_id),
+            "worlds_with_magic_systems": repository.count_referenced(MagicSystem.world_id)
+        }
@@ -11,7 +11,8 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 # Import all models to ensure they are registered with SQLAlchemy
 from app.models import (
     Base, World, Series, Book, Character, MagicSystem, Shard,
-    CharacterRelationship, BookCharacter, CharacterMagicSystem, ShardVessel
+    CharacterRelationship, BookCharacter, CharacterMagicSystem, ShardVessel,
+    CharacterAlias
 )
 from app.core.config import settings
 
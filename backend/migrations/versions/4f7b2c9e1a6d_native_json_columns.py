@@ -0,0 +1,87 @@
+"""Convert JSON text columns to native JSONB with GIN indexes
+
+Revision ID: 4f7b2c9e1a6d
+Revises: 53dd8bdda1c5
+Create Date: 2026-10-19 09:12:41.203114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4f7b2c9e1a6d'
+down_revision: Union[str, Sequence[str], None] = '53dd8bdda1c5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+JSON_COLUMNS = [
+    ('characters', 'aliases'),
+    ('characters', 'magic_abilities'),
+    ('characters', 'affiliations'),
+    ('characters', 'cosmere_significance'),
+    ('magic_systems', 'related_systems'),
+    ('series', 'reading_order'),
+    ('worlds', 'geography'),
+]
+
+GIN_INDEXES = [
+    ('ix_characters_aliases_gin', 'characters', 'aliases'),
+    ('ix_characters_affiliations_gin', 'characters', 'affiliations'),
+    ('ix_characters_magic_abilities_gin', 'characters', 'magic_abilities'),
+]
+
+
+def _existing_columns(bind):
+    """Return the (table, column) pairs from JSON_COLUMNS present in the database."""
+    inspector = sa.inspect(bind)
+    existing = set()
+    for table in {table for table, _ in JSON_COLUMNS}:
+        if inspector.has_table(table):
+            existing.update((table, col['name']) for col in inspector.get_columns(table))
+    return [pair for pair in JSON_COLUMNS if pair in existing]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        # SQLite stores JSON as TEXT, so the existing data is already compatible
+        return
+
+    columns = _existing_columns(bind)
+    for table, column in columns:
+        op.alter_column(
+            table, column,
+            existing_type=sa.Text(),
+            type_=postgresql.JSONB(),
+            postgresql_using=f"NULLIF({column}, '')::jsonb",
+        )
+
+    for name, table, column in GIN_INDEXES:
+        if (table, column) in columns:
+            op.create_index(name, table, [column], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        return
+
+    columns = _existing_columns(bind)
+    for name, table, column in GIN_INDEXES:
+        if (table, column) in columns:
+            op.drop_index(name, table_name=table)
+
+    for table, column in columns:
+        op.alter_column(
+            table, column,
+            existing_type=postgresql.JSONB(),
+            type_=sa.Text(),
+            postgresql_using=f"{column}::text",
+        )
@@ -0,0 +1,99 @@
+"""Add character_aliases lookup table and normalized name columns
+
+Revision ID: 9c3e5a7d2b18
+Revises: 4f7b2c9e1a6d
+Create Date: 2026-10-19 10:03:17.558902
+
+"""
+import json
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.core.text import normalize_name
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9c3e5a7d2b18'
+down_revision: Union[str, Sequence[str], None] = '4f7b2c9e1a6d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+NORMALIZED_COLUMNS = [
+    ('characters', 'name', 'normalized_name'),
+    ('worlds', 'name', 'normalized_name'),
+    ('books', 'title', 'normalized_title'),
+]
+
+
+def _decode_aliases(value):
+    """Aliases may still be JSON text on databases that skipped the JSONB migration."""
+    if isinstance(value, str):
+        try:
+            value = json.loads(value)
+        except ValueError:
+            return []
+    return value if isinstance(value, list) else []
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('character_aliases',
+    sa.Column('normalized_alias', sa.String(length=255), nullable=False),
+    sa.Column('character_id', sa.String(length=36), nullable=False),
+    sa.Column('alias', sa.String(length=255), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['character_id'], ['characters.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('normalized_alias', 'character_id')
+    )
+    op.create_index(op.f('ix_character_aliases_character_id'), 'character_aliases', ['character_id'], unique=False)
+
+    for table, source, target in NORMALIZED_COLUMNS:
+        op.add_column(table, sa.Column(target, sa.String(length=255), nullable=True))
+
+    # Backfill with the same normalization the models apply on write
+    bind = op.get_bind()
+    for table, source, target in NORMALIZED_COLUMNS:
+        rows = bind.execute(sa.text(f"SELECT id, {source} FROM {table}")).fetchall()
+        for row_id, value in rows:
+            bind.execute(
+                sa.text(f"UPDATE {table} SET {target} = :normalized WHERE id = :id"),
+                {"normalized": normalize_name(value), "id": row_id},
+            )
+
+    alias_rows = []
+    for character_id, aliases in bind.execute(sa.text("SELECT id, aliases FROM characters")).fetchall():
+        seen = set()
+        for alias in _decode_aliases(aliases):
+            normalized = normalize_name(alias) if isinstance(alias, str) else None
+            if normalized and normalized not in seen:
+                seen.add(normalized)
+                alias_rows.append({
+                    "normalized_alias": normalized,
+                    "character_id": character_id,
+                    "alias": alias,
+                })
+    if alias_rows:
+        bind.execute(
+            sa.text(
+                "INSERT INTO character_aliases (normalized_alias, character_id, alias, created_at, updated_at) "
+                "VALUES (:normalized_alias, :character_id, :alias, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)"
+            ),
+            alias_rows,
+        )
+
+    # Not unique: names that differ only by case or accents are distinct rows
+    for table, source, target in NORMALIZED_COLUMNS:
+        op.create_index(op.f(f'ix_{table}_{target}'), table, [target], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, source, target in NORMALIZED_COLUMNS:
+        op.drop_index(op.f(f'ix_{table}_{target}'), table_name=table)
+        op.drop_column(table, target)
+    op.drop_index(op.f('ix_character_aliases_character_id'), table_name='character_aliases')
+    op.drop_table('character_aliases')
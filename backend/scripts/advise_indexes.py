@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Index advisor for recorded query shapes.
+
+Reads the shapes captured with QUERY_RECORDER_ENABLED=true, runs EXPLAIN on the
+hottest ones and writes an Alembic migration stub proposing composite indexes
+for filter/order column combinations that no existing index covers.
+
+Usage:
+    python scripts/advise_indexes.py [shapes.json] [--top N] [--write]
+"""
+import argparse
+import os
+import re
+import sys
+import uuid
+from datetime import datetime
+from typing import Dict, List, Tuple
+
+# Add the app directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import inspect
+from app.core.config import settings
+from app.core.database import engine
+from app.core.query_recorder import QueryRecorder
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_EQUALITY = re.compile(r"\b(\w+)\.(\w+) (?:=|IN\b|IS\b)", re.IGNORECASE)
+_ORDER_BY = re.compile(r"\bORDER BY (.+?)(?: LIMIT\b| OFFSET\b|$)", re.IGNORECASE)
+_COLUMN = re.compile(r"\b(\w+)\.(\w+)")
+
+
+def load_top_shapes(path: str, limit: int) -> List[dict]:
+    """Load a recorder dump and return the top shapes by cumulative time."""
+    recorder = QueryRecorder()
+    recorder.load(path)
+    shapes = [s for s in recorder.top_shapes() if s["shape"].upper().startswith("SELECT")]
+    return shapes[:limit]
+
+
+def explain(shape: dict) -> str:
+    """Run EXPLAIN on a recorded statement with its sample parameters."""
+    prefix = "EXPLAIN QUERY PLAN " if engine.dialect.name == "sqlite" else "EXPLAIN "
+    params = shape["parameters"]
+    if isinstance(params, list):
+        params = tuple(params)
+    with engine.connect() as conn:
+        rows = conn.exec_driver_sql(prefix + shape["statement"], params or ()).fetchall()
+    return "\n".join(" ".join(str(col) for col in row) for row in rows)
+
+
+def candidate_columns(statement: str) -> Dict[str, List[str]]:
+    """Equality/IN filter columns followed by ORDER BY columns, grouped per table."""
+    candidates: Dict[str, List[str]] = {}
+    where = statement.split(" WHERE ", 1)[1] if " WHERE " in statement else ""
+    for table, column in _EQUALITY.findall(where.split(" ORDER BY ")[0]):
+        columns = candidates.setdefault(table, [])
+        if column not in columns:
+            columns.append(column)
+    order_by = _ORDER_BY.search(statement)
+    if order_by:
+        for table, column in _COLUMN.findall(order_by.group(1)):
+            columns = candidates.setdefault(table, [])
+            if column not in columns:
+                columns.append(column)
+    return candidates
+
+
+def plan_scans(plan: str, table: str) -> bool:
+    """Whether the plan reads the table without using an index, or sorts it."""
+    if engine.dialect.name == "sqlite":
+        return bool(re.search(rf"SCAN {table}\b(?! USING)", plan)) or "TEMP B-TREE" in plan
+    return f"Seq Scan on {table}" in plan or "Sort" in plan
+
+
+def is_covered(columns: List[str], existing: List[List[str]]) -> bool:
+    """Whether an existing index already starts with the proposed columns."""
+    return any(index[:len(columns)] == columns for index in existing)
+
+
+def propose_indexes(shapes: List[dict]) -> List[Tuple[str, List[str], dict, str]]:
+    """Return (table, columns, shape, plan) tuples worth indexing."""
+    inspector = inspect(engine)
+    existing_cache: Dict[str, List[List[str]]] = {}
+    proposals = []
+    seen = set()
+
+    for shape in shapes:
+        try:
+            plan = explain(shape)
+        except Exception as e:
+            print(f"⚠️  Could not EXPLAIN shape: {e}")
+            continue
+        for table, columns in candidate_columns(shape["shape"]).items():
+            if table not in existing_cache:
+                if not inspector.has_table(table):
+                    continue
+                existing_cache[table] = [
+                    index["column_names"] for index in inspector.get_indexes(table)
+                ] + [inspector.get_pk_constraint(table)["constrained_columns"]]
+            key = (table, tuple(columns))
+            if key in seen or is_covered(columns, existing_cache[table]):
+                continue
+            if len(columns) < 2 and not plan_scans(plan, table):
+                continue
+            seen.add(key)
+            proposals.append((table, columns, shape, plan))
+    return proposals
+
+
+def current_head() -> str:
+    """Current Alembic head revision."""
+    from alembic.config import Config
+    from alembic.script import ScriptDirectory
+    config = Config(os.path.join(BACKEND_DIR, "alembic.ini"))
+    config.set_main_option("script_location", os.path.join(BACKEND_DIR, "migrations"))
+    return ScriptDirectory.from_config(config).get_current_head()
+
+
+def render_migration(proposals: List[Tuple[str, List[str], dict, str]]) -> Tuple[str, str]:
+    """Render an Alembic migration stub creating the proposed indexes."""
+    revision = uuid.uuid4().hex[:12]
+    upgrade, downgrade = [], []
+    for table, columns, shape, plan in proposals:
+        name = f"ix_{table}_{'_'.join(columns)}"
+        upgrade.append(
+            f"    # {shape['calls']} calls, {shape['total_time']:.3f}s total "
+            f"from {', '.join(sorted(set(shape['endpoints'])))}\n"
+            + "".join(f"    #   {line}\n" for line in plan.splitlines())
+            + f"    op.create_index('{name}', '{table}', {columns!r}, unique=False)"
+        )
+        downgrade.append(f"    op.drop_index('{name}', table_name='{table}')")
+
+    body = f'''"""Proposed composite indexes from recorded query shapes
+
+Revision ID: {revision}
+Revises: {current_head()}
+Create Date: {datetime.now()}
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '{revision}'
+down_revision: Union[str, Sequence[str], None] = '{current_head()}'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+{chr(10).join(upgrade)}
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+{chr(10).join(reversed(downgrade))}
+'''
+    return revision, body
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Propose composite indexes from recorded query shapes.")
+    parser.add_argument("path", nargs="?", default=settings.QUERY_RECORDER_PATH, help="Recorder dump file")
+    parser.add_argument("--top", type=int, default=20, help="Number of shapes to analyse")
+    parser.add_argument("--write", action="store_true", help="Write the migration stub to migrations/versions")
+    args = parser.parse_args()
+
+    shapes = load_top_shapes(args.path, args.top)
+    print(f"🔍 Analysing {len(shapes)} query shapes from {args.path}")
+
+    proposals = propose_indexes(shapes)
+    if not proposals:
+        print("✅ No missing composite indexes found")
+        return
+
+    for table, columns, shape, _ in proposals:
+        print(f"  • {table}({', '.join(columns)}) — {shape['calls']} calls, {shape['total_time']:.3f}s")
+
+    revision, body = render_migration(proposals)
+    if args.write:
+        path = os.path.join(BACKEND_DIR, "migrations", "versions", f"{revision}_proposed_composite_indexes.py")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(body)
+        print(f"📝 Migration stub written to {path}")
+    else:
+        print(body)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Benchmark cache payload codecs.
+
+Encodes an overview-sized payload with every available codec and reports the
+stored size, encode time and decode time (the CPU part of a cache hit). With
+--redis, each payload is also written to Redis to measure GET + decode latency
+and the server-side MEMORY USAGE.
+
+Usage:
+    python scripts/benchmark_cache_codecs.py [--entities N] [--iterations N] [--redis]
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+# Add the app directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.config import settings
+from app.services.cache_codec import MSGPACK_AVAILABLE, ZSTD_AVAILABLE, codec_for
+
+
+def build_payload(entities: int) -> Dict[str, Any]:
+    """Overview-like payload embedding every entity, as the overview endpoints return."""
+    rng = random.Random(42)
+    words = ["storm", "light", "shard", "honor", "cultivation", "odium", "spren", "metal", "allomancy", "awakening"]
+    return {
+        "total": entities,
+        "items": [
+            {
+                "id": f"character-{i}",
+                "name": f"Character {i}",
+                "aliases": [rng.choice(words).title() for _ in range(3)],
+                "description": " ".join(rng.choice(words) for _ in range(60)),
+                "world_of_origin_id": rng.choice(["roshar", "scadrial", "nalthis", "sel"]),
+                "status": rng.choice(["alive", "deceased", "unknown"]),
+                "affiliations": [rng.choice(words) for _ in range(2)],
+                "created_at": "2024-01-01T00:00:00",
+                "updated_at": "2024-06-01T12:30:00",
+            }
+            for i in range(entities)
+        ],
+    }
+
+
+def timed(func: Callable[[], Any], iterations: int) -> float:
+    """Mean wall time of a call in microseconds."""
+    started = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - started) / iterations * 1e6
+
+
+def codec_names() -> List[str]:
+    names = ["json+none", "json+zlib"]
+    if ZSTD_AVAILABLE:
+        names.append("json+zstd")
+    if MSGPACK_AVAILABLE:
+        names += ["msgpack+none", "msgpack+zlib"] + (["msgpack+zstd"] if ZSTD_AVAILABLE else [])
+    return names
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark cache payload codecs.")
+    parser.add_argument("--entities", type=int, default=500, help="Entities embedded in the payload")
+    parser.add_argument("--iterations", type=int, default=200, help="Iterations per measurement")
+    parser.add_argument("--redis", action="store_true", help="Also measure GET latency and memory in Redis")
+    args = parser.parse_args()
+
+    payload = build_payload(args.entities)
+    redis_client = None
+    if args.redis:
+        import redis
+        redis_client = redis.Redis.from_url(settings.REDIS_URL)
+
+    # Baseline: what CacheService stored before codecs existed
+    legacy = json.dumps(payload, default=str).encode()
+    print(f"📦 Payload with {args.entities} entities, legacy json.dumps size {len(legacy):,} bytes\n")
+    header = f"{'codec':<16}{'bytes':>12}{'ratio':>8}{'encode µs':>12}{'decode µs':>12}"
+    if redis_client is not None:
+        header += f"{'GET+decode µs':>16}{'redis bytes':>14}"
+    print(header)
+
+    rows = [("legacy json", legacy, lambda: json.dumps(payload, default=str), lambda: json.loads(legacy))]
+    for name in codec_names():
+        codec = codec_for(name)
+        encoded = codec.encode(payload)
+        rows.append((name, encoded, lambda codec=codec: codec.encode(payload),
+                     lambda codec=codec, encoded=encoded: codec.decode(encoded)))
+
+    for name, encoded, encode, decode in rows:
+        line = (f"{name:<16}{len(encoded):>12,}{len(legacy) / len(encoded):>8.2f}"
+                f"{timed(encode, args.iterations):>12.1f}{timed(decode, args.iterations):>12.1f}")
+        if redis_client is not None:
+            key = f"cosmere:benchmark:{name}"
+            redis_client.set(key, encoded)
+            codec = codec_for(name) if name != "legacy json" else None
+            get = (lambda key=key, codec=codec: codec.decode(redis_client.get(key)) if codec
+                   else json.loads(redis_client.get(key)))
+            line += f"{timed(get, args.iterations):>16.1f}{redis_client.memory_usage(key):>14,}"
+            redis_client.delete(key)
+        print(line)
+
+    print(f"\n⚙️  Configured codec: {codec_for(f'{settings.CACHE_CODEC}+{settings.CACHE_COMPRESSION}').name} "
+          f"(compression above {settings.CACHE_COMPRESSION_THRESHOLD} bytes)")
+
+
+if __name__ == "__main__":
+    main()
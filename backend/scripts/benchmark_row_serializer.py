@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Benchmark row serialization.
+
+Loads generated rows into an in-memory SQLite database and serializes them
+with the per-call column loop BaseModel.to_dict used before and with the
+compiled row serializers, as dictionaries (cache population, NDJSON) and as
+flat CSV values.
+
+Usage:
+    python scripts/benchmark_row_serializer.py [--rows N] [--models books,series,characters]
+"""
+import argparse
+import enum
+import os
+import sys
+import time
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, List
+
+from sqlalchemy import JSON, Boolean, Date, DateTime, Enum, Integer, Text, create_engine, inspect
+from sqlalchemy.orm import Session
+
+# Add the app directory to the Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.models import Base
+from app.models.serializer import row_serializer
+from app.services.export_service import EXPORT_MODELS
+
+
+def legacy_to_dict(row: Any) -> dict:
+    """BaseModel.to_dict as it was: inspects the row and type-checks every value on every call."""
+    result = {}
+    state = inspect(row)
+    deferred_columns = state.unloaded - state.expired_attributes if state.has_identity else ()
+    for column in row.__table__.columns:
+        if column.name in deferred_columns:
+            continue
+        value = getattr(row, column.name)
+        if isinstance(value, datetime):
+            value = value.isoformat()
+        elif isinstance(value, enum.Enum):
+            value = value.value
+        result[column.name] = value
+    return result
+
+
+def generated_value(column, i: int) -> Any:
+    """A plausible value for row ``i`` of a column, by column type."""
+    if isinstance(column.type, Enum):
+        members = list(column.type.enum_class or column.type.enums)
+        return members[i % len(members)]
+    if isinstance(column.type, DateTime):
+        return datetime(2024, 1, 1) + timedelta(seconds=i)
+    if isinstance(column.type, Date):
+        return date(1990, 1, 1) + timedelta(days=i % 10000)
+    if isinstance(column.type, Boolean):
+        return i % 2 == 0
+    if isinstance(column.type, Integer):
+        return i
+    if isinstance(column.type, JSON):
+        return [f"{column.key}-{i}-{n}" for n in range(3)]
+    if isinstance(column.type, Text):
+        return f"{column.key} of row {i} " * 20
+    return f"{column.key}-{i}"
+
+
+def timed(func: Callable[[], Any]) -> float:
+    """Wall time of a call in milliseconds."""
+    started = time.perf_counter()
+    func()
+    return (time.perf_counter() - started) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark row serialization.")
+    parser.add_argument("--rows", type=int, default=100_000, help="Rows per model")
+    parser.add_argument("--models", default="books,series,characters", help="Comma-separated table names")
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    print(f"📦 {args.rows:,} rows per model\n")
+    print(f"{'model':<14}{'legacy ms':>12}{'to_dict ms':>12}{'speedup':>9}{'csv values ms':>15}")
+
+    for entity_type in args.models.split(","):
+        model = EXPORT_MODELS[entity_type]
+        columns = list(model.__table__.columns)
+        with engine.begin() as connection:
+            connection.execute(
+                model.__table__.insert(),
+                [{column.key: generated_value(column, i) for column in columns} for i in range(args.rows)]
+            )
+        with Session(engine) as session:
+            rows: List[Any] = session.query(model).all()
+            serializer = row_serializer(model)
+            flat = row_serializer(model, json_text=True)
+            legacy = timed(lambda: [legacy_to_dict(row) for row in rows])
+            compiled = timed(lambda: [serializer.to_dict(row) for row in rows])
+            values = timed(lambda: [flat.values(row) for row in rows])
+        print(f"{entity_type:<14}{legacy:>12.1f}{compiled:>12.1f}{legacy / compiled:>8.1f}x{values:>15.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -78,7 +78,7 @@ class DatabaseSeeder:
             if world:
                 world.name = world_data['name']
                 world.system = world_data.get('system')
-                world.geography = json.dumps(world_data.get('geography', {}))
+                world.geography = world_data.get('geography', {})
                 world.culture_notes = world_data.get('culture_notes')
                 world.technology_level = world_data.get('technology_level')
             else:
@@ -86,7 +86,7 @@ class DatabaseSeeder:
                     id=world_data.get('id', str(uuid.uuid4())),
                     name=world_data['name'],
                     system=world_data.get('system'),
-                    geography=json.dumps(world_data.get('geography', {})),
+                    geography=world_data.get('geography', {}),
                     culture_notes=world_data.get('culture_notes'),
                     technology_level=world_data.get('technology_level')
                 )
@@ -149,28 +149,28 @@ class DatabaseSeeder:
             character = self.session.query(Character).get(char_data.get('id'))
             if character:
                 character.name = char_data['name']
-                character.aliases = json.dumps(char_data.get('aliases', []))
+                character.aliases = char_data.get('aliases', [])
                 character.world_of_origin_id = char_data.get('world_of_origin_id')
                 character.species = char_data.get('species')
-                character.magic_abilities = json.dumps(char_data.get('magic_abilities', {}))
-                character.affiliations = json.dumps(char_data.get('affiliations', {}))
+                character.magic_abilities = char_data.get('magic_abilities', {})
+                character.affiliations = char_data.get('affiliations', {})
                 character.status = char_data.get('status', 'unknown')
                 character.first_appearance_book_id = char_data.get('first_appearance_book_id')
                 character.biography = char_data.get('biography')
-                character.cosmere_significance = json.dumps(char_data.get('cosmere_significance', {}))
+                character.cosmere_significance = char_data.get('cosmere_significance', {})
             else:
                 character = Character(
                     id=char_data.get('id', str(uuid.uuid4())),
                     name=char_data['name'],
-                    aliases=json.dumps(char_data.get('aliases', [])),
+                    aliases=char_data.get('aliases', []),
                     world_of_origin_id=char_data.get('world_of_origin_id'),
                     species=char_data.get('species'),
-                    magic_abilities=json.dumps(char_data.get('magic_abilities', {})),
-                    affiliations=json.dumps(char_data.get('affiliations', {})),
+                    magic_abilities=char_data.get('magic_abilities', {}),
+                    affiliations=char_data.get('affiliations', {}),
                     status=char_data.get('status', 'unknown'),
                     first_appearance_book_id=char_data.get('first_appearance_book_id'),
                     biography=char_data.get('biography'),
-                    cosmere_significance=json.dumps(char_data.get('cosmere_significance', {}))
+                    cosmere_significance=char_data.get('cosmere_significance', {})
                 )
                 self.session.add(character)
         self.session.commit()
@@ -2,6 +2,7 @@
 Pytest configuration and fixtures for testing.
 """
 import pytest
+from collections import Counter
 from typing import Generator, Dict, Any
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
@@ -9,12 +10,17 @@ from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import StaticPool
 
 from app.main import app
-from app.core.database import get_db, Base
+from app.core.database import get_db
+from app.models.base import Base
 from app.core.config import settings
 from app.models import (
     World, Series, Book, Character, MagicSystem, Shard,
     CharacterRelationship, BookCharacter, CharacterMagicSystem
 )
+from app.services.cache_service import ENTITY_TYPES, cache_service
+from app.services.circuit_breaker import CircuitBreaker
+from app.services.local_cache import LocalCache
+from tests.fake_redis import FakeRedis
 
 
 # Test database configuration
@@ -64,6 +70,22 @@ def client(db_session) -> Generator[TestClient, None, None]:
     app.dependency_overrides.clear()
 
 
+@pytest.fixture
+def fake_redis(monkeypatch) -> FakeRedis:
+    """Point the cache service at an empty in-memory Redis with fresh local tiers."""
+    redis = FakeRedis()
+    monkeypatch.setattr(cache_service, "_redis", redis)
+    monkeypatch.setattr(cache_service, "breaker", CircuitBreaker())
+    monkeypatch.setattr(cache_service, "local", LocalCache(settings.CACHE_LOCAL_MAX_ENTRIES, settings.CACHE_LOCAL_TTL))
+    monkeypatch.setattr(cache_service, "_local_counters", LocalCache(len(ENTITY_TYPES) * 4, settings.CACHE_LOCAL_TTL))
+    monkeypatch.setattr(cache_service, "_inflight", {})
+    monkeypatch.setattr(cache_service, "_hot_keys", Counter())
+    monkeypatch.setattr(cache_service, "_table_states", {})
+    monkeypatch.setattr(cache_service, "_table_checked", {})
+    monkeypatch.setattr(settings, "CACHE_ENABLED", True)
+    return redis
+
+
 @pytest.fixture
 def sample_world_data() -> Dict[str, Any]:
     """Sample world data for testing."""
@@ -0,0 +1,151 @@
+"""
+In-memory stand-in for the aioredis client, covering the commands CacheService uses.
+"""
+import fnmatch
+import time
+from typing import Any, Dict, List, Optional
+
+
+def _encode(value: Any) -> Any:
+    if isinstance(value, str):
+        return value.encode()
+    if isinstance(value, (int, float)):
+        return str(value).encode()
+    return value
+
+
+def _decode(key: Any) -> str:
+    return key.decode() if isinstance(key, bytes) else key
+
+
+class FakeRedis:
+    """Keys, sets and sorted sets with expiry, plus a record of published messages."""
+
+    def __init__(self):
+        self.data: Dict[str, Any] = {}
+        self.expires: Dict[str, float] = {}
+        self.published: List[tuple] = []
+
+    def _alive(self, key: str) -> bool:
+        if key in self.expires and self.expires[key] < time.time():
+            self.data.pop(key, None)
+            self.expires.pop(key, None)
+        return key in self.data
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return self.data.get(key) if self._alive(key) else None
+
+    async def mget(self, *keys) -> List[Optional[bytes]]:
+        if len(keys) == 1 and isinstance(keys[0], list):
+            keys = keys[0]
+        return [await self.get(key) for key in keys]
+
+    async def set(self, key: str, value: Any, ex: int = None, px: int = None, nx: bool = False) -> Optional[bool]:
+        if nx and self._alive(key):
+            return None
+        self.data[key] = _encode(value)
+        self.expires.pop(key, None)
+        if ex:
+            self.expires[key] = time.time() + ex
+        if px:
+            self.expires[key] = time.time() + px / 1000
+        return True
+
+    async def setex(self, key: str, ttl: int, value: Any) -> bool:
+        return await self.set(key, value, ex=ttl)
+
+    async def expire(self, key: str, ttl: int) -> bool:
+        self.expires[key] = time.time() + ttl
+        return True
+
+    async def delete(self, *keys) -> int:
+        deleted = 0
+        for key in map(_decode, keys):
+            deleted += self.data.pop(key, None) is not None
+            self.expires.pop(key, None)
+        return deleted
+
+    async def unlink(self, *keys) -> int:
+        return await self.delete(*keys)
+
+    async def exists(self, *keys) -> int:
+        return sum(self._alive(key) for key in keys)
+
+    async def incr(self, key: str) -> int:
+        value = int(await self.get(key) or 0) + 1
+        self.data[key] = _encode(value)
+        return value
+
+    async def sadd(self, key: str, *members) -> int:
+        self.data.setdefault(key, set()).update(_encode(member) for member in members)
+        return len(members)
+
+    async def smembers(self, key: str) -> set:
+        return set(self.data.get(key, set())) if self._alive(key) else set()
+
+    async def sunion(self, *keys) -> set:
+        members = set()
+        for key in keys:
+            members |= await self.smembers(key)
+        return members
+
+    async def zincrby(self, key: str, amount: float, member: Any) -> float:
+        scores = self.data.setdefault(key, {})
+        member = _encode(member)
+        scores[member] = scores.get(member, 0) + amount
+        return scores[member]
+
+    async def zrevrange(self, key: str, start: int, end: int) -> List[bytes]:
+        scores = self.data.get(key, {}) if self._alive(key) else {}
+        ranked = sorted(scores, key=lambda member: -scores[member])
+        return ranked[start:None if end == -1 else end + 1]
+
+    async def scan_iter(self, match: str = "*", count: int = None):
+        for key in list(self.data):
+            if fnmatch.fnmatch(key, match) and self._alive(key):
+                yield key.encode()
+
+    async def eval(self, script: str, numkeys: int, key: str, token: str) -> int:
+        # The only script CacheService runs releases a lock held by ``token``
+        if self.data.get(key) == _encode(token):
+            return await self.delete(key)
+        return 0
+
+    async def publish(self, channel: str, message: Any) -> int:
+        self.published.append((channel, message))
+        return 1
+
+    async def info(self, section: str = None) -> Dict[str, Any]:
+        return {"evicted_keys": 0}
+
+    async def ping(self) -> bool:
+        return True
+
+    async def close(self) -> None:
+        pass
+
+    def pipeline(self, transaction: bool = True) -> "FakePipeline":
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    """Queues commands and runs them in order on execute."""
+
+    def __init__(self, redis: FakeRedis):
+        self.redis = redis
+        self.commands: List[tuple] = []
+
+    def __getattr__(self, name: str):
+        def queue(*args, **kwargs):
+            self.commands.append((name, args, kwargs))
+            return self
+        return queue
+
+    async def execute(self) -> List[Any]:
+        return [await getattr(self.redis, name)(*args, **kwargs) for name, args, kwargs in self.commands]
+
+    async def __aenter__(self) -> "FakePipeline":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        pass
@@ -5,6 +5,9 @@ import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
+from app.models import Shard
+from app.models.shard import ShardStatus
+
 
 class TestWorldEndpoints:
     """Integration tests for world endpoints."""
@@ -328,6 +331,19 @@ class TestShardEndpoints:
         assert len(data["items"]) == 1
         assert data["items"][0]["name"] == "Honor"
     
+    def test_get_shards_cached(self, client: TestClient, db_session: Session, fake_redis):
+        """Test the shard list is served by the cached shard router, with sparse fields."""
+        db_session.add(Shard(id="honor", name="Honor", intent="Honor", status=ShardStatus.SPLINTERED))
+        db_session.flush()
+        
+        first = client.get("/api/v1/shards/", params={"fields": "id,name"})
+        second = client.get("/api/v1/shards/", params={"fields": "id,name"})
+        assert first.status_code == second.status_code == 200
+        assert first.headers["X-Cache"] == "MISS"
+        assert second.headers["X-Cache"] == "HIT"
+        assert second.json()["total"] == 1
+        assert second.json()["items"] == [{"id": "honor", "name": "Honor"}]
+    
     def test_get_shard_by_id(self, client: TestClient, populated_db: dict):
         """Test getting a shard by ID."""
         shard_id = populated_db["shard"].id
@@ -0,0 +1,40 @@
+"""
+Unit tests for batch request paths.
+"""
+import pytest
+
+from app.core.config import settings
+from app.services.batch_service import _request_headers, batch_url
+from app.services.cache_warmer import WARM_REQUEST_HEADER
+
+
+class TestBatchUrl:
+    """Test cases for batch_url."""
+
+    def test_relative_paths(self):
+        """Test paths are resolved against the API root with their query strings."""
+        assert batch_url("/characters/kaladin") == f"{settings.API_V1_STR}/characters/kaladin"
+        assert batch_url("/books/?limit=5&include=series") == f"{settings.API_V1_STR}/books/?limit=5&include=series"
+        assert batch_url("/exports-guide") == f"{settings.API_V1_STR}/exports-guide"
+
+    def test_rejected_paths(self):
+        """Test absolute URLs, dot segments, nested batches and exports are rejected."""
+        for path in ["characters", "//evil.example/x", "https://evil.example/x", "/characters/../export/a.csv",
+                     "/batch", "/export/characters.csv"]:
+            with pytest.raises(ValueError):
+                batch_url(path)
+
+    def test_encoded_paths(self):
+        """Test percent-encoded paths are checked as the router decodes them."""
+        for path in ["/%65xport/characters.ndjson", "/%62atch", "/characters/%2e%2e/export/a.csv",
+                     "/%2Fexport/characters.csv"]:
+            with pytest.raises(ValueError):
+                batch_url(path)
+        path = "/search/?q=Kaladin%20Stormblessed"
+        assert batch_url(path) == f"{settings.API_V1_STR}{path}"
+
+    def test_protected_headers(self):
+        """Test Host and the cache warmer marker are not forwarded."""
+        headers = {"Host": "evil.example", WARM_REQUEST_HEADER: "1", "If-None-Match": '"abc"'}
+        assert _request_headers(headers) == {"If-None-Match": '"abc"'}
+        assert _request_headers(None) == {}
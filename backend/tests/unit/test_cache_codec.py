@@ -0,0 +1,57 @@
+"""
+Unit tests for cache payload codecs.
+"""
+import json
+
+import pytest
+
+from app.services.cache_codec import CacheCodec, HEADER_FLAG, NegativeResult, codec_for
+
+
+PAYLOAD = {"items": [{"id": f"character-{i}", "name": f"Character {i}"} for i in range(100)], "total": 100}
+
+
+class TestCacheCodec:
+    """Test cases for CacheCodec."""
+
+    def test_round_trip(self):
+        """Test values survive encoding and decoding."""
+        codec = CacheCodec("json", "none")
+        assert codec.decode(codec.encode(PAYLOAD)) == PAYLOAD
+
+    def test_header_byte(self):
+        """Test payloads start with a header byte that cannot begin plain JSON."""
+        payload = CacheCodec("json", "none").encode(PAYLOAD)
+        assert payload[0] >= HEADER_FLAG
+
+    def test_compresses_above_threshold(self):
+        """Test large payloads are compressed and small ones are not."""
+        codec = CacheCodec("json", "zlib", threshold=64)
+        uncompressed = CacheCodec("json", "none").encode(PAYLOAD)
+        compressed = codec.encode(PAYLOAD)
+        assert len(compressed) < len(uncompressed)
+        assert codec.decode(compressed) == PAYLOAD
+        assert codec.encode({"a": 1}) == CacheCodec("json", "none").encode({"a": 1})
+
+    def test_decodes_other_codecs(self):
+        """Test a codec decodes values written under a different configuration."""
+        written = codec_for("json+zlib", threshold=0).encode(PAYLOAD)
+        assert codec_for("json+none").decode(written) == PAYLOAD
+
+    def test_decodes_legacy_json(self):
+        """Test plain JSON written before codecs existed still decodes."""
+        legacy = json.dumps(PAYLOAD).encode()
+        assert CacheCodec().decode(legacy) == PAYLOAD
+
+    @pytest.mark.parametrize("value", [None, 0, "text", [1, 2], {"nested": {"list": [True, None]}}])
+    def test_json_values(self, value):
+        """Test JSON-compatible values round-trip."""
+        codec = CacheCodec("json", "zlib", threshold=0)
+        assert codec.decode(codec.encode(value)) == value
+
+    def test_negative_sentinel(self):
+        """Test cached misses are stored compactly and decode to a NegativeResult."""
+        miss = NegativeResult(404, b'{"detail": "Character not found"}')
+        payload = CacheCodec().encode(miss)
+        assert len(payload) == len(miss.body) + 3
+        assert codec_for("json+none").decode(payload) == miss
@@ -0,0 +1,73 @@
+"""
+Unit tests for cache metrics and the admin endpoints reporting them.
+"""
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.v1.endpoints import admin
+from app.core.config import settings
+from app.services import cache_metrics as metrics_module
+from app.services.cache_metrics import HIT, MISS, STALE, CacheMetrics, family_of
+
+app = FastAPI()
+app.include_router(admin.router, prefix="/admin")
+
+
+@pytest.fixture
+def metrics(monkeypatch) -> CacheMetrics:
+    # Prometheus collectors register globally, so only the in-process totals are exercised
+    monkeypatch.setattr(metrics_module, "PROMETHEUS_AVAILABLE", False)
+    return CacheMetrics()
+
+
+class TestCacheMetrics:
+    """Test cases for CacheMetrics."""
+
+    def test_family_of(self):
+        """Test the family is the key without its namespace and trailing hash."""
+        assert family_of("cosmere:world:0f3a") == "world"
+        assert family_of("cosmere:books:series:0f3a") == "books:series"
+        assert family_of("cosmere:response:get_world:0f3a") == "response:get_world"
+        assert family_of("unprefixed") == "unprefixed"
+
+    def test_summary_ranking(self, metrics):
+        """Test families are ranked by the database time their hits and stale serves saved."""
+        for _ in range(10):
+            metrics.record_lookup("cosmere:world:1", HIT, 0.001)
+        metrics.record_compute("world", 0.01)
+        for _ in range(2):
+            metrics.record_lookup("cosmere:search:1", HIT, 0.001)
+        metrics.record_lookup("cosmere:search:1", STALE, 0.001)
+        metrics.record_lookup("cosmere:search:1", MISS, 0.001)
+        metrics.record_compute("search", 0.5)
+
+        summary = metrics.summary()
+        assert [family["family"] for family in summary] == ["search", "world"]
+        assert summary[0]["db_time_saved_seconds"] == 1.5
+        assert summary[0]["hit_ratio"] == 0.75
+        assert summary[1]["db_time_saved_seconds"] == 0.1
+
+        metrics.reset()
+        assert metrics.summary() == []
+
+
+class TestAdminEndpoints:
+    """Test cases for access to the admin endpoints."""
+
+    def test_requires_key(self, monkeypatch):
+        """Test a configured key must be sent in X-Admin-Key."""
+        monkeypatch.setattr(settings, "ADMIN_API_KEY", "secret")
+        client = TestClient(app)
+        assert client.post("/admin/cache/reset").status_code == 401
+        assert client.post("/admin/cache/reset", headers={"X-Admin-Key": "wrong"}).status_code == 401
+        assert client.post("/admin/cache/reset", headers={"X-Admin-Key": "secret"}).status_code == 204
+
+    def test_debug_only_without_key(self, monkeypatch):
+        """Test without a configured key the endpoints only answer in DEBUG."""
+        monkeypatch.setattr(settings, "ADMIN_API_KEY", None)
+        monkeypatch.setattr(settings, "DEBUG", False)
+        client = TestClient(app)
+        assert client.post("/admin/cache/reset").status_code == 404
+        monkeypatch.setattr(settings, "DEBUG", True)
+        assert client.post("/admin/cache/reset").status_code == 204
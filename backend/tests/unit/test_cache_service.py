@@ -0,0 +1,162 @@
+"""
+Unit tests for the cache service, against an in-memory Redis.
+"""
+import asyncio
+import json
+import time
+
+import pytest
+
+from app.core.config import settings
+from app.services import cache_service as cache_module
+from app.services.cache_codec import NegativeResult
+from app.services.cache_service import INVALIDATION_CHANNEL, cache_service
+
+
+class Counting:
+    """Getter counting its calls, optionally waiting for a release."""
+
+    def __init__(self, value, release: asyncio.Event = None):
+        self.value = value
+        self.release = release
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        if self.release is not None:
+            await self.release.wait()
+        else:
+            await asyncio.sleep(0.01)
+        return self.value
+
+
+class TestCacheService:
+    """Test cases for CacheService."""
+
+    @pytest.mark.asyncio
+    async def test_invalidate_tags(self, fake_redis):
+        """Test invalidating a tag drops the entries tagged with it from both tiers."""
+        await cache_service.set("kaladin", {"name": "Kaladin"}, tags=["characters:kaladin"])
+        await cache_service.set("shallan", {"name": "Shallan"}, tags=["characters:shallan"])
+
+        assert await cache_service.invalidate_tags(["characters:kaladin"]) == 1
+        assert await cache_service.get("kaladin") is None
+        assert "kaladin" not in fake_redis.data
+        assert await cache_service.get("shallan") == {"name": "Shallan"}
+
+    @pytest.mark.asyncio
+    async def test_invalidate_entity_type(self, fake_redis):
+        """Test invalidating a whole type moves its tagged keys to a new generation."""
+        before = await cache_service._key("characters:list", tags=["characters:*"])
+        await cache_service.invalidate_entity("characters")
+        after = await cache_service._key("characters:list", tags=["characters:*"])
+        assert before != after
+        assert await cache_service._key("worlds:list", tags=["worlds:*"]) == \
+            await cache_service._key("worlds:list", tags=["worlds:*"])
+
+    @pytest.mark.asyncio
+    async def test_single_flight(self, fake_redis):
+        """Test concurrent misses share one computation."""
+        getter = Counting({"name": "Kaladin"})
+        results = await asyncio.gather(*(cache_service.get_or_set("kaladin", getter, 60) for _ in range(10)))
+        assert getter.calls == 1
+        assert results == [{"name": "Kaladin"}] * 10
+
+    @pytest.mark.asyncio
+    async def test_lock_waits_for_other_worker(self, fake_redis, monkeypatch):
+        """Test a miss whose lock is held elsewhere waits for that worker's value instead of computing."""
+        monkeypatch.setattr(settings, "CACHE_LOCK_TIMEOUT", 1)
+        await fake_redis.set(cache_service._lock_key("kaladin"), "other-worker")
+        getter = Counting({"name": "Kaladin"})
+
+        async def other_worker():
+            await asyncio.sleep(0.1)
+            entry = {"value": {"name": "Stormblessed"}, "delta": 0, "expires_at": time.time() + 60}
+            await fake_redis.set("kaladin", cache_service.codec.encode(entry))
+
+        result, _ = await asyncio.gather(cache_service.get_or_set("kaladin", getter, 60, lock=True), other_worker())
+        assert result == {"name": "Stormblessed"}
+        assert getter.calls == 0
+
+    @pytest.mark.asyncio
+    async def test_stale_while_revalidate(self, fake_redis):
+        """Test an expired entry within stale_ttl is served at once while it refreshes."""
+        await cache_service.set("kaladin", {"value": "old", "delta": 0, "expires_at": time.time() - 1},
+                                ttl=60, jitter=False)
+        release = asyncio.Event()
+        getter = Counting("new", release)
+
+        assert await cache_service.get_or_set("kaladin", getter, 60, stale_ttl=60) == "old"
+        await asyncio.sleep(0)
+        assert getter.calls == 1
+        release.set()
+        await cache_service._inflight["kaladin"]
+        assert await cache_service.get_or_set("kaladin", getter, 60, stale_ttl=60) == "new"
+        assert getter.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_without_stale_ttl(self, fake_redis):
+        """Test an expired entry without stale_ttl is recomputed before answering."""
+        await cache_service.set("kaladin", {"value": "old", "delta": 0, "expires_at": time.time() - 1},
+                                ttl=60, jitter=False)
+        assert await cache_service.get_or_set("kaladin", Counting("new"), 60) == "new"
+
+    def test_xfetch(self, monkeypatch):
+        """Test early refresh becomes likely only when expiry is near relative to compute time."""
+        monkeypatch.setattr(cache_module.random, "random", lambda: 0.5)
+        now = time.time()
+        assert not cache_service._should_refresh_early({"delta": 0.1, "expires_at": now + 60})
+        assert cache_service._should_refresh_early({"delta": 10, "expires_at": now + 1})
+        monkeypatch.setattr(cache_module.random, "random", lambda: 0.0)
+        assert not cache_service._should_refresh_early({"delta": 10, "expires_at": now + 1})
+
+    @pytest.mark.asyncio
+    async def test_negative_result_ttl(self, fake_redis):
+        """Test a NegativeResult is cached for CACHE_NEGATIVE_TTL and returned without recomputing."""
+        missing = NegativeResult(404, b'{"detail":"Character not found"}')
+        getter = Counting(missing)
+
+        assert await cache_service.get_or_set("missing", getter, 3600) == missing
+        ttl = fake_redis.expires["missing"] - time.time()
+        assert settings.CACHE_NEGATIVE_TTL - 1 < ttl <= settings.CACHE_NEGATIVE_TTL
+        cache_service.local.clear()
+        assert await cache_service.get_or_set("missing", getter, 3600) == missing
+        assert getter.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_none_not_cached(self, fake_redis):
+        """Test a getter returning None is not cached."""
+        getter = Counting(None)
+        await cache_service.get_or_set("missing", getter, 60)
+        await cache_service.get_or_set("missing", getter, 60)
+        assert getter.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidation_broadcast(self, fake_redis):
+        """Test invalidations are published for the other workers' local tiers."""
+        await cache_service.invalidate_tags(["characters:kaladin"])
+        channel, message = fake_redis.published[-1]
+        assert channel == INVALIDATION_CHANNEL
+        assert json.loads(message) == {"tags": ["characters:kaladin"], "origin": cache_service.instance_id}
+
+    def test_apply_invalidation(self, fake_redis):
+        """Test broadcasts from other workers clear the local tier and our own are ignored."""
+        cache_service.local.set("kaladin", "Kaladin", tags=["characters:kaladin"])
+        cache_service._apply_invalidation({"tags": ["characters:kaladin"], "origin": cache_service.instance_id})
+        assert cache_service.local.get("kaladin") == "Kaladin"
+
+        cache_service._apply_invalidation({"tags": ["characters:kaladin"], "origin": "other-worker"})
+        assert cache_service.local.get("kaladin") is None
+        cache_service._apply_invalidation({"generations": {"characters": 7}, "origin": "other-worker"})
+        assert cache_service._local_counters.get("gen:characters") == 7
+
+    @pytest.mark.asyncio
+    async def test_hot_keys(self, fake_redis):
+        """Test recorded requests are ranked overall and per family once flushed."""
+        for _ in range(3):
+            cache_service.record_request("characters", "/api/v1/characters/kaladin", "")
+        cache_service.record_request("worlds", "/api/v1/worlds/roshar", "include=shard")
+
+        assert await cache_service.flush_hot_keys()
+        assert await cache_service.hot_keys(10) == ["/api/v1/characters/kaladin", "/api/v1/worlds/roshar?include=shard"]
+        assert await cache_service.hot_keys(10, family="worlds") == ["/api/v1/worlds/roshar?include=shard"]
@@ -0,0 +1,42 @@
+"""
+Unit tests for the circuit breaker.
+"""
+import time
+
+from app.services.circuit_breaker import CircuitBreaker
+
+
+class TestCircuitBreaker:
+    """Test cases for CircuitBreaker."""
+
+    def test_opens_after_consecutive_failures(self):
+        """Test the circuit opens once the failure threshold is reached."""
+        breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60)
+        for _ in range(2):
+            breaker.record_failure()
+        assert breaker.allow()
+        breaker.record_failure()
+        assert not breaker.allow()
+        assert breaker.state == CircuitBreaker.OPEN
+
+    def test_success_resets_failures(self):
+        """Test a success in between failures keeps the circuit closed."""
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.CLOSED
+
+    def test_half_open_after_reset_timeout(self):
+        """Test the circuit half-opens after the cool-down and reopens on the next failure."""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.01)
+        breaker.record_failure()
+        assert not breaker.allow()
+        time.sleep(0.02)
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        assert breaker.allow()
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+        time.sleep(0.02)
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
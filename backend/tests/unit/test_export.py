@@ -0,0 +1,104 @@
+"""
+Unit tests for export byte ranges.
+"""
+import json
+import os
+import time
+from datetime import datetime, timezone
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.api.v1.endpoints import export
+from app.api.v1.endpoints.export import parse_byte_range
+from app.core.config import settings
+from app.models import World
+from app.models.base import BaseModel
+from app.services import export_service
+
+app = FastAPI()
+app.include_router(export.router, prefix="/export")
+
+
+@pytest.fixture
+def export_sessions(monkeypatch) -> sessionmaker:
+    """Point exports at an in-memory database shared across the threadpool."""
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    BaseModel.metadata.create_all(engine)
+    sessions = sessionmaker(bind=engine)
+    monkeypatch.setattr(export_service, "SessionLocal", sessions)
+    return sessions
+
+
+@pytest.fixture
+def new_york_time():
+    """Run in a local time zone away from UTC."""
+    previous = os.environ.get("TZ")
+    os.environ["TZ"] = "America/New_York"
+    time.tzset()
+    yield
+    if previous is None:
+        del os.environ["TZ"]
+    else:
+        os.environ["TZ"] = previous
+    time.tzset()
+
+
+class TestParseByteRange:
+    """Test cases for parse_byte_range."""
+
+    def test_ranges(self):
+        """Test closed, open-ended and suffix ranges, clamped to the file."""
+        assert parse_byte_range("bytes=0-99", 1000) == (0, 99)
+        assert parse_byte_range("bytes=900-", 1000) == (900, 999)
+        assert parse_byte_range("bytes=-100", 1000) == (900, 999)
+        assert parse_byte_range("bytes=900-5000", 1000) == (900, 999)
+
+    def test_ignored_ranges(self):
+        """Test malformed and multiple ranges are ignored."""
+        assert parse_byte_range("bytes=0-9,20-29", 1000) is None
+        assert parse_byte_range("items=0-9", 1000) is None
+        assert parse_byte_range("bytes=abc-", 1000) is None
+
+    def test_unsatisfiable(self):
+        """Test ranges starting past the end are rejected."""
+        with pytest.raises(ValueError):
+            parse_byte_range("bytes=1000-", 1000)
+        with pytest.raises(ValueError):
+            parse_byte_range("bytes=-0", 1000)
+
+
+class TestDatasetVersion:
+    """Test cases for dataset_version."""
+
+    def test_utc_regardless_of_local_time(self, export_sessions, new_york_time):
+        """Test the naive UTC update time is not read in the process's local time zone."""
+        updated_at = datetime(2026, 1, 1, 12, 0)
+        with export_sessions() as db:
+            db.add(World(id="roshar", name="Roshar", updated_at=updated_at))
+            db.commit()
+        version = export_service.dataset_version("worlds")
+        stamp = int(updated_at.replace(tzinfo=timezone.utc).timestamp() * 1_000_000)
+        assert version == f"1-{stamp}"
+
+
+class TestNdjsonExport:
+    """Test cases for the streamed NDJSON export."""
+
+    def test_stream(self, export_sessions, monkeypatch):
+        """Test every row is streamed as one JSON line across several batches."""
+        monkeypatch.setattr(settings, "EXPORT_BATCH_SIZE", 2)
+        with export_sessions() as db:
+            db.add_all([World(id=f"world-{i}", name=f"World {i}") for i in range(5)])
+            db.commit()
+
+        response = TestClient(app).get("/export/worlds.ndjson")
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        lines = response.content.splitlines()
+        assert len(lines) == 5
+        assert [json.loads(line)["id"] for line in lines] == [f"world-{i}" for i in range(5)]
@@ -0,0 +1,50 @@
+"""
+Unit tests for include parsing and resolution.
+"""
+import pytest
+
+from app.core.config import settings
+from app.models import Book, Character, World
+from app.services.include_service import IncludeResolver, include_types, parse_includes
+
+
+class TestParseIncludes:
+    """Test cases for parse_includes."""
+
+    def test_builds_tree(self):
+        """Test include paths merge into one tree of relation names."""
+        tree = parse_includes(Book, "series, characters.magic_systems,characters.world")
+        assert tree == {"series": {}, "characters": {"magic_systems": {}, "world": {}}}
+
+    def test_rejects_unknown_relation(self):
+        """Test unknown relations and overly deep paths are rejected."""
+        with pytest.raises(ValueError):
+            parse_includes(Character, "magic_systems.bogus")
+        with pytest.raises(ValueError):
+            parse_includes(Book, "characters.magic_systems.users.books")
+
+    def test_include_types(self):
+        """Test the side-loaded entity types are reported for cache tags."""
+        assert include_types(Book, "series,characters.magic_systems") == ["characters", "magic_systems", "series"]
+        assert include_types(Book, "bogus") == []
+
+
+class TestIncludeResolver:
+    """Test cases for IncludeResolver."""
+
+    def test_resolve_caps_to_many(self, db_session, monkeypatch):
+        """Test side-loaded entities are serialized as list items and capped per parent."""
+        monkeypatch.setattr(settings, "INCLUDE_MAX_RELATED", 2)
+        roshar = World(id="roshar", name="Roshar")
+        db_session.add(roshar)
+        for name in ("Kaladin", "Shallan", "Dalinar"):
+            db_session.add(Character(id=name.lower(), name=name, world_of_origin_id="roshar",
+                                     biography="A long biography"))
+        db_session.flush()
+
+        resolved = IncludeResolver(db_session, World, parse_includes(World, "characters")).resolve([roshar])
+        assert resolved["relationships"] == {"characters": {"roshar": ["dalinar", "kaladin"]}}
+        characters = resolved["included"]["characters"]
+        assert [character["name"] for character in characters] == ["Dalinar", "Kaladin"]
+        assert "normalized_name" not in characters[0]
+        assert "biography" not in characters[0]
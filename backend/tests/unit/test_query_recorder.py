@@ -0,0 +1,42 @@
+"""
+Unit tests for query shape normalization and index candidates.
+"""
+from app.core.query_recorder import normalize_statement
+from scripts.advise_indexes import candidate_columns
+
+
+class TestQueryRecorder:
+    """Test cases for the query recorder and index advisor."""
+
+    def test_normalize_statement(self):
+        """Test literals, placeholders and IN-list lengths are removed."""
+        statement = """SELECT characters.id FROM characters
+            WHERE characters.world_of_origin_id = %(world_id)s AND characters.status = 'alive'
+            AND characters.id IN (?, ?, ?) LIMIT 20 OFFSET :offset"""
+        assert normalize_statement(statement) == (
+            "SELECT characters.id FROM characters WHERE characters.world_of_origin_id = ? "
+            "AND characters.status = ? AND characters.id IN (...) LIMIT ? OFFSET ?"
+        )
+        assert normalize_statement("SELECT * FROM books WHERE id = $1") == normalize_statement(
+            "SELECT * FROM books WHERE id = $2"
+        )
+
+    def test_normalize_keeps_casts(self):
+        """Test PostgreSQL casts are not mistaken for named placeholders."""
+        statement = "SELECT characters.aliases::text FROM characters WHERE characters.aliases @> :alias::jsonb"
+        assert normalize_statement(statement) == (
+            "SELECT characters.aliases::text FROM characters WHERE characters.aliases @> ?::jsonb"
+        )
+
+    def test_candidate_columns(self):
+        """Test equality and IN filters come first, then ORDER BY columns, per table."""
+        shape = normalize_statement(
+            "SELECT books.id FROM books JOIN series ON series.id = books.series_id "
+            "WHERE books.series_id = :series_id AND books.world_id IN (?, ?) AND series.name IS NOT NULL "
+            "ORDER BY books.chronological_order, books.title LIMIT 20"
+        )
+        assert candidate_columns(shape) == {
+            "books": ["series_id", "world_id", "chronological_order", "title"],
+            "series": ["name"],
+        }
+        assert candidate_columns("SELECT books.id FROM books") == {}
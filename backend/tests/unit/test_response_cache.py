@@ -0,0 +1,166 @@
+"""
+Unit tests for the declarative response cache.
+"""
+import httpx
+import pytest
+from fastapi import APIRouter, FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from app.api.cache import CachedRoute, cache_response
+from app.core.config import settings
+from app.core.database import get_db
+from app.main import app as main_app
+from app.models import Character, World
+from app.services.cache_service import cache_service
+from app.services.cache_warmer import CacheWarmer
+
+rendered = []
+
+router = APIRouter(route_class=CachedRoute)
+
+
+@router.get("")
+@cache_response(ttl=120, tags=["characters:*"], stale_ttl=30)
+async def list_characters():
+    return {"items": [{"id": "kaladin"}, {"id": "shallan"}], "total": 2}
+
+
+@router.get("/{character_id}")
+@cache_response(tags=["characters:{character_id}"])
+async def get_character(character_id: str):
+    rendered.append(character_id)
+    if character_id.startswith("missing"):
+        raise HTTPException(status_code=404, detail=f"No character '{character_id}' in the Cosmère")
+    return {"id": character_id, "name": character_id.title()}
+
+
+app = FastAPI()
+app.include_router(router, prefix=f"{settings.API_V1_STR}/characters")
+
+
+@pytest.fixture
+def cached_app(fake_redis, db_session):
+    """The test app, reading table states through the test database session."""
+    def override_get_db():
+        yield db_session
+
+    rendered.clear()
+    app.dependency_overrides[get_db] = override_get_db
+    yield app
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def cached_client(cached_app) -> TestClient:
+    return TestClient(cached_app)
+
+
+class TestResponseCache:
+    """Test cases for CachedRoute."""
+
+    def test_hit_after_miss(self, cached_client):
+        """Test the second request is served from the cache."""
+        first = cached_client.get("/api/v1/characters/kaladin")
+        second = cached_client.get("/api/v1/characters/kaladin")
+        assert first.headers["X-Cache"] == "MISS"
+        assert second.headers["X-Cache"] == "HIT"
+        assert second.json() == {"id": "kaladin", "name": "Kaladin"}
+        assert rendered == ["kaladin"]
+
+    def test_not_modified(self, cached_client):
+        """Test a matching ETag gets 304 without rendering and a stale one gets 200."""
+        etag = cached_client.get("/api/v1/characters/kaladin").headers["ETag"]
+        response = cached_client.get("/api/v1/characters/kaladin", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+        response = cached_client.get("/api/v1/characters/kaladin", headers={"If-None-Match": '"stale"'})
+        assert response.status_code == 200
+        assert rendered == ["kaladin"]
+
+    def test_wildcard_if_none_match(self, cached_client):
+        """Test If-None-Match: * only matches resources that exist."""
+        response = cached_client.get("/api/v1/characters/missing", headers={"If-None-Match": "*"})
+        assert response.status_code == 404
+        response = cached_client.get("/api/v1/characters/kaladin", headers={"If-None-Match": "*"})
+        assert response.status_code == 304
+
+    def test_if_modified_since(self, cached_client):
+        """Test If-Modified-Since only answers 304 for resources that exist."""
+        last_modified = cached_client.get("/api/v1/characters/kaladin").headers["Last-Modified"]
+        response = cached_client.get("/api/v1/characters/missing-x", headers={"If-Modified-Since": last_modified})
+        assert response.status_code == 404
+        response = cached_client.get("/api/v1/characters/kaladin", headers={"If-Modified-Since": last_modified})
+        assert response.status_code == 304
+
+    def test_table_state_changes_etag(self, cached_client, db_session, monkeypatch):
+        """Test writes seen only in the table state still change the ETag and the cached body."""
+        monkeypatch.setattr(settings, "CACHE_TABLE_CHECK_INTERVAL", 0)
+        etag = cached_client.get("/api/v1/characters/kaladin").headers["ETag"]
+        # Written straight to the table, bypassing the repositories' write versions
+        db_session.add_all([World(id="roshar", name="Roshar"),
+                            Character(id="kaladin", name="Kaladin", world_of_origin_id="roshar")])
+        db_session.flush()
+        response = cached_client.get("/api/v1/characters/kaladin", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+        assert response.headers["X-Cache"] == "MISS"
+
+    def test_negative_result(self, cached_client):
+        """Test a 404 is cached for CACHE_NEGATIVE_TTL with the body the route renders."""
+        first = cached_client.get("/api/v1/characters/missing")
+        second = cached_client.get("/api/v1/characters/missing")
+        assert first.status_code == second.status_code == 404
+        assert second.content == first.content
+        assert rendered == ["missing"]
+
+    def test_negative_body_matches_live(self, cached_client, monkeypatch):
+        """Test a cached 404 body is byte-identical to the one rendered without the cache."""
+        cached = cached_client.get("/api/v1/characters/missing-hoid")
+        monkeypatch.setattr(settings, "CACHE_ENABLED", False)
+        live = cached_client.get("/api/v1/characters/missing-hoid")
+        assert cached.status_code == live.status_code == 404
+        assert cached.content == live.content
+
+    def test_cdn_headers(self, cached_client):
+        """Test Cache-Control follows the route policy and Surrogate-Key names what the body holds."""
+        response = cached_client.get("/api/v1/characters/kaladin")
+        assert response.headers["Cache-Control"] == \
+            f"public, max-age={settings.HTTP_CACHE_MAX_AGE}, s-maxage={settings.CACHE_TTL}"
+        assert response.headers["Surrogate-Key"] == "kaladin"
+
+        for response in (cached_client.get("/api/v1/characters"), cached_client.get("/api/v1/characters")):
+            assert response.headers["Cache-Control"] == \
+                f"public, max-age={settings.HTTP_CACHE_MAX_AGE}, s-maxage=120, stale-while-revalidate=30"
+            assert response.headers["Surrogate-Key"] == "characters kaladin shallan"
+
+
+class TestCacheWarmer:
+    """Test cases for CacheWarmer."""
+
+    @pytest.mark.asyncio
+    async def test_warm_urls(self, cached_app):
+        """Test warming caches responses without counting as traffic and reports failures."""
+        warmer = CacheWarmer()
+        warmer.app = app
+        failed = await warmer._warm_urls(["/api/v1/characters/kaladin", "/api/v1/characters/missing"])
+        assert failed == ["/api/v1/characters/missing"]
+        assert not cache_service._hot_keys
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://localhost") as client:
+            response = await client.get("/api/v1/characters/kaladin")
+        assert response.headers["X-Cache"] == "HIT"
+        assert sorted(rendered) == ["kaladin", "missing"]
+
+    @pytest.mark.asyncio
+    async def test_warm_configured_paths(self, client, fake_redis):
+        """Test every configured path is answered by a real route and is cached by warming."""
+        warmer = CacheWarmer()
+        warmer.app = main_app
+        assert await warmer._warm_urls(settings.CACHE_WARM_PATHS) == []
+
+        transport = httpx.ASGITransport(app=main_app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://localhost") as http:
+            response = await http.get("/api/v1/shards/")
+        assert response.headers["X-Cache"] == "HIT"
+        assert response.json()["items"] == []
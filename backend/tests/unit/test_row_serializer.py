@@ -0,0 +1,36 @@
+"""
+Unit tests for compiled row serializers.
+"""
+from datetime import date, datetime
+
+from app.models import Book, Series
+from app.models.serializer import row_serializer
+from app.models.series import SeriesStatus
+
+
+class TestRowSerializer:
+    """Test cases for RowSerializer."""
+
+    def test_to_dict(self):
+        """Test dates become ISO strings, enums their values and JSON passes through."""
+        series = Series(id="stormlight", name="The Stormlight Archive", status=SeriesStatus.ONGOING,
+                        reading_order=["way-of-kings"], created_at=datetime(2024, 1, 2, 3, 4, 5))
+        data = series.to_dict()
+        assert data["status"] == "ongoing"
+        assert data["reading_order"] == ["way-of-kings"]
+        assert data["created_at"] == "2024-01-02T03:04:05"
+        assert data["description"] is None
+
+        book = Book(id="way-of-kings", title="The Way of Kings", publication_date=date(2010, 8, 31))
+        assert book.to_dict()["publication_date"] == "2010-08-31"
+
+    def test_flat_values(self):
+        """Test flat values render JSON as text and keep dates native when asked to."""
+        series = Series(id="mistborn", name="Mistborn", status="complete", reading_order=["final-empire"],
+                        created_at=datetime(2024, 1, 2))
+        serializer = row_serializer(Series, json_text=True, iso_dates=False)
+        values = dict(zip(serializer.names, serializer.values(series)))
+        assert values["reading_order"] == '["final-empire"]'
+        assert values["status"] == "complete"
+        assert values["created_at"] == datetime(2024, 1, 2)
+        assert row_serializer(Series, json_text=True, iso_dates=False) is serializer
@@ -0,0 +1,49 @@
+"""
+Unit tests for trusted response serializers.
+"""
+from datetime import datetime
+from types import SimpleNamespace
+
+import orjson
+
+from app.schemas.base import PaginatedResponse
+from app.schemas.world import WorldResponse
+from app.schemas.serializers import serializer_for, trusted_response
+
+
+WORLD = {
+    "id": "roshar",
+    "name": "Roshar",
+    "created_at": datetime(2024, 1, 1),
+    "updated_at": datetime(2024, 6, 1, 12, 30),
+}
+
+
+class TestTrustedSerializer:
+    """Test cases for TrustedSerializer."""
+
+    def test_matches_validated_output(self):
+        """Test trusted output equals what response_model validation would produce."""
+        page = {"items": [WORLD], "total": 1, "skip": 0, "limit": 20, "page": 1, "pages": 1}
+        schema = PaginatedResponse[WorldResponse]
+        body = trusted_response(schema, page).body
+        assert orjson.loads(body) == orjson.loads(schema.model_validate(page).model_dump_json())
+
+    def test_reads_objects(self):
+        """Test ORM-like objects serialize like dictionaries and extra attributes are dropped."""
+        serializer = serializer_for(WorldResponse)
+        row = SimpleNamespace(internal_notes="hidden", **WORLD)
+        assert serializer.serialize(row) == serializer.serialize(WORLD)
+        assert "internal_notes" not in serializer.serialize(row)
+
+    def test_serializer_is_cached(self):
+        """Test a schema's serializer is built once."""
+        assert serializer_for(WorldResponse) is serializer_for(WorldResponse)
+
+    def test_sparse_fieldset(self):
+        """Test a fieldset keeps only the selected fields, of the items for a page."""
+        assert serializer_for(WorldResponse).serialize(WORLD, ["id", "name"]) == {"id": "roshar", "name": "Roshar"}
+        page = {"items": [WORLD], "total": 1, "skip": 0, "limit": 20, "page": 1, "pages": 1}
+        body = orjson.loads(trusted_response(PaginatedResponse[WorldResponse], page, ["id"]).body)
+        assert body["items"] == [{"id": "roshar"}]
+        assert body["total"] == 1
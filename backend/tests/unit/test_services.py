@@ -3,6 +3,7 @@ Unit tests for service layer.
 """
 import pytest
 from sqlalchemy.orm import Session
+from app.models import Character, World
 from app.services import (
     WorldService, SeriesService, BookService, CharacterService,
     MagicSystemService, ShardService, SearchService
@@ -243,6 +244,34 @@ class TestCharacterService:
         human_characters = service.get_characters_by_species("Human")
         assert len(human_characters) == 1
         assert human_characters[0].id == character.id
+    
+    def test_get_character_overview_counts_every_row(self, db_session: Session):
+        """Test overview statistics are aggregated over the whole table, not a page of it."""
+        db_session.add(World(id="roshar", name="Roshar"))
+        for i in range(150):
+            db_session.add(Character(
+                id=f"character-{i}", name=f"Character {i}", world_of_origin_id="roshar",
+                species="Human" if i % 3 else None, status="alive"
+            ))
+        db_session.flush()
+        
+        overview = CharacterService(CharacterRepository(db_session)).get_character_overview()
+        assert overview["total_characters"] == 150
+        assert overview["characters_by_world"] == {"Roshar": 150}
+        assert overview["characters_by_species"] == {"Human": 100, "Unknown": 50}
+        assert overview["characters_by_status"] == {"alive": 150}
+    
+    @pytest.mark.asyncio
+    async def test_get_overview_cached_reads_request_database(self, db_session: Session, fake_redis):
+        """Test cached overview statistics are computed on the request session's database."""
+        db_session.add(World(id="roshar", name="Roshar"))
+        db_session.add(Character(id="kaladin", name="Kaladin", world_of_origin_id="roshar", status="alive"))
+        db_session.flush()
+        
+        service = CharacterService(CharacterRepository(db_session))
+        overview = await service.get_overview_cached(service.get_character_overview, limit=10)
+        assert overview["total_characters"] == 1
+        assert [character["id"] for character in overview["characters"]] == ["kaladin"]
 
 
 class TestMagicSystemService: